@@ -45,8 +45,9 @@ $(function () {
       // Number of entries on a page
       pageLength: Yarr.config.api_page_length,
 
-      // List of available pks
-      pkAvailable: Yarr.config.available_pks,
+      // Cursor for the pks after those on the page, and how many to get at once
+      pkNext: Yarr.config.initial_after,
+      pkWindow: Yarr.config.api_pk_window,
 
       // Title control
       titleTemplate: Yarr.config.title_template,
@@ -258,7 +259,7 @@ $(function () {
       } else if (this.displayMode == MODE_EXPANDED) {
         var thisLayout = this;
         this.entries.loadNext(function () {
-          if (thisLayout.entries.pkUnloaded.length) {
+          if (thisLayout.entries.hasMore()) {
             thisLayout.loadScreen();
           }
         })
@@ -452,24 +453,15 @@ $(function () {
 
     // Initialise Entry classes
     this.entries = [];
-    var pkAvailable = layout.options.pkAvailable,
-      foundPks = {},
-      entry,
-      i, l = $el.length
-      ;
-    for (i = 0; i < l; i++) {
-      entry = this.entryFromHtml($($el[i]));
-      foundPks[entry.pk] = true;
+    for (var i = 0, l = $el.length; i < l; i++) {
+      this.entryFromHtml($($el[i]));
     }
 
-    // Generate list of unloaded pks
-    l = pkAvailable.length;
+    // Pks after those on the page are fetched in windows as they are needed
     this.pkUnloaded = [];
-    for (i = 0; i < l; i++) {
-      if (!foundPks[pkAvailable[i]]) {
-        this.pkUnloaded.push(pkAvailable[i]);
-      }
-    }
+    this.pkNext = layout.options.pkNext || null;
+    this.pkWindow = layout.options.pkWindow;
+    this.pkWaiting = [];
 
     // Bind key events
     var thisEntries = this;
@@ -484,6 +476,17 @@ $(function () {
     // List of pks for this view not yet loaded
     pkUnloaded: null,
 
+    // Cursor for the next window of pks, or null if there are no more
+    pkNext: null,
+
+    // Number of pks to fetch in each window
+    pkWindow: null,
+
+    // Functions waiting for the window of pks being fetched
+    pkWaiting: null,
+    pkLoading: false,
+    pkLoadId: 0,
+
     // Keep track of async requests to allow blocking and superceding
     loading: false,
     loadId: 0,
@@ -518,6 +521,7 @@ $(function () {
       // This feed load takes priority over any previous load
       this.current = null;
       this.loading = true;
+      this.pkLoadId++;
       var thisEntries = this,
         loadId = ++this.loadId,
         feed_pks = feed ? [feed.pk] : []
@@ -526,11 +530,12 @@ $(function () {
         feed_pks,
         this.layout.state,
         this.layout.order,
-        function (pks, feed_unread) {
+        { limit: this.pkWindow },
+        function (pks, feed_unread, next) {
           if (loadId < thisEntries.loadId) {
             return;
           }
-          thisEntries.loadPks(pks);
+          thisEntries.loadPks(pks, next);
           thisEntries.layout.feedList.setUnreadBulk(feed_unread);
           thisEntries.loading = false;
         },
@@ -539,13 +544,17 @@ $(function () {
         }
       );
     },
-    loadPks: function (pks) {
-      /** Change the available pks to those specified
+    loadPks: function (pks, next) {
+      /** Change the available pks to those specified, with the cursor for
+          the next window of pks
           Discard the current entries and load enough entries from the
           new pks to fill a page
       */
       Yarr.status.set('Loading entries...');
       this.pkUnloaded = pks;
+      this.pkNext = next || null;
+      this.pkWaiting = [];
+      this.pkLoading = false;
 
       // Remove entries
       this.entries = [];
@@ -560,6 +569,64 @@ $(function () {
       this.layout.loadScreen();
     },
 
+    hasMore: function () {
+      /** Return true if there are more entries to load */
+      return this.pkUnloaded.length > 0 || this.pkNext !== null;
+    },
+
+    fetchPks: function (successFn, limit) {
+      /** Fetch the next window of pks for this view, and add them to the
+          unloaded pks
+          Calls successFn once they have been added, or straight away if
+          there are no more. Pass a limit of 0 to fetch all the rest.
+      */
+      if (this.pkNext === null) {
+        if (successFn) {
+          successFn();
+        }
+        return;
+      }
+      if (successFn) {
+        this.pkWaiting.push(successFn);
+      }
+      if (this.pkLoading) {
+        return;
+      }
+
+      var thisEntries = this,
+        pkLoadId = this.pkLoadId,
+        feed = this.layout.feedList.current
+        ;
+      this.pkLoading = true;
+      Yarr.API.getFeedsPks(
+        feed ? [feed.pk] : [],
+        this.layout.state,
+        this.layout.order,
+        {
+          after: this.pkNext,
+          limit: (limit === undefined) ? this.pkWindow : limit
+        },
+        function (pks, feed_unread, next) {
+          // Ignore windows for a view which has since been replaced
+          if (pkLoadId < thisEntries.pkLoadId) {
+            return;
+          }
+          thisEntries.pkLoading = false;
+          thisEntries.pkUnloaded = thisEntries.pkUnloaded.concat(pks);
+          thisEntries.pkNext = next || null;
+          var waiting = thisEntries.pkWaiting;
+          thisEntries.pkWaiting = [];
+          for (var i = 0, l = waiting.length; i < l; i++) {
+            waiting[i]();
+          }
+        },
+        function () {
+          thisEntries.pkLoading = false;
+          thisEntries.pkWaiting = [];
+        }
+      );
+    },
+
     focusScroll: function (top) {
       var newCurrent = -1;
 
@@ -608,6 +675,25 @@ $(function () {
         return;
       }
 
+      // Check if just sent successFn
+      if (typeof (loadNumber) == "function") {
+        successFn = loadNumber;
+        loadNumber = null;
+      }
+
+      // Default loadNumber to pageLength - may be higher in list mode
+      if (!loadNumber) {
+        loadNumber = this.pageLength;
+      }
+
+      // Fetch the next window of pks first if there aren't enough
+      if (this.pkUnloaded.length < loadNumber && this.pkNext !== null) {
+        this.fetchPks(function () {
+          thisEntries.loadNext(loadNumber, successFn);
+        });
+        return;
+      }
+
       // If nothing more to load, report and abort
       if (this.pkUnloaded.length === 0) {
         if (isMore) {
@@ -626,27 +712,20 @@ $(function () {
         return;
       }
 
-      // Check if just sent successFn
-      if (typeof (loadNumber) == "function") {
-        successFn = loadNumber;
-        loadNumber = null;
-      }
-
       var loadId = ++this.loadId;
       this.loading = true;
 
-
-      // Default loadNumber to pageLength - may be higher in list mode
-      if (!loadNumber) {
-        loadNumber = this.pageLength;
-      }
-
       // Decide which pks to get next
       var num = Math.min(this.pkUnloaded.length, loadNumber),
         pkRequest = this.pkUnloaded.slice(0, num)
         ;
       this.pkUnloaded = this.pkUnloaded.slice(num);
 
+      // Fetch the next window ahead of the scroll position
+      if (this.pkUnloaded.length < this.pkWindow / 2) {
+        this.fetchPks();
+      }
+
       // Would be weird to get here with nothing to request, but
       // handle it just in case
       if (pkRequest.length === 0) {
@@ -765,6 +844,13 @@ $(function () {
 
     markAllRead: function () {
       /** Mark all unread entries as read */
+      // Fetch the rest of the pks for this view first
+      if (this.pkNext !== null) {
+        var thisMarkAll = this;
+        this.fetchPks(function () { thisMarkAll.markAllRead(); }, 0);
+        return;
+      }
+
       // Get all PKs for this view - both loaded and unloaded
       var thisEntries = this,
         pks = [].concat(this.pkUnloaded),
@@ -801,8 +887,12 @@ $(function () {
       this.pk = $el.data('yarr-pk');
       this.feed = Yarr.Feed.get($el.data('yarr-feed'));
 
-      // Detect state
-      this.state = parseInt($el.data('yarr-state'), 10);
+      // Detect state; entries from the API are rendered without it, but
+      // have it set from the API data
+      var state = $el.data('yarr-state');
+      if (state !== undefined) {
+        this.state = parseInt(state, 10);
+      }
 
       // Enhance entry with javascript
       this.setup();
@@ -826,6 +916,7 @@ $(function () {
         .append(this._wrapCheckbox(this.$read, 'read', 'Read'))
         .append(this._wrapCheckbox(this.$saved, 'saved', 'Saved'))
         ;
+      this._showState();
 
       // When images load, update the position cache
       this.$el.find('img').bind('load', function () {
@@ -870,6 +961,15 @@ $(function () {
 
       // Update state and flags
       this.state = state;
+      this._showState();
+      if (api) {
+        api(this, function (data) {
+          thisEntry._markDone(data);
+        });
+      }
+    },
+    _showState: function () {
+      /** Show the current state on the checkboxes and entry classes */
       this.$read.prop('checked', this.isRead());
       this.$saved.prop('checked', this.isSaved());
       this.$el
@@ -878,11 +978,6 @@ $(function () {
           this.isRead() ? 'read' : (this.isSaved() ? 'saved' : '')
         )
         ;
-      if (api) {
-        api(this, function (data) {
-          thisEntry._markDone(data);
-        });
-      }
     },
     _markDone: function (data) {
       /** After API success */
@@ -74,6 +74,23 @@ Yarr.API = (function () {
     request.apply(this, requestQueue.shift());
   }
 
+  function decodeRanges(ranges) {
+    /** Expand [first, last] runs of pks from the API into a list of pks */
+    var pks = [], item, step, pk, i, l = ranges.length;
+    for (i = 0; i < l; i++) {
+      item = ranges[i];
+      if (Array.isArray(item)) {
+        step = (item[1] >= item[0]) ? 1 : -1;
+        for (pk = item[0]; pk != item[1] + step; pk += step) {
+          pks.push(pk);
+        }
+      } else {
+        pks.push(item);
+      }
+    }
+    return pks;
+  }
+
   // Hash for faster lookup
   var dates = { 'last_checked': 1, 'last_updated': 1, 'next_check': 1 };
   return {
@@ -105,19 +122,32 @@ Yarr.API = (function () {
       );
     },
 
-    getFeedPks: function (feed, state, order, successFn, failFn) {
-      Yarr.API.getFeedsPks([feed.pk], state, order, successFn, failFn);
+    getFeedPks: function (feed, state, order, window, successFn, failFn) {
+      Yarr.API.getFeedsPks([feed.pk], state, order, window, successFn, failFn);
     },
-    getFeedsPks: function (feed_pks, state, order, successFn, failFn) {
-      request(
-        'feed/pks', {
+    getFeedsPks: function (feed_pks, state, order, window, successFn, failFn) {
+      /** Get entry pks for feeds
+          Pass a window of { after: cursor, limit: number } to get up to
+          limit pks after the cursor, or null to get them all. The success
+          function is passed the cursor for the next window, or null.
+      */
+      var data = {
         'feed_pks': feed_pks.join(','),
         'state': state,
-        'order': order
-      },
+        'order': order,
+        'encoding': 'ranges'
+      };
+      if (window && window.after) {
+        data.after = window.after;
+      }
+      if (window && window.limit) {
+        data.limit = window.limit;
+      }
+      request(
+        'feed/pks', data,
         function (json) {
           if (successFn) {
-            successFn(json.pks, json.feed_unread);
+            successFn(decodeRanges(json.pks), json.feed_unread, json.next);
           }
         }, failFn
       );
@@ -136,12 +166,12 @@ Yarr.API = (function () {
       },
         function (json) {
           // Load data into Entry instances
-          var pk, entry, entries = [], key, data;
-          for (pk in json.entries) {
-            data = json.entries[pk];
-            entry = Yarr.Entry.get(pk);
-            entry.feed = Yarr.Feed.get(data.feed_pk);
-            delete data.feed_pk;
+          var i, l = json.entries.length, entry, entries = [], key, data;
+          for (i = 0; i < l; i++) {
+            data = json.entries[i];
+            entry = Yarr.Entry.get(data.pk);
+            entry.feed = Yarr.Feed.get(data.feed);
+            delete data.feed;
             for (key in data) {
               entry[key] = data[key];
             }
@@ -0,0 +1,324 @@
+"""
+Yarr benchmarks
+
+These are not part of the test suite, as the larger sizes take a while to set up.
+Run them from the repository root with::
+
+    python -m tests.benchmark recount [--entries 10000 100000 1000000]
+    python -m tests.benchmark pipeline [--feeds 100] [--processes 0 1 2 4]
+    python -m tests.benchmark fetch [--feeds 10] [--delay 0.2]
+
+The database is the in-memory SQLite database from the test settings.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+import django  # noqa: E402
+
+
+django.setup()
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.db import connection, transaction  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+import feedparser  # noqa: E402
+
+from tests.server import FeedServer  # noqa: E402
+from yarr import sanitize  # noqa: E402
+from yarr.constants import ENTRY_READ, ENTRY_UNREAD  # noqa: E402
+from yarr.fetch import AsyncFetcher  # noqa: E402
+from yarr.models import Entry, EntryContent, Feed  # noqa: E402
+
+
+# Number of entries to create for each feed
+ENTRIES_PER_FEED = 100
+
+
+def timed(fn, *args):
+    """
+    Call ``fn`` and return the time it took in seconds, and the length of the
+    longest SQL statement it ran
+    """
+    with CaptureQueriesContext(connection) as queries:
+        start = time.perf_counter()
+        fn(*args)
+        elapsed = time.perf_counter() - start
+    return elapsed, max(len(query["sql"]) for query in queries)
+
+
+###############################################################################
+#                                                               Recount
+
+
+def populate(count):
+    "Replace all feeds with ones holding ``count`` entries, half of them unread"
+    with connection.cursor() as cursor:
+        cursor.execute("DELETE FROM %s" % Entry._meta.db_table)
+        cursor.execute("DELETE FROM %s" % Feed._meta.db_table)
+
+    user, _ = User.objects.get_or_create(username="benchmark")
+    Feed.objects.bulk_create(
+        Feed(title="Feed %s" % i, user=user, feed_url="http://example.com/%s" % i)
+        for i in range(max(count // ENTRIES_PER_FEED, 1))
+    )
+    feed_pks = list(Feed.objects.values_list("pk", flat=True))
+
+    # Entries are inserted directly for speed, sharing one empty content
+    now = timezone.now()
+    body = EntryContent.objects.store([""])[""]
+    columns = ["feed_id", "state", "title", "body_id", "date"]
+    columns += ["author", "url", "comments_url", "guid", "fingerprint"]
+    sql = "INSERT INTO %s (%s) VALUES (%s)" % (
+        Entry._meta.db_table,
+        ", ".join(columns),
+        ", ".join(["%s"] * len(columns)),
+    )
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.executemany(
+            sql,
+            (
+                (
+                    feed_pks[i % len(feed_pks)],
+                    ENTRY_UNREAD if i % 2 else ENTRY_READ,
+                    "Entry %s" % i,
+                    body.pk,
+                    now,
+                    "",
+                    "",
+                    "",
+                    "guid-%s" % i,
+                    "",
+                )
+                for i in range(count)
+            ),
+        )
+    return len(feed_pks)
+
+
+def legacy_recount():
+    """
+    The recount used up to 0.7.0, which put every feed pk into one raw query
+    """
+    ids = ",".join(str(int(pk)) for pk in Feed.objects.values_list("pk", flat=True))
+    for field, where in (
+        ("count_unread", " AND state=%s" % ENTRY_UNREAD),
+        ("count_total", ""),
+    ):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """UPDATE %(feed)s
+                    SET %(field)s=COALESCE(
+                        (
+                            SELECT COUNT(1)
+                                FROM %(entry)s
+                                WHERE %(feed)s.id=feed_id%(where)s
+                                GROUP BY feed_id
+                        ), 0
+                    )
+                    WHERE id IN (%(ids)s)
+                """
+                % {
+                    "feed": Feed._meta.db_table,
+                    "entry": Entry._meta.db_table,
+                    "field": field,
+                    "where": where,
+                    "ids": ids,
+                }
+            )
+
+
+def check_counts(count):
+    "Confirm the recount was correct"
+    unread, total = zip(*Feed.objects.values_list("count_unread", "count_total"))
+    assert sum(total) == count, "Incorrect total count"
+    assert sum(unread) == count // 2, "Incorrect unread count"
+
+
+def benchmark_recount(sizes):
+    print("Time taken, and longest SQL statement in bytes")
+    print("%10s %8s %20s %20s" % ("entries", "feeds", "legacy", "chunked"))
+    for count in sizes:
+        feeds = populate(count)
+        legacy = timed(legacy_recount)
+        check_counts(count)
+
+        Feed.objects.update(count_unread=0, count_total=0)
+        chunked = timed(Feed.objects.update_counts)
+        check_counts(count)
+        print(
+            "%10d %8d %11.3fs %7dB %11.3fs %7dB" % ((count, feeds) + legacy + chunked)
+        )
+
+
+###############################################################################
+#                                                               Pipeline
+
+
+# Markup for each paragraph of a generated entry, with plenty for bleach to clean
+PARAGRAPH = (
+    '<p class="lead" style="color: red" onclick="go()">Paragraph %(para)s of entry '
+    "%(entry)s in feed %(feed)s, with <b>bold</b>, <em>emphasis</em>, "
+    '<a href="http://example.com/%(feed)s/%(entry)s" target="_blank">a link</a>, '
+    '<img src="http://example.com/%(entry)s.png" width="10" height="10"> an image '
+    "and <script>alert(%(para)s)</script> a script &amp; entities.</p>"
+)
+
+# Number of paragraphs in each generated entry
+PARAGRAPHS_PER_ENTRY = 20
+
+
+def make_corpus(path, count, entries):
+    """
+    Write ``count`` RSS documents with ``entries`` entries each into ``path``,
+    and replace all feeds with ones subscribed to them
+
+    Every entry has different content, so the sanitiser can't reuse its work.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("DELETE FROM %s" % Entry._meta.db_table)
+        cursor.execute("DELETE FROM %s" % Feed._meta.db_table)
+
+    urls = []
+    for feed in range(count):
+        items = []
+        for entry in range(entries):
+            content = "".join(
+                PARAGRAPH % {"feed": feed, "entry": entry, "para": para}
+                for para in range(PARAGRAPHS_PER_ENTRY)
+            )
+            items.append(
+                "<item><title>Entry %s &amp; more</title>"
+                "<link>http://example.com/%s/%s</link>"
+                "<pubDate>Tue, 02 Jul 2013 02:02:02 GMT</pubDate>"
+                "<description><![CDATA[%s]]></description></item>"
+                % (entry, feed, entry, content)
+            )
+        url = os.path.join(path, "feed%s.xml" % feed)
+        with open(url, "w") as file:
+            file.write(
+                '<?xml version="1.0"?><rss version="2.0"><channel>'
+                "<title>Feed %s</title><link>http://example.com/%s</link>"
+                "%s</channel></rss>" % (feed, feed, "".join(items))
+            )
+        urls.append(url)
+
+    user, _ = User.objects.get_or_create(username="benchmark")
+    Feed.objects.bulk_create(
+        Feed(title="Feed", user=user, feed_url=url) for url in urls
+    )
+
+
+def check_corpus(workers, processes):
+    "Check every feed from scratch, and return the time taken in seconds"
+    with connection.cursor() as cursor:
+        cursor.execute("DELETE FROM %s" % Entry._meta.db_table)
+    Feed.objects.update(count_unread=0, count_total=0, body_hash="")
+    sanitize.clear_cache()
+
+    start = time.perf_counter()
+    Feed.objects.check_feed(force=True, workers=workers, processes=processes)
+    return time.perf_counter() - start
+
+
+def benchmark_pipeline(count, entries, workers, processes):
+    print(
+        "Checking %s feeds of %s entries, fetched by %s threads"
+        % (count, entries, workers)
+    )
+    print("%10s %10s %10s" % ("processes", "time", "speedup"))
+    with tempfile.TemporaryDirectory() as path:
+        make_corpus(path, count, entries)
+        baseline = None
+        for size in processes:
+            elapsed = check_corpus(workers, size)
+            assert Entry.objects.count() == count * entries, "Entries missing"
+            baseline = baseline or elapsed
+            print("%10d %9.3fs %9.2fx" % (size, elapsed, baseline / elapsed))
+
+
+###############################################################################
+#                                                               Fetch
+
+
+def benchmark_fetch(count, delay):
+    print("Fetching %s feeds from a server which waits %ss" % (count, delay))
+    with FeedServer(delay=delay) as server:
+        urls = [server.url("feed1-wellformed.xml?%s" % i) for i in range(count)]
+
+        start = time.perf_counter()
+        for url in urls:
+            feedparser.parse(url)
+        serial = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for response in AsyncFetcher(per_host=count).fetch(urls):
+            response.parse()
+        concurrent = time.perf_counter() - start
+
+    print("%10s %10s %10s" % ("engine", "time", "feeds/s"))
+    print("%10s %9.3fs %10.2f" % ("serial", serial, count / serial))
+    print("%10s %9.3fs %10.2f" % ("async", concurrent, count / concurrent))
+
+
+###############################################################################
+#                                                               Main
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+    recount = subparsers.add_parser("recount", help="Recount feed unread and totals")
+    recount.add_argument(
+        "--entries",
+        nargs="+",
+        type=int,
+        default=[10000, 100000, 1000000],
+        help="Numbers of entries to recount",
+    )
+    pipeline = subparsers.add_parser(
+        "pipeline", help="Parse and sanitise feeds in worker processes"
+    )
+    pipeline.add_argument(
+        "--feeds", type=int, default=100, help="Number of feeds to generate"
+    )
+    pipeline.add_argument(
+        "--entries", type=int, default=20, help="Number of entries in each feed"
+    )
+    pipeline.add_argument(
+        "--workers", type=int, default=4, help="Number of threads fetching feeds"
+    )
+    pipeline.add_argument(
+        "--processes",
+        nargs="+",
+        type=int,
+        default=sorted({0, 1, 2, 4, os.cpu_count() or 1}),
+        help="Numbers of worker processes to compare; 0 parses in the main process",
+    )
+    fetch = subparsers.add_parser(
+        "fetch", help="Fetch slow feeds serially and with the asyncio engine"
+    )
+    fetch.add_argument("--feeds", type=int, default=10, help="Number of feeds to fetch")
+    fetch.add_argument(
+        "--delay", type=float, default=0.2, help="Seconds the server waits"
+    )
+    args = parser.parse_args()
+
+    call_command("migrate", verbosity=0)
+    if args.benchmark == "recount":
+        benchmark_recount(args.entries)
+    elif args.benchmark == "pipeline":
+        benchmark_pipeline(args.feeds, args.entries, args.workers, args.processes)
+    elif args.benchmark == "fetch":
+        benchmark_fetch(args.feeds, args.delay)
+
+
+if __name__ == "__main__":
+    main()
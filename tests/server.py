@@ -0,0 +1,118 @@
+"""
+Local HTTP stand-in for feed servers
+"""
+import hashlib
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+FIXTURE_PATH = os.path.dirname(__file__)
+
+
+class HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    # Avoid connection retries when many requests arrive at once
+    request_queue_size = 128
+
+
+class FeedServer(object):
+    """
+    Serve the XML fixtures in the tests directory over HTTP
+
+    Use as a context manager::
+
+        with FeedServer(delay=0.1) as server:
+            url = server.url("feed1-wellformed.xml")
+
+    Arguments:
+        delay       Seconds to wait before responding to each request
+        stall       Seconds to wait after sending the first byte of each body
+
+    Attributes:
+        responses   Dict of path to ``(status, headers, body)`` to serve instead
+                    of a fixture
+        requests    List of ``(path, headers)`` for requests received
+        max_active  Highest number of requests handled at the same time
+    """
+
+    def __init__(self, delay=0, stall=0):
+        self.delay = delay
+        self.stall = stall
+        self.responses = {}
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = HTTPServer(("127.0.0.1", 0), Handler)
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def url(self, path, host="127.0.0.1"):
+        return "http://%s:%s/%s" % (host, self.httpd.server_port, path)
+
+    def fixture(self, request, path):
+        """
+        Return a fixture response, honouring a matching If-None-Match
+        """
+        try:
+            with open(os.path.join(FIXTURE_PATH, path), "rb") as file:
+                body = file.read()
+        except (FileNotFoundError, IsADirectoryError):
+            return 404, {}, b"Not found"
+
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        headers = {"Content-Type": "application/rss+xml", "ETag": etag}
+        if request.headers.get("If-None-Match") == etag:
+            return 304, headers, b""
+        return 200, headers, body
+
+    def handle(self, request):
+        path = request.path.lstrip("/").split("?")[0]
+        with self.lock:
+            self.requests.append((path, dict(request.headers)))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+
+            if path in self.responses:
+                status, headers, body = self.responses[path]
+            else:
+                status, headers, body = self.fixture(request, path)
+
+            request.send_response(status)
+            for name, value in headers.items():
+                request.send_header(name, value)
+            request.send_header("Content-Length", str(len(body)))
+            request.end_headers()
+            if self.stall and body:
+                request.wfile.write(body[:1])
+                request.wfile.flush()
+                time.sleep(self.stall)
+                body = body[1:]
+            request.wfile.write(body)
+        finally:
+            with self.lock:
+                self.active -= 1
@@ -73,7 +73,13 @@ TEMPLATES = [
 # Database
 # https://docs.djangoproject.com/en/2.2/ref/settings/#databases
 
-DATABASES = {"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}}
+# YARR_TEST_DATABASE lets tests run commands in other processes against one database
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.environ.get("YARR_TEST_DATABASE", ":memory:"),
+    }
+}
 
 
 # Password validation
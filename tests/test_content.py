@@ -0,0 +1,132 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from yarr.managers import ORPHAN_MIN_AGE, content_digest
+from yarr.models import Entry, EntryContent, Feed
+
+
+class EntryContentTest(TestCase):
+    def setUp(self):
+        self.feeds = [
+            Feed.objects.create(
+                title="Feed",
+                user=User.objects.create_user(name, "%s@example.com" % name, "test"),
+                feed_url="http://example.com/feed.xml",
+            )
+            for name in ("one", "two")
+        ]
+
+    def test_shared(self):
+        """
+        Entries with the same content share one stored content
+        """
+        for feed in self.feeds:
+            feed.entries.create(title="Entry", content="<p>Same</p>")
+
+        self.assertEqual(EntryContent.objects.count(), 1)
+        for entry in Entry.objects.all():
+            self.assertEqual(entry.content, "<p>Same</p>")
+
+    def test_update(self):
+        """
+        Changing the content of an entry stores the new content, and leaves the
+        old content to be removed
+        """
+        entry = self.feeds[0].entries.create(title="Entry", content="Old")
+        entry.update(Entry(title="Entry", content="New"))
+
+        entry = Entry.objects.get(pk=entry.pk)
+        self.assertEqual(entry.content, "New")
+        self.assertEqual(
+            list(EntryContent.objects.orphaned().values_list("content", flat=True)),
+            ["Old"],
+        )
+
+    def test_recently_stored(self):
+        """
+        Contents which have just been stored are not deleted, even if no entry
+        uses them yet
+        """
+        old = timezone.now() - ORPHAN_MIN_AGE * 2
+        EntryContent.objects.create(digest=content_digest("Old"), content="Old")
+        EntryContent.objects.update(stored=old)
+
+        # Reusing an old orphan marks it as stored again
+        stored = EntryContent.objects.store(["Old", "New"])
+        self.assertEqual(EntryContent.objects.delete_orphaned(), 0)
+
+        self.feeds[0].entries.create(title="Entry", body=stored["Old"])
+        self.feeds[0].entries.create(title="Entry", body=stored["New"])
+        self.assertEqual(Entry.objects.count(), 2)
+
+        Entry.objects.all().delete()
+        EntryContent.objects.update(stored=old)
+        self.assertEqual(EntryContent.objects.delete_orphaned(), 2)
+
+    def test_clean(self):
+        """
+        yarr_clean deletes contents which are no longer used, and yarr_size reports
+        how much sharing saves
+        """
+        for feed in self.feeds:
+            feed.entries.create(title="Entry", content="Shared")
+        self.feeds[0].entries.create(title="Other", content="Unused")
+        Entry.objects.filter(title="Other").delete()
+        EntryContent.objects.update(stored=timezone.now() - ORPHAN_MIN_AGE * 2)
+
+        stdout = StringIO()
+        call_command("yarr_size", stdout=stdout)
+        self.assertIn("Sharing content saves 6 characters (50.0%)", stdout.getvalue())
+        self.assertIn("yarr_clean --delete_content", stdout.getvalue())
+
+        call_command("yarr_clean", delete_content=True, stdout=StringIO())
+        self.assertEqual(
+            list(EntryContent.objects.values_list("content", flat=True)), ["Shared"]
+        )
+
+
+class EntryContentMigrationTest(TransactionTestCase):
+    before = [("yarr", "0008_feed_failures")]
+    after = [("yarr", "0010_entry_content_required")]
+
+    def migrate(self, targets):
+        "Migrate to the targets and return the historical app registry"
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def test_migrate(self):
+        """
+        Existing content is moved into shared contents, and back again
+        """
+        apps = self.migrate(self.before)
+        user = apps.get_model("auth", "User").objects.create(username="test")
+        feed = apps.get_model("yarr", "Feed").objects.create(
+            title="Feed", user=user, feed_url="http://example.com/"
+        )
+        for content in ("A", "B", "A"):
+            feed.entries.create(title="Entry", content=content, date=timezone.now())
+
+        apps = self.migrate(self.after)
+        entries = apps.get_model("yarr", "Entry").objects.order_by("pk")
+        self.assertEqual(
+            [entry.body.content for entry in entries.select_related("body")],
+            ["A", "B", "A"],
+        )
+        self.assertEqual(apps.get_model("yarr", "EntryContent").objects.count(), 2)
+
+        apps = self.migrate(self.before)
+        entries = apps.get_model("yarr", "Entry").objects.order_by("pk")
+        self.assertEqual(
+            list(entries.values_list("content", flat=True)), ["A", "B", "A"]
+        )
@@ -0,0 +1,338 @@
+import gzip
+import os
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from unittest import mock
+from urllib.error import URLError
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from yarr.fetch import AsyncFetcher, FeedTooLarge, Response, Timeout, fetch
+from yarr.models import Feed
+
+from .server import FIXTURE_PATH, FeedServer
+from .test_yarr import make_rss
+
+
+class AsyncFetcherTest(TestCase):
+    def test_fetch(self):
+        """
+        A fixture is fetched over HTTP and parses with feedparser
+        """
+        with FeedServer() as server:
+            url = server.url("feed1-wellformed.xml")
+            (response,) = AsyncFetcher().fetch([url])
+
+        self.assertEqual(response.status, 200)
+        self.assertIsNone(response.error)
+        d = response.parse()
+        self.assertEqual(d["href"], url)
+        self.assertEqual(d["feed"]["title"], "Well-formed")
+        self.assertEqual(len(d["entries"]), 2)
+
+    def test_fetch_errors(self):
+        """
+        HTTP errors are reported by status, network errors on the response
+        """
+        with FeedServer() as server:
+            url = server.url("missing.xml")
+            (missing,) = AsyncFetcher().fetch([url])
+        self.assertEqual(missing.status, 404)
+
+        # Server has now stopped
+        (refused,) = AsyncFetcher().fetch([url])
+        self.assertIsInstance(refused.error, URLError)
+
+    def test_permanent_redirect(self):
+        """
+        A permanent redirect is followed, and reported as a 301 to the new URL
+        """
+        with FeedServer() as server:
+            url = server.url("feed1-wellformed.xml")
+            server.responses["moved.xml"] = (301, {"Location": url}, b"")
+            (response,) = AsyncFetcher().fetch([server.url("moved.xml")])
+
+        self.assertEqual(response.status, 301)
+        self.assertEqual(response.url, url)
+
+    def test_per_host_limit(self):
+        """
+        No more than ``per_host`` requests are made to one host at once
+        """
+        with FeedServer(delay=0.1) as server:
+            urls = [server.url("feed1-wellformed.xml?%s" % i) for i in range(6)]
+            responses = AsyncFetcher(per_host=2).fetch(urls)
+
+        self.assertEqual([r.status for r in responses], [200] * 6)
+        self.assertEqual(server.max_active, 2)
+
+    def test_many(self):
+        """
+        Every feed is fetched and updated when many are checked at once
+        """
+        count = 10
+        user = User.objects.create_user("test", "test@example.com", "test")
+        with FeedServer(delay=0.1) as server:
+            feeds = [
+                Feed.objects.create(
+                    title="Feed",
+                    user=user,
+                    feed_url=server.url("feed1-wellformed.xml?%s" % i),
+                )
+                for i in range(count)
+            ]
+            Feed.objects.check_feed(workers=count, engine="async")
+
+        self.assertEqual(len(server.requests), count)
+        for feed in feeds:
+            feed.refresh_from_db()
+            self.assertEqual(feed.title, "Well-formed")
+            self.assertEqual(feed.entries.count(), 2)
+
+
+class TimeoutTest(TestCase):
+    def assertTimedOut(self, response, elapsed):
+        self.assertIsInstance(response.error, URLError)
+        self.assertIn("timed out", str(response.error))
+        self.assertLess(elapsed, 0.9)
+        # The global socket timeout is never changed
+        self.assertIsNone(socket.getdefaulttimeout())
+
+    def fetch_slow(self, fetch_one, **kwargs):
+        "Fetch from a slow server and return the response and time taken"
+        with FeedServer(**(kwargs or {"delay": 1})) as server:
+            start = time.monotonic()
+            response = fetch_one(server.url("feed1-wellformed.xml"))
+            return response, time.monotonic() - start
+
+    def test_read_timeout(self):
+        """
+        A server which is too slow to respond times out
+        """
+        timeout = Timeout(read=0.2)
+        self.assertTimedOut(*self.fetch_slow(lambda url: fetch(url, timeout=timeout)))
+
+    def test_total_timeout(self):
+        """
+        A request can't take longer than its total timeout
+        """
+        timeout = Timeout(read=5, total=0.2)
+        self.assertTimedOut(*self.fetch_slow(lambda url: fetch(url, timeout=timeout)))
+
+    def test_stalled_body(self):
+        """
+        A server which stalls part way through the body can't keep a request open
+        past its total timeout
+        """
+        timeout = Timeout(read=5, total=0.6)
+        self.assertTimedOut(
+            *self.fetch_slow(
+                lambda url: fetch(url, timeout=timeout), delay=0.4, stall=1
+            )
+        )
+
+    @override_settings(YARR_SOCKET_TIMEOUT=None)
+    def test_no_read_timeout(self):
+        """
+        Without a read timeout, reads are only limited by the total timeout
+        """
+        with FeedServer() as server:
+            self.assertEqual(fetch(server.url("feed1-wellformed.xml")).status, 200)
+
+        timeout = Timeout(total=0.3)
+        self.assertIsNone(timeout.read)
+        self.assertTimedOut(
+            *self.fetch_slow(lambda url: fetch(url, timeout=timeout), stall=1)
+        )
+
+    def test_async_timeouts(self):
+        """
+        The asyncio engine times out slow servers too
+        """
+        for timeout in (Timeout(read=0.2), Timeout(read=5, total=0.2)):
+            fetcher = AsyncFetcher(timeout=timeout)
+            self.assertTimedOut(*self.fetch_slow(lambda url: fetcher.fetch([url])[0]))
+
+    def test_concurrent(self):
+        """
+        Requests in threads with different timeouts don't affect each other
+        """
+        with FeedServer(delay=0.5) as server:
+            url = server.url("feed1-wellformed.xml")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                slow = executor.submit(fetch, url, timeout=Timeout(read=5))
+                fast = executor.submit(fetch, url, timeout=Timeout(read=0.1))
+                self.assertIsNotNone(fast.result().error)
+                self.assertEqual(slow.result().status, 200)
+
+
+class MaximumSizeTest(TestCase):
+    def fetch_both(self, path, **kwargs):
+        """
+        Fetch a path with both engines, with a maximum size of 1000 bytes
+        """
+        with FeedServer() as server:
+            server.responses.update(kwargs.get("responses", {}))
+            url = server.url(path)
+            return [
+                fetch(url, max_size=1000),
+                AsyncFetcher(max_size=1000).fetch([url])[0],
+            ]
+
+    def test_content_length(self):
+        """
+        A feed which is too large is abandoned before it is read
+        """
+        body = b"<rss>" + b" " * 2000 + b"</rss>"
+        for response in self.fetch_both(
+            "large.xml", responses={"large.xml": (200, {}, body)}
+        ):
+            self.assertIsInstance(response.error, FeedTooLarge)
+
+    def test_decompressed(self):
+        """
+        A compressed feed which decompresses to more than the maximum is abandoned
+        """
+        body = gzip.compress(b" " * 100000)
+        self.assertLess(len(body), 1000)
+        for response in self.fetch_both(
+            "bomb.xml",
+            responses={"bomb.xml": (200, {"Content-Encoding": "gzip"}, body)},
+        ):
+            self.assertIsInstance(response.error, FeedTooLarge)
+
+    def test_within_limit(self):
+        """
+        Feeds within the maximum size are fetched as normal
+        """
+        body = gzip.compress(b"<rss></rss>") + gzip.compress(b"<!-- -->")
+        for response in self.fetch_both(
+            "small.xml",
+            responses={"small.xml": (200, {"Content-Encoding": "gzip"}, body)},
+        ):
+            self.assertIsNone(response.error)
+            self.assertEqual(response.body, b"<rss></rss><!-- -->")
+
+    @override_settings(YARR_MAXIMUM_FEED_SIZE=100)
+    def test_feed_error(self):
+        """
+        A feed which is too large is reported on the feed
+        """
+        user = User.objects.create_user("test", "test@example.com", "test")
+        with FeedServer() as server:
+            feed = Feed.objects.create(
+                title="Feed", user=user, feed_url=server.url("feed1-wellformed.xml")
+            )
+            feed.check_feed()
+        self.assertEqual(
+            feed.error,
+            "Feed error: FeedTooLarge - Feed is larger than the maximum of 100 bytes",
+        )
+        self.assertEqual(feed.entries.count(), 0)
+
+    @override_settings(YARR_MAXIMUM_ENTRIES=2)
+    def test_maximum_entries(self):
+        """
+        Only the first entries of a feed are processed
+        """
+        user = User.objects.create_user("test", "test@example.com", "test")
+        body = make_rss([("a", "A", 3), ("b", "B", 2), ("c", "C", 1)]).encode()
+        with FeedServer() as server:
+            server.responses["feed.xml"] = (200, {}, body)
+            feed = Feed.objects.create(
+                title="Feed", user=user, feed_url=server.url("feed.xml")
+            )
+            logfile = StringIO()
+            feed.check_feed(logfile=logfile)
+
+        self.assertIn("Processing the first 2 of 3 entries", logfile.getvalue())
+        self.assertEqual(
+            list(feed.entries.order_by("title").values_list("title", flat=True)),
+            ["A", "B"],
+        )
+
+
+class AsyncCheckTest(TestCase):
+    def test_check_feed_async(self):
+        """
+        Feeds checked with the asyncio engine are updated from the server
+        """
+        user = User.objects.create_user("test", "test@example.com", "test")
+        with FeedServer() as server:
+            feeds = [
+                Feed.objects.create(
+                    title="Feed: %s" % name, user=user, feed_url=server.url(name)
+                )
+                for name in ["feed1-wellformed.xml", "feed4-with-img.xml"]
+            ]
+            Feed.objects.all().check_feed(engine="async", workers=10)
+
+        for feed in feeds:
+            feed.refresh_from_db()
+            self.assertEqual(feed.error, "")
+        self.assertEqual(feeds[0].site_url, "http://example.com/wellformed")
+        self.assertEqual(feeds[0].entries.count(), 2)
+        self.assertEqual(feeds[1].entries.count(), 1)
+
+
+class UnchangedFeedTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("test", "test@example.com", "test")
+
+    def check_twice(self, path="feed1-wellformed.xml", responses=None, **kwargs):
+        """
+        Check a feed twice from the server, and return the feed, the server and
+        the log of the second check
+        """
+        with FeedServer() as server:
+            server.responses.update(responses or {})
+            feed = Feed.objects.create(
+                title="Feed", user=self.user, feed_url=server.url(path)
+            )
+            Feed.objects.all().check_feed(**kwargs)
+            feed.refresh_from_db()
+            self.assertTrue(feed.body_hash)
+
+            # Make it due again
+            Feed.objects.update(next_check=None)
+            logfile = StringIO()
+            with mock.patch.object(Response, "parse") as parse:
+                Feed.objects.all().check_feed(logfile=logfile, **kwargs)
+            feed.refresh_from_db()
+        self.assertFalse(parse.called)
+        return feed, server, logfile.getvalue()
+
+    def test_not_modified(self):
+        """
+        The ETag is sent back, and a 304 skips parsing and entry updates
+        """
+        feed, server, log = self.check_twice()
+        self.assertIn("Feed unchanged (not modified)", log)
+        self.assertEqual(server.requests[1][1]["If-None-Match"], feed.etag)
+        self.assertEqual(feed.entries.count(), 2)
+        self.assertEqual(feed.error, "")
+
+    def test_not_modified_async(self):
+        """
+        The asyncio engine also makes conditional requests
+        """
+        feed, server, log = self.check_twice(engine="async")
+        self.assertIn("Feed unchanged (not modified)", log)
+        self.assertEqual(server.requests[1][1]["If-None-Match"], feed.etag)
+
+    def test_unchanged_hash(self):
+        """
+        A server which ignores conditional requests but sends the same document
+        is detected by its digest, and the document is not parsed again
+        """
+        with open(os.path.join(FIXTURE_PATH, "feed1-wellformed.xml"), "rb") as file:
+            body = file.read()
+        feed, server, log = self.check_twice(
+            path="no-etag.xml",
+            responses={"no-etag.xml": (200, {"Content-Type": "text/xml"}, body)},
+        )
+        self.assertIn("Feed unchanged (hash)", log)
+        self.assertEqual(feed.entries.count(), 2)
@@ -0,0 +1,119 @@
+import tempfile
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from yarr import fragments
+from yarr.constants import ENTRY_READ
+from yarr.models import Entry, Feed
+
+
+class FragmentCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("test", "test@example.com", "test")
+        self.client.force_login(self.user)
+        self.feed = Feed.objects.create(
+            title="Feed", user=self.user, feed_url="http://example.com/feed.xml"
+        )
+        self.entries = [
+            self.feed.entries.create(title="Entry %s" % i, content="Content %s" % i)
+            for i in range(3)
+        ]
+
+    def get_entries(self, entries):
+        return self.client.get(
+            reverse("yarr:api_entry_get"),
+            {"entry_pks": ",".join(str(entry.pk) for entry in entries)},
+        ).json()["entries"]
+
+    def test_hit(self):
+        """
+        Rendered entries are cached, and content is only loaded for misses
+        """
+        first = self.get_entries(self.entries[:2])
+        self.assertEqual(fragments.stats(), {"hits": 0, "misses": 2, "rate": 0.0})
+
+        # Session, user, and entries with their feed; no content
+        with self.assertNumQueries(3):
+            again = self.get_entries(self.entries[:2])
+        self.assertEqual(again, first)
+        self.assertIn("Content 1", again[0]["html"])
+
+        self.get_entries(self.entries)
+        self.assertEqual(fragments.stats(), {"hits": 4, "misses": 3, "rate": 4 / 7})
+
+        stdout = StringIO()
+        call_command("yarr_cache_stats", reset=True, stdout=stdout, stderr=StringIO())
+        self.assertIn("Hit rate: 57.1%", stdout.getvalue())
+        self.assertEqual(fragments.stats()["rate"], None)
+
+    def test_stats_shared(self):
+        """
+        The stats command warns when the cache isn't shared between processes
+        """
+        stderr = StringIO()
+        call_command("yarr_cache_stats", stdout=StringIO(), stderr=stderr)
+        self.assertIn("LocMemCache, which is not shared", stderr.getvalue())
+
+        with tempfile.TemporaryDirectory() as path, override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": path,
+                }
+            }
+        ):
+            self.get_entries(self.entries)
+            stdout = StringIO()
+            stderr = StringIO()
+            call_command("yarr_cache_stats", stdout=stdout, stderr=stderr)
+
+        self.assertIn("Misses:   3", stdout.getvalue())
+        self.assertEqual(stderr.getvalue(), "")
+
+    def test_state(self):
+        """
+        The state is sent beside the cached HTML, not in it
+        """
+        entry = self.entries[0]
+        html = self.get_entries([entry])[0]["html"]
+        Entry.objects.filter(pk=entry.pk).update(state=ENTRY_READ)
+
+        data = self.get_entries([entry])[0]
+        self.assertEqual(data["state"], ENTRY_READ)
+        self.assertEqual(data["html"], html)
+        self.assertNotIn("data-yarr-state", html)
+        self.assertNotIn("Mark as read", html)
+
+    def test_update(self):
+        """
+        Updating an entry or renaming its feed renders it again
+        """
+        entry = self.entries[0]
+        key = fragments.fragment_key(entry)
+        self.get_entries([entry])
+        self.assertIn(key, cache)
+
+        entry.update(Entry(title="Changed", content="New content"))
+        self.assertNotIn(key, cache)
+        self.assertIn("New content", self.get_entries([entry])[0]["html"])
+
+        self.feed.title = "Renamed"
+        self.feed.save()
+        self.assertIn("Renamed", self.get_entries([entry])[0]["html"])
+        self.assertEqual(fragments.stats()["hits"], 0)
+
+    @override_settings(YARR_ENTRY_CACHE=None)
+    def test_disabled(self):
+        """
+        Entries are rendered for every request when the cache is disabled
+        """
+        self.get_entries(self.entries)
+        with self.assertNumQueries(4):
+            self.get_entries(self.entries)
+        self.assertEqual(fragments.stats()["misses"], 0)
@@ -0,0 +1,202 @@
+import datetime
+import os
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+import feedparser
+import six
+
+from yarr import freshness
+from yarr.models import Feed
+
+from .server import FeedServer
+
+
+FIXTURE_PATH = os.path.dirname(__file__)
+
+# A Wednesday
+NOW = datetime.datetime(2013, 7, 3, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURE_PATH, name), "rb") as file:
+        return file.read()
+
+
+class FreshnessTest(TestCase):
+    def test_cache_control(self):
+        """
+        Cache-Control max-age is honoured, less the response's age
+        """
+        self.assertEqual(
+            freshness.fresh_until({"cache-control": "public, max-age=600"}, NOW),
+            NOW + datetime.timedelta(seconds=600),
+        )
+        self.assertEqual(
+            freshness.fresh_until({"cache-control": "max-age=600", "age": "100"}, NOW),
+            NOW + datetime.timedelta(seconds=500),
+        )
+        self.assertIsNone(
+            freshness.fresh_until({"cache-control": "no-cache, max-age=600"}, NOW)
+        )
+
+    def test_expires(self):
+        """
+        Expires is measured from the server's Date
+        """
+        headers = {
+            "date": "Wed, 03 Jul 2013 10:00:00 GMT",
+            "expires": "Wed, 03 Jul 2013 11:00:00 GMT",
+        }
+        self.assertEqual(
+            freshness.fresh_until(headers, NOW), NOW + datetime.timedelta(hours=1)
+        )
+        self.assertIsNone(freshness.fresh_until({"expires": "0"}, NOW))
+        self.assertIsNone(freshness.fresh_until({}, NOW))
+
+    def test_retry_after(self):
+        """
+        Retry-After can be seconds or a date
+        """
+        self.assertEqual(
+            freshness.retry_after({"retry-after": "120"}, NOW),
+            NOW + datetime.timedelta(seconds=120),
+        )
+        self.assertEqual(
+            freshness.retry_after(
+                {"retry-after": "Wed, 03 Jul 2013 14:00:00 GMT"}, NOW
+            ),
+            NOW + datetime.timedelta(hours=2),
+        )
+        self.assertIsNone(freshness.retry_after({}, NOW))
+
+    def test_feed_ttl(self):
+        """
+        The feed's ttl or syndication update period is used
+        """
+        feed = feedparser.parse(fixture("feed5-ttl.xml"))["feed"]
+        self.assertEqual(freshness.feed_ttl(feed), 180)
+        feed = feedparser.parse(fixture("feed6-syndication.xml"))["feed"]
+        self.assertEqual(freshness.feed_ttl(feed), 6 * 60)
+        self.assertIsNone(freshness.feed_ttl({"ttl": "soon"}))
+
+    def test_skip_times(self):
+        """
+        All skipHours and skipDays are read from the document
+        """
+        self.assertEqual(
+            freshness.skip_times(fixture("feed5-ttl.xml")),
+            ([0, 1], ["Saturday", "Sunday"]),
+        )
+        self.assertEqual(
+            freshness.skip_times(fixture("feed1-wellformed.xml")), ([], [])
+        )
+
+    def test_next_allowed(self):
+        """
+        Checks are moved to the next hour outside the skipped hours and days
+        """
+        late = datetime.datetime(2013, 7, 3, 23, 30, tzinfo=datetime.timezone.utc)
+        self.assertEqual(
+            freshness.next_allowed(late, [23, 0, 1], []),
+            datetime.datetime(2013, 7, 4, 2, 0, tzinfo=datetime.timezone.utc),
+        )
+        self.assertEqual(
+            freshness.next_allowed(late, [], ["Thursday", "Friday"]),
+            datetime.datetime(2013, 7, 3, 23, 30, tzinfo=datetime.timezone.utc),
+        )
+        friday = datetime.datetime(2013, 7, 5, 9, 15, tzinfo=datetime.timezone.utc)
+        self.assertEqual(
+            freshness.next_allowed(friday, [0], ["Friday", "Saturday"]),
+            datetime.datetime(2013, 7, 7, 1, 0, tzinfo=datetime.timezone.utc),
+        )
+        self.assertEqual(freshness.next_allowed(friday, list(range(24)), []), friday)
+
+
+@override_settings(YARR_FREQUENCY=60, YARR_MAXIMUM_INTERVAL=24 * 60)
+class FeedFreshnessTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("test", "test@example.com", "test")
+
+    def check(self, server, path, headers=None, status=200, body=None):
+        """
+        Check a feed served with the given response, and return it with the
+        number of minutes until its next check
+        """
+        if body is None:
+            body = fixture("feed1-wellformed.xml")
+        server.responses[path] = (
+            status,
+            dict({"Content-Type": "application/rss+xml"}, **(headers or {})),
+            body,
+        )
+        feed = Feed.objects.create(
+            title="Feed", user=self.user, feed_url=server.url(path)
+        )
+        self.logfile = six.StringIO()
+        feed.check_feed(logfile=self.logfile)
+        return feed, (feed.next_check - feed.last_checked).total_seconds() / 60
+
+    def assertMinutes(self, minutes, expected):
+        self.assertAlmostEqual(minutes, expected, delta=1)
+
+    def test_cache_control(self):
+        with FeedServer() as server:
+            _, minutes = self.check(server, "a.xml", {"Cache-Control": "max-age=7200"})
+        self.assertMinutes(minutes, 120)
+        self.assertIn("put back by cache headers", self.logfile.getvalue())
+
+    def test_expires(self):
+        expires = timezone.now() + datetime.timedelta(hours=3)
+        with FeedServer() as server:
+            _, minutes = self.check(
+                server,
+                "a.xml",
+                {"Expires": expires.strftime("%a, %d %b %Y %H:%M:%S GMT")},
+            )
+        self.assertMinutes(minutes, 180)
+
+    def test_limit(self):
+        """
+        Declared freshness cannot put a check back further than the maximum
+        """
+        with FeedServer() as server:
+            _, minutes = self.check(
+                server, "a.xml", {"Cache-Control": "max-age=%s" % (7 * 86400)}
+            )
+        self.assertMinutes(minutes, 24 * 60)
+
+    def test_retry_after(self):
+        """
+        Retry-After on 429 and 503 puts back the next check
+        """
+        with FeedServer() as server:
+            for status in (429, 503):
+                feed, minutes = self.check(
+                    server, "%s.xml" % status, {"Retry-After": "7200"}, status, b""
+                )
+                self.assertMinutes(minutes, 120)
+                self.assertTrue(feed.is_active)
+                self.assertIn("Retry-After", self.logfile.getvalue())
+
+    def test_ttl(self):
+        """
+        The feed's ttl is stored and used for later checks
+        """
+        with FeedServer() as server:
+            feed, minutes = self.check(server, "a.xml", body=fixture("feed5-ttl.xml"))
+        self.assertEqual(feed.ttl, 180)
+        self.assertEqual((feed.skip_hours, feed.skip_days), ("0,1", "Saturday,Sunday"))
+        self.assertGreaterEqual(minutes, 180)
+        self.assertNotIn(feed.next_check.astimezone(datetime.timezone.utc).hour, [0, 1])
+        self.assertLess(feed.next_check.astimezone(datetime.timezone.utc).weekday(), 5)
+
+    def test_syndication(self):
+        with FeedServer() as server:
+            feed, minutes = self.check(
+                server, "a.xml", body=fixture("feed6-syndication.xml")
+            )
+        self.assertEqual(feed.ttl, 6 * 60)
+        self.assertMinutes(minutes, 6 * 60)
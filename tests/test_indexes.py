@@ -0,0 +1,75 @@
+from unittest import skipUnless
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from yarr.constants import ENTRY_UNREAD
+from yarr.models import Entry, Feed
+
+
+@skipUnless(connection.vendor == "sqlite", "Query plans are checked on SQLite")
+class QueryPlanTest(TestCase):
+    """
+    Check the indexes are used by the hot queries
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user("test", "test@example.com", "test")
+        self.feed = Feed.objects.create(
+            title="Feed", user=self.user, feed_url="http://example.com/feed.xml"
+        )
+
+    def assertUsesIndex(self, qs, index):
+        plan = qs.explain()
+        self.assertIn("INDEX %s " % index, plan)
+        return plan
+
+    def test_list_feed_entries(self):
+        """
+        Listing a feed's entries by state and date doesn't need a sort
+        """
+        qs = self.feed.entries.unread().order_by("-date")
+        plan = self.assertUsesIndex(qs, "yarr_entry_feed_state_date")
+        self.assertNotIn("ORDER BY", plan)
+
+    def test_keyset_page(self):
+        """
+        The next page of a feed's entries seeks to the cursor in the index
+        """
+        qs = self.feed.entries.unread().ordered().after(timezone.now(), 1)
+        plan = self.assertUsesIndex(qs, "yarr_entry_feed_state_date")
+        self.assertIn("date<?", plan)
+        self.assertNotIn("ORDER BY", plan)
+
+    def test_list_user_entries(self):
+        """
+        Listing all of a user's entries by state uses the index for each feed
+        """
+        qs = Entry.objects.filter(feed__user=self.user).unread().order_by("-date")
+        self.assertUsesIndex(qs, "yarr_entry_feed_state_date")
+
+    def test_count_unread(self):
+        """
+        Counting unread entries in a feed is answered from the index
+        """
+        qs = Entry.objects.filter(feed=self.feed, state=ENTRY_UNREAD)
+        self.assertIn(
+            "COVERING INDEX yarr_entry_feed_state_date",
+            str(qs.values("pk").explain()),
+        )
+
+    def test_expired(self):
+        """
+        Finding expired entries uses the expires index
+        """
+        qs = Entry.objects.filter(expires__lte=timezone.now())
+        self.assertUsesIndex(qs, "yarr_entry_expires")
+
+    def test_due_feeds(self):
+        """
+        Finding active feeds which are due uses the partial next_check index
+        """
+        qs = Feed.objects.active().filter(next_check__lte=timezone.now())
+        self.assertUsesIndex(qs, "yarr_feed_active_next_check")
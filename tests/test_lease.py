@@ -0,0 +1,175 @@
+import datetime
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from yarr.models import Feed
+
+from .server import FeedServer
+from .test_yarr import make_rss
+
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class LeaseTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user("test", "test@example.com", "test")
+        self.feeds = [
+            Feed.objects.create(
+                title="Feed %s" % i, user=user, feed_url="http://example.com/%s" % i
+            )
+            for i in range(3)
+        ]
+
+    def test_claim(self):
+        """
+        Feeds are only claimed by one owner at a time
+        """
+        first = Feed.objects.claim("first", 2)
+        self.assertEqual(first, self.feeds[:2])
+        self.assertEqual(Feed.objects.claim("second", 2), self.feeds[2:])
+        self.assertEqual(Feed.objects.claim("third", 2), [])
+
+        Feed.objects.filter(pk=first[0].pk).release("first")
+        Feed.objects.filter(pk=first[1].pk).release("second")
+        self.assertEqual(Feed.objects.claim("third", 2), self.feeds[:1])
+
+    def test_expired(self):
+        """
+        Leases held by a worker which has crashed expire and are reclaimed
+        """
+        Feed.objects.claim("crashed", 3)
+        later = timezone.now() + datetime.timedelta(minutes=10)
+        with self.settings(YARR_LEASE_TIME=60):
+            self.assertEqual(Feed.objects.claim("other", 3, now=later), self.feeds)
+        self.assertEqual(
+            set(Feed.objects.values_list("lease_owner", flat=True)), {"other"}
+        )
+
+    def test_renew(self):
+        """
+        Leases are only renewed for their owner
+        """
+        Feed.objects.claim("owner", 3)
+        later = timezone.now() + datetime.timedelta(minutes=10)
+        with self.settings(YARR_LEASE_TIME=60):
+            Feed.objects.filter(pk=self.feeds[0].pk).renew("owner", now=later)
+            Feed.objects.renew("other", now=later)
+            self.assertEqual(Feed.objects.claim("other", 3, now=later), self.feeds[1:])
+
+    def test_released_when_checked(self):
+        """
+        Each feed is released as soon as it has been checked, and the leases on
+        the rest of the batch are renewed
+        """
+        leases = []
+        check_feed = Feed.check_feed
+
+        def check_and_record(feed, *args, **kwargs):
+            leases.append(
+                list(
+                    Feed.objects.order_by("pk").values_list(
+                        "lease_owner", "lease_expires"
+                    )
+                )
+            )
+            return check_feed(feed, *args, **kwargs)
+
+        with FeedServer() as server:
+            for i, feed in enumerate(self.feeds):
+                feed.feed_url = server.url("feed-%s.xml" % i)
+                feed.save()
+                server.responses["feed-%s.xml" % i] = (
+                    200,
+                    {"Content-Type": "application/rss+xml"},
+                    make_rss([(i, i, 1)]).encode(),
+                )
+            with self.settings(YARR_LEASE_TIME=0), mock.patch.object(
+                Feed, "check_feed", check_and_record
+            ):
+                Feed.objects.check_feed()
+
+        owners = [[bool(owner) for owner, _ in lease] for lease in leases]
+        self.assertEqual(
+            owners, [[True, True, True], [False, True, True], [False, False, True]]
+        )
+        self.assertGreater(leases[2][2][1], leases[0][2][1])
+        self.assertFalse(Feed.objects.exclude(lease_owner="").exists())
+
+    def test_save(self):
+        """
+        Saving a feed does not change its lease
+        """
+        feed = self.feeds[0]
+        Feed.objects.claim("owner", 1)
+        feed.title = "Renamed"
+        feed.save()
+        feed.refresh_from_db()
+        self.assertEqual(feed.lease_owner, "owner")
+
+
+class MultiprocessLeaseTest(TestCase):
+    def manage(self, *args):
+        "Start a management command in another process using the shared database"
+        return subprocess.Popen(
+            [sys.executable, "-m", "django"] + list(args),
+            cwd=ROOT_PATH,
+            env=dict(
+                os.environ,
+                DJANGO_SETTINGS_MODULE="tests.settings",
+                YARR_TEST_DATABASE=self.database,
+            ),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    def test_check_feeds(self):
+        """
+        Several processes checking feeds at once check each feed exactly once
+        """
+        count = 30
+        with tempfile.TemporaryDirectory() as path, FeedServer(delay=0.05) as server:
+            self.database = os.path.join(path, "db.sqlite3")
+            self.assertEqual(self.manage("migrate", "-v0").wait(), 0)
+
+            headers = {"Content-Type": "application/rss+xml"}
+            urls = []
+            for i in range(count):
+                path = "feed-%s.xml" % i
+                server.responses[path] = (200, headers, make_rss([(i, i, 1)]).encode())
+                urls.append(server.url(path))
+            create = self.manage(
+                "shell",
+                "-c",
+                "from django.contrib.auth.models import User\n"
+                "from yarr.models import Feed\n"
+                "user = User.objects.create_user('test')\n"
+                "for url in %r:\n"
+                "    Feed.objects.create(title=url, feed_url=url, user=user)" % urls,
+            )
+            self.assertEqual(create.wait(), 0)
+
+            processes = [self.manage("check_feeds", "--workers=2") for _ in range(3)]
+            for process in processes:
+                _, stderr = process.communicate(timeout=120)
+                self.assertEqual(process.returncode, 0, stderr.decode())
+
+            paths = sorted(path for path, _ in server.requests)
+            self.assertEqual(paths, sorted(server.responses))
+            db = sqlite3.connect(self.database)
+            self.assertEqual(
+                db.execute(
+                    "SELECT COUNT(*) FROM yarr_feed WHERE next_check IS NOT NULL"
+                    " AND lease_owner = '' AND count_total = 1"
+                ).fetchone()[0],
+                count,
+            )
+            db.close()
@@ -0,0 +1,214 @@
+import datetime
+import json
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from yarr.constants import ENTRY_READ, ENTRY_UNREAD
+from yarr.models import Entry, Feed
+from yarr.utils import (
+    decode_cursor,
+    decode_ranges,
+    encode_cursor,
+    encode_ranges,
+    paginate,
+)
+
+
+class PaginationTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("test", "test@example.com", "test")
+        self.feed = Feed.objects.create(
+            title="Feed", user=self.user, feed_url="http://example.com/feed.xml"
+        )
+        # Pairs of entries share a date, so the pk decides their order
+        now = timezone.now()
+        for i in range(60):
+            self.feed.entries.create(
+                title="Entry %s" % i, date=now - datetime.timedelta(hours=i // 2)
+            )
+        self.expected = list(
+            Entry.objects.order_by("-date", "-pk").values_list("pk", flat=True)
+        )
+
+    def get(self, query=""):
+        "Paginate all entries for a query string, counting from the cached counts"
+        request = RequestFactory().get("/" + query)
+        return paginate(
+            request, Entry.objects.all(), count=Feed.objects.count_entries()
+        )
+
+    def pks(self, page):
+        return [entry.pk for entry in page[0].object_list]
+
+    def test_cursor(self):
+        """
+        Following the next and previous links pages through every entry in order
+        """
+        page = self.get()
+        pks = self.pks(page)
+        while page[1]["has_next"]:
+            page = self.get("?" + page[1]["next"]["query"])
+            pks += self.pks(page)
+        self.assertEqual(pks, self.expected)
+
+        page = self.get("?" + page[1]["previous"]["query"])
+        self.assertEqual(self.pks(page), self.expected[25:50])
+
+    def test_no_offset(self):
+        """
+        Pages are counted from the cached counts, and found by keyset
+        """
+        query = self.get()[1]["next"]["query"]
+        with CaptureQueriesContext(connection) as queries:
+            self.get("?" + query)
+        sql = " ".join(query["sql"] for query in queries)
+        self.assertNotIn("OFFSET", sql)
+        self.assertNotIn('COUNT(*) AS "__count" FROM "yarr_entry"', sql)
+
+    def test_page_number(self):
+        """
+        Pages can still be reached by number, from either end
+        """
+        self.assertEqual(self.pks(self.get("?p=2")), self.expected[25:50])
+        page = self.get("?p=3")
+        self.assertEqual(self.pks(page), self.expected[50:])
+        self.assertEqual(page[0].paginator.num_pages, 3)
+        self.assertEqual(self.pks(self.get("?p=99")), self.expected[50:])
+
+    def test_encode_cursor(self):
+        """
+        Cursors keep the date to the microsecond
+        """
+        date = timezone.now()
+        self.assertEqual(decode_cursor(encode_cursor(date, 12)), (date, 12))
+        self.assertIsNone(decode_cursor("invalid"))
+
+
+class FeedPksTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("test", "test@example.com", "test")
+        self.client.force_login(self.user)
+        self.feed = Feed.objects.create(
+            title="Feed", user=self.user, feed_url="http://example.com/feed.xml"
+        )
+        date = timezone.now()
+        for i in range(5):
+            self.feed.entries.create(title="Entry %s" % i, date=date)
+
+    def test_window(self):
+        """
+        Entry pks can be fetched in windows by cursor
+        """
+        url = reverse("yarr:api_feed_pks_get")
+        expected = list(
+            Entry.objects.order_by("date", "pk").values_list("pk", flat=True)
+        )
+
+        pks = []
+        data = {"order": "asc", "limit": 2}
+        while True:
+            response = self.client.get(url, data).json()
+            pks += response["pks"]
+            if not response["next"]:
+                break
+            data["after"] = response["next"]
+        self.assertEqual(pks, expected)
+        self.assertEqual(self.client.get(url).json()["pks"], expected[::-1])
+
+    def test_since(self):
+        """
+        Entry pks can be fetched after a given entry, even once it has been read
+        """
+        url = reverse("yarr:api_feed_pks_get")
+        pks = list(Entry.objects.order_by("-date", "-pk").values_list("pk", flat=True))
+        Entry.objects.filter(pk=pks[1]).update(state=ENTRY_READ)
+
+        response = self.client.get(
+            url, {"since": pks[1], "limit": 2, "state": ENTRY_UNREAD}
+        ).json()
+        self.assertEqual(response["pks"], pks[2:4])
+        self.assertFalse(self.client.get(url, {"since": "x"}).json()["success"])
+
+    def test_ranges(self):
+        """
+        Runs of pks are sent as ranges, and the unread counts take one query
+        """
+        url = reverse("yarr:api_feed_pks_get")
+        pks = list(Entry.objects.order_by("-date", "-pk").values_list("pk", flat=True))
+
+        # Session, user, unread counts and pks
+        with self.assertNumQueries(4):
+            response = self.client.get(url, {"encoding": "ranges"}).json()
+        self.assertEqual(response["pks"], [[pks[0], pks[-1]]])
+        self.assertEqual(response["feed_unread"], {str(self.feed.pk): 5})
+
+    def test_encode_ranges(self):
+        """
+        Ascending and descending runs are encoded as pairs, and decode again
+        """
+        pks = [1, 2, 3, 7, 9, 8, 12]
+        self.assertEqual(encode_ranges(pks), [[1, 3], 7, [9, 8], 12])
+        self.assertEqual(decode_ranges(encode_ranges(pks)), pks)
+        self.assertEqual(encode_ranges([]), [])
+
+
+# The host project provides base.html, so the tests stand in a minimal one
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "OPTIONS": {
+            "loaders": [
+                (
+                    "django.template.loaders.locmem.Loader",
+                    {"base.html": "{% block content %}{% endblock %}"},
+                ),
+                "django.template.loaders.app_directories.Loader",
+            ],
+        },
+    }
+]
+
+
+@override_settings(TEMPLATES=TEMPLATES, STATIC_URL="/static/")
+class ListEntriesTest(TestCase):
+    def test_config(self):
+        """
+        The page doesn't list every entry pk, just where the API should start
+        """
+        user = User.objects.create_user("test", "test@example.com", "test")
+        self.client.force_login(user)
+        feed = Feed.objects.create(
+            title="Feed", user=user, feed_url="http://example.com/feed.xml"
+        )
+        for i in range(30):
+            feed.entries.create(title="Entry %s" % i)
+
+        response = self.client.get(reverse("yarr:list_all"))
+        config = json.loads(response.context["yarr_settings"]["config"])
+        self.assertNotIn("available_pks", config)
+
+        last = response.context["entries"].object_list[-1]
+        self.assertEqual(config["initial_after"], encode_cursor(last.date, last.pk))
+        self.assertEqual(config["api_pk_window"], 100)
+
+    def test_manage_feeds(self):
+        """
+        The manage feeds page lists the user's feeds
+        """
+        user = User.objects.create_user("test", "test@example.com", "test")
+        other = User.objects.create_user("other", "other@example.com", "test")
+        self.client.force_login(user)
+        feed = Feed.objects.create(
+            title="Feed", user=user, feed_url="http://example.com/feed.xml"
+        )
+        Feed.objects.create(
+            title="Other", user=other, feed_url="http://example.com/feed.xml"
+        )
+
+        response = self.client.get(reverse("yarr:feeds"))
+        self.assertEqual(list(response.context["feeds"]), [feed])
@@ -0,0 +1,133 @@
+import os
+import pickle
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+import feedparser
+
+from yarr.fetch import Response
+from yarr.models import Entry, Feed
+from yarr.pipeline import EntryValues, clean_entry, needs_parse, parse_document
+
+from .server import FIXTURE_PATH, FeedServer
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURE_PATH, name), "rb") as file:
+        return file.read()
+
+
+class ParseDocumentTest(TestCase):
+    def test_clean_entry(self):
+        """
+        Cleaned entry values make the same entry as the raw feedparser entry
+        """
+        raw = feedparser.parse(fixture("feed4-with-img.xml"))["entries"][0]
+        values = pickle.loads(pickle.dumps(clean_entry(raw)))
+        self.assertIsInstance(values, EntryValues)
+
+        expected = Entry.objects.from_feedparser(raw)
+        entry = Entry.objects.from_feedparser(values)
+        for field in ("title", "content", "date", "url", "guid", "author"):
+            self.assertEqual(getattr(entry, field), getattr(expected, field))
+
+    def test_not_sanitised_again(self):
+        """
+        Cleaned values are used as they are
+        """
+        values = clean_entry({"title": "&amp;lt;b&amp;gt;"})
+        self.assertEqual(values["title"], "&lt;b&gt;")
+        self.assertEqual(Entry.objects.from_feedparser(values).title, "&lt;b&gt;")
+
+    def test_bozo(self):
+        """
+        A bozo exception is replaced by a picklable one naming the original
+        """
+        d = parse_document("feed.xml", 200, {}, fixture("feed2-malformed.xml"))
+        d = pickle.loads(pickle.dumps(d))
+        self.assertEqual(d["bozo"], 1)
+        self.assertEqual(d["bozo_exception"].class_name, "SAXParseException")
+
+    def test_maximum_entries(self):
+        """
+        Only the entries which will be processed are cleaned
+        """
+        d = parse_document("feed.xml", 200, {}, fixture("feed1-wellformed.xml"), 1)
+        self.assertEqual(len(d["entries"]), 1)
+        self.assertEqual(d["feed"]["title"], "Well-formed")
+
+    def test_needs_parse(self):
+        """
+        Responses are only parsed when a feed will use the result
+        """
+        feed = Feed(body_hash="")
+        response = Response("feed.xml", body=fixture("feed1-wellformed.xml"))
+        self.assertTrue(needs_parse(response, [feed]))
+
+        feed.body_hash = response.digest()
+        self.assertFalse(needs_parse(response, [feed]))
+        self.assertTrue(needs_parse(response, [feed], force=True))
+        self.assertFalse(needs_parse(Response("feed.xml", status=304), [feed]))
+
+
+class PipelineTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("test", "test@example.com", "test")
+
+    def test_check(self):
+        """
+        Feeds checked with a pool of processes are the same as checked serially
+        """
+        with FeedServer() as server:
+            feed = Feed.objects.create(
+                title="Feed",
+                user=self.user,
+                feed_url=server.url("feed4-with-img.xml"),
+            )
+            logfile = StringIO()
+            parse = mock.Mock(wraps=feedparser.parse)
+            with mock.patch("feedparser.parse", parse):
+                Feed.objects.check_feed(logfile=logfile, workers=2, processes=1)
+
+            # Nothing was parsed in this process
+            self.assertEqual(parse.call_count, 0)
+            piped = list(feed.entries.values_list("title", "body__content"))
+
+            feed.entries.all().delete()
+            Feed.objects.check_feed(force=True)
+
+        self.assertTrue(piped)
+        self.assertEqual(
+            piped, list(feed.entries.values_list("title", "body__content"))
+        )
+        self.assertIn("Made 1 requests for 1 feeds", logfile.getvalue())
+
+    def test_async_errors(self):
+        """
+        Errors from documents parsed in another process are reported as usual
+        """
+        with FeedServer() as server:
+            feeds = [
+                Feed.objects.create(
+                    title="Feed", user=self.user, feed_url=server.url(name)
+                )
+                for name in ("feed1-wellformed.xml", "feed2-malformed.xml")
+            ]
+            Feed.objects.check_feed(engine="async", workers=2, processes=2)
+
+        for feed in feeds:
+            feed.refresh_from_db()
+        self.assertEqual(feeds[0].error, "")
+        self.assertEqual(feeds[0].entries.count(), 2)
+        self.assertRegex(feeds[1].error, r"^Feed error: SAXParseException - ")
+
+    def test_command(self):
+        """
+        The number of processes can't be negative
+        """
+        with self.assertRaises(CommandError):
+            call_command("check_feeds", processes=-1, stdout=StringIO())
@@ -0,0 +1,88 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+import bleach
+
+from yarr import sanitize
+from yarr.models import Entry
+
+
+class SanitizeTest(TestCase):
+    def setUp(self):
+        sanitize.clear_cache()
+
+    def test_content(self):
+        """
+        Content is sanitised according to the settings
+        """
+        self.assertEqual(
+            sanitize.clean_content('<p onclick="x()">A<script>b</script></p>'),
+            "<p>Ab</p>",
+        )
+        with override_settings(YARR_ALLOWED_TAGS=["b"]):
+            self.assertEqual(sanitize.clean_content("<p><b>A</b></p>"), "<b>A</b>")
+        self.assertEqual(sanitize.clean_content("<p><b>A</b></p>"), "<p><b>A</b></p>")
+
+    def test_title(self):
+        """
+        Titles have all HTML removed and entities unescaped
+        """
+        self.assertEqual(sanitize.clean_title("<b>A &amp; B</b>"), "A & B")
+
+    def test_cleaner_reused(self):
+        """
+        Cleaners are only created when the settings change
+        """
+        cleaner = sanitize.get_cleaner()
+        self.assertIs(sanitize.get_cleaner(), cleaner)
+        with override_settings(YARR_ALLOWED_TAGS=["b"]):
+            self.assertIsNot(sanitize.get_cleaner(), cleaner)
+
+    def test_memo(self):
+        """
+        Unchanged entries are not sanitised again
+        """
+        raw = {"title": "<b>Title</b>", "content": [{"value": "<p>Content</p>"}]}
+        with mock.patch.object(
+            bleach.Cleaner, "clean", autospec=True, side_effect=bleach.Cleaner.clean
+        ) as clean:
+            first = Entry.objects.from_feedparser(raw)
+            second = Entry.objects.from_feedparser(raw)
+        self.assertEqual(clean.call_count, 2)
+        self.assertEqual((first.title, first.content), (second.title, second.content))
+        self.assertEqual(second.content, "<p>Content</p>")
+
+    @override_settings(YARR_SANITIZE_CACHE_SIZE=2)
+    def test_memo_size(self):
+        """
+        The least recently used results are discarded
+        """
+        for content in ["a", "b", "a", "c"]:
+            sanitize.clean_content(content)
+        with mock.patch.object(
+            bleach.Cleaner, "clean", autospec=True, side_effect=bleach.Cleaner.clean
+        ) as clean:
+            sanitize.clean_content("a")
+            self.assertEqual(clean.call_count, 0)
+            sanitize.clean_content("b")
+            self.assertEqual(clean.call_count, 1)
+
+    @override_settings(YARR_SANITIZE_CACHE_CHARS=5)
+    def test_memo_chars(self):
+        """
+        Results are discarded to keep within a total length, and long results
+        are not kept
+        """
+        for content in ["aa", "bbb", "cc", "dddddd"]:
+            sanitize.clean_content(content)
+        with mock.patch.object(
+            bleach.Cleaner, "clean", autospec=True, side_effect=bleach.Cleaner.clean
+        ) as clean:
+            sanitize.clean_content("bbb")
+            sanitize.clean_content("cc")
+            self.assertEqual(clean.call_count, 0)
+            sanitize.clean_content("aa")
+            self.assertEqual(clean.call_count, 1)
+            sanitize.clean_content("dddddd")
+            self.assertEqual(clean.call_count, 2)
@@ -0,0 +1,183 @@
+import datetime
+import os
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+import six
+
+from yarr.models import Feed
+from yarr.scheduler import Scheduler
+
+from .server import FeedServer
+
+
+class SchedulerTest(TestCase):
+    def setUp(self):
+        test_path = os.path.dirname(__file__)
+        user = User.objects.create_user("test", "test@example.com", "test")
+        now = timezone.now()
+        self.feed_due = Feed.objects.create(
+            title="Due",
+            user=user,
+            feed_url=os.path.join(test_path, "feed1-wellformed.xml"),
+            next_check=now - datetime.timedelta(minutes=1),
+        )
+        self.feed_later = Feed.objects.create(
+            title="Later",
+            user=user,
+            feed_url=os.path.join(test_path, "feed4-with-img.xml"),
+            next_check=now + datetime.timedelta(hours=1),
+        )
+        self.feed_new = Feed.objects.create(
+            title="New",
+            user=user,
+            feed_url=os.path.join(test_path, "feed4-with-img.xml"),
+        )
+
+    def test_queue(self):
+        """
+        Feeds are queued in order of their next check, and changes are reloaded
+        """
+        scheduler = Scheduler(workers=10)
+        scheduler.reload()
+        self.assertEqual(
+            scheduler.pop_due(timezone.now().timestamp(), 10),
+            [self.feed_new.pk, self.feed_due.pk],
+        )
+
+        # Changed and deactivated feeds are picked up on reload, and feeds which
+        # were not checked are queued again
+        Feed.objects.filter(pk=self.feed_later.pk).update(next_check=timezone.now())
+        Feed.objects.filter(pk=self.feed_due.pk).update(is_active=False)
+        scheduler.reload()
+        self.assertEqual(
+            scheduler.pop_due(timezone.now().timestamp(), 10),
+            [self.feed_new.pk, self.feed_later.pk],
+        )
+        self.assertIsNone(scheduler.next_due())
+
+    def test_run(self):
+        """
+        Due feeds are checked and rescheduled until the scheduler is stopped
+        """
+        logfile = six.StringIO()
+        scheduler = Scheduler(workers=2, logfile=logfile)
+        check_feed = Feed.check_feed
+        checked = []
+
+        def check_and_stop(feed, *args, **kwargs):
+            check_feed(feed, *args, **kwargs)
+            checked.append(feed.pk)
+            if len(checked) == 2:
+                scheduler.stop()
+
+        with mock.patch.object(Feed, "check_feed", check_and_stop):
+            scheduler.run()
+
+        self.assertEqual(sorted(checked), sorted([self.feed_due.pk, self.feed_new.pk]))
+        self.assertEqual(self.feed_due.entries.count(), 2)
+        self.assertEqual(self.feed_later.entries.count(), 0)
+
+        self.feed_due.refresh_from_db()
+        self.assertGreater(self.feed_due.next_check, timezone.now())
+        self.assertEqual(
+            scheduler.scheduled[self.feed_due.pk], self.feed_due.next_check.timestamp()
+        )
+        self.assertIn("Scheduler stopped", logfile.getvalue())
+
+    def test_shared_source(self):
+        """
+        Due subscribers to the same source are checked together with one request,
+        however few workers there are
+        """
+        Feed.objects.update(next_check=timezone.now() + datetime.timedelta(hours=1))
+        with FeedServer() as server:
+            url = server.url("feed1-wellformed.xml")
+            feeds = [
+                Feed.objects.create(
+                    title="Shared",
+                    user=User.objects.create_user("shared%s" % i),
+                    feed_url=url + ("#%s" % i if i % 2 else ""),
+                )
+                for i in range(6)
+            ]
+            scheduler = Scheduler(workers=2)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                scheduler.tick(executor)
+                self.assertEqual(len(scheduler.running), 1)
+                executor.shutdown()
+                scheduler.finish()
+
+        self.assertEqual(len(server.requests), 1)
+        for feed in feeds:
+            self.assertEqual(feed.entries.count(), 2)
+
+    def test_fetch_error(self):
+        """
+        An unexpected error while fetching is reported, and the feeds are released
+        to be checked again after the minimum interval
+        """
+        errfile = six.StringIO()
+        scheduler = Scheduler(workers=10, errfile=errfile)
+        with mock.patch(
+            "yarr.scheduler._prefetch_source", side_effect=RuntimeError("Broken")
+        ), ThreadPoolExecutor(max_workers=2) as executor:
+            scheduler.tick(executor)
+        scheduler.finish()
+
+        self.assertEqual(scheduler.running, {})
+        self.assertIn("Unexpected error fetching feeds", errfile.getvalue())
+        self.assertIn("RuntimeError: Broken", errfile.getvalue())
+        self.assertFalse(Feed.objects.exclude(lease_owner="").exists())
+
+        scheduler.reload()
+        self.assertEqual(scheduler.pop_due(timezone.now().timestamp(), 10), [])
+        later = timezone.now() + datetime.timedelta(minutes=61)
+        self.assertEqual(
+            sorted(scheduler.pop_due(later.timestamp(), 10)),
+            sorted([self.feed_new.pk, self.feed_due.pk, self.feed_later.pk]),
+        )
+
+    def test_check_error(self):
+        """
+        An unexpected error while saving a check is reported, and the feed is
+        released to be checked again after the minimum interval
+        """
+        errfile = six.StringIO()
+        scheduler = Scheduler(workers=10, errfile=errfile)
+        with mock.patch.object(
+            Feed, "check_feed", side_effect=RuntimeError("Broken")
+        ), ThreadPoolExecutor(max_workers=2) as executor:
+            scheduler.tick(executor)
+            executor.shutdown()
+            scheduler.finish()
+
+        self.assertIn("Unexpected error checking feed", errfile.getvalue())
+        self.assertFalse(Feed.objects.exclude(lease_owner="").exists())
+        self.feed_due.refresh_from_db()
+        self.assertGreater(
+            self.feed_due.next_check, timezone.now() + datetime.timedelta(minutes=59)
+        )
+        self.assertEqual(
+            scheduler.scheduled[self.feed_due.pk], self.feed_due.next_check.timestamp()
+        )
+        self.assertEqual(scheduler.pop_due(timezone.now().timestamp(), 10), [])
+
+    def test_sigterm(self):
+        """
+        The daemon exits cleanly on SIGTERM
+        """
+        Feed.objects.update(next_check=timezone.now() + datetime.timedelta(hours=1))
+        timer = threading.Timer(0.2, os.kill, (os.getpid(), signal.SIGTERM))
+        timer.start()
+        stdout = six.StringIO()
+        call_command("yarr_daemon", verbose=True, stdout=stdout)
+        timer.join()
+        self.assertIn("Scheduler stopped", stdout.getvalue())
@@ -1,12 +1,20 @@
+import datetime
+import importlib
 import os
+from unittest import mock
 
+from django.apps import apps
+from django.contrib import admin
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.utils import timezone
 
+import feedparser
 import six
 
-from yarr.decorators import with_socket_timeout
-from yarr.models import Feed
+from yarr.admin import FeedAdmin
+from yarr.constants import ENTRY_READ, ENTRY_SAVED, ENTRY_UNREAD
+from yarr.models import Entry, Feed
 
 
 class FeedTest(TestCase):
@@ -72,7 +80,6 @@ class FeedTest(TestCase):
             self, self.feed_malformed.error, r"^Feed error: SAXParseException - "
         )
 
-    @with_socket_timeout
     def test_http_error(self):
         """
         Test HTTP errors
@@ -102,3 +109,375 @@ class FeedTest(TestCase):
             '<img src="http://example.com/webcomic.png" alt="alt text" '
             'title="annoying in-joke" width="100" height="200">',
         )
+
+    def test_check_feed_workers(self):
+        """
+        Checking feeds with a worker pool updates each feed as a serial check would
+        """
+        feeds = Feed.objects.filter(
+            pk__in=[self.feed_wellformed.pk, self.feed_with_img.pk]
+        )
+        logfile = six.StringIO()
+        feeds.check_feed(logfile=logfile, workers=2)
+
+        self.feed_wellformed.refresh_from_db()
+        self.assertEqual(self.feed_wellformed.site_url, "http://example.com/wellformed")
+        self.assertEqual(self.feed_wellformed.entries.count(), 2)
+        self.assertEqual(self.feed_wellformed.count_total, 2)
+        self.assertEqual(self.feed_with_img.entries.count(), 1)
+        six.assertRegex(self, logfile.getvalue(), r"Checked 2 feeds in [\d.]+s")
+
+    def test_check_feed_due(self):
+        """
+        Only feeds which are due are loaded and checked, in batches
+        """
+        now = timezone.now()
+        Feed.objects.update(next_check=now + datetime.timedelta(days=1))
+        Feed.objects.filter(
+            pk__in=[self.feed_wellformed.pk, self.feed_with_img.pk]
+        ).update(next_check=now)
+        self.feed_malformed.entries.create(
+            title="Expired", date=now, expires=now - datetime.timedelta(days=1)
+        )
+
+        logfile = six.StringIO()
+        with mock.patch("yarr.managers.CLAIM_PER_WORKER", 1), mock.patch.object(
+            Feed, "check_feed", autospec=True
+        ) as check_feed:
+            Feed.objects.check_feed(logfile=logfile)
+
+        self.assertEqual(
+            [call[0][0] for call in check_feed.call_args_list],
+            [self.feed_wellformed, self.feed_with_img],
+        )
+        self.assertIn("2 feeds due, 2 skipped", logfile.getvalue())
+        self.assertEqual(self.feed_malformed.entries.count(), 0)
+
+
+def make_rss(items):
+    """
+    Build an RSS document from a list of (guid, title, day) tuples
+    """
+    return (
+        "<rss version='2.0'><channel><title>Generated</title>"
+        "<link>http://example.com/</link>%s</channel></rss>"
+        % "".join(
+            "<item><guid>%s</guid><title>%s</title><description>Content</description>"
+            "<pubDate>%02d Jul 2013 01:01:01 GMT</pubDate></item>" % item
+            for item in items
+        )
+    )
+
+
+class UpdateEntriesTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user("test", "test@example.com", "test")
+        self.feed = Feed.objects.create(
+            title="Feed", user=user, feed_url="http://example.com/feed.xml"
+        )
+
+    def update(self, items):
+        entries = feedparser.parse(make_rss(items))["entries"]
+        return self.feed._update_entries(entries, read=False)
+
+    def test_bulk_insert(self):
+        """
+        New entries are added with a fixed number of queries
+        """
+        items = [("guid-%s" % i, "Item %s" % i, 1 + i % 28) for i in range(90)]
+        with self.assertNumQueries(10):
+            self.update(items)
+        self.assertEqual(self.feed.entries.count(), 90)
+
+    def test_matching(self):
+        """
+        Re-seen entries are not duplicated, and re-published entries are updated
+        """
+        self.update([("a", "Item A", 1), ("b", "Item B", 1)])
+        self.update([("a", "Item A", 1), ("b", "Item B updated", 2), ("c", "C", 3)])
+
+        entries = self.feed.entries.order_by("guid")
+        self.assertEqual(
+            [(entry.guid, entry.title) for entry in entries],
+            [("a", "Item A"), ("b", "Item B updated"), ("c", "C")],
+        )
+
+    def test_expiry(self):
+        """
+        Read entries which are no longer in the feed are marked for expiry
+        """
+        self.update([("a", "Item A", 1), ("b", "Item B", 1)])
+        self.feed.entries.all().set_state(ENTRY_READ)
+        self.update([("b", "Item B", 1)])
+
+        self.assertIsNotNone(self.feed.entries.get(guid="a").expires)
+        self.assertIsNone(self.feed.entries.get(guid="b").expires)
+
+    def test_fingerprint(self):
+        """
+        Entries with no guid are matched by the fingerprint of their link
+        """
+        entries = feedparser.parse(
+            make_rss([("", "Item A", 1)]).replace(
+                "<guid></guid>", "<link>http://example.com/a</link>"
+            )
+        )["entries"]
+        self.feed._update_entries(entries, read=False)
+        self.feed._update_entries(entries, read=False)
+
+        entry = self.feed.entries.get()
+        self.assertEqual(entry.fingerprint, entry.make_fingerprint())
+        self.assertEqual(len(entry.fingerprint), 40)
+
+    def test_fingerprint_backfill(self):
+        """
+        The migration backfills fingerprints for existing entries
+        """
+        self.update([("a", "Item A", 1), ("b", "Item B", 2)])
+        expected = dict(self.feed.entries.values_list("pk", "fingerprint"))
+        self.feed.entries.update(fingerprint="")
+
+        migration = importlib.import_module("yarr.migrations.0004_entry_fingerprint")
+        migration.backfill_fingerprints(apps, None)
+        self.assertEqual(
+            dict(self.feed.entries.values_list("pk", "fingerprint")), expected
+        )
+
+
+class CountTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user("test", "test@example.com", "test")
+        self.feed = Feed.objects.create(
+            title="Feed", user=user, feed_url="http://example.com/feed.xml"
+        )
+        self.other = Feed.objects.create(
+            title="Other", user=user, feed_url="http://example.com/other.xml"
+        )
+        self.feed._update_entries(
+            feedparser.parse(make_rss([("a", "A", 1), ("b", "B", 2), ("c", "C", 3)]))[
+                "entries"
+            ],
+            read=False,
+        )
+        Entry.objects.create(feed=self.other, title="D", guid="d")
+
+    def assertCounts(self, feed, unread, total):
+        feed.refresh_from_db()
+        self.assertEqual((feed.count_unread, feed.count_total), (unread, total))
+
+    def test_update_entries(self):
+        """
+        New entries are counted as they are added
+        """
+        self.assertCounts(self.feed, 3, 3)
+        self.assertCounts(self.other, 1, 1)
+
+    def test_set_state(self):
+        """
+        Changing state adjusts the unread count of each affected feed
+        """
+        Entry.objects.filter(guid__in=["a", "b", "d"]).set_state(ENTRY_READ)
+        self.assertCounts(self.feed, 1, 3)
+        self.assertCounts(self.other, 0, 1)
+
+        Entry.objects.filter(guid="a").set_state(ENTRY_SAVED)
+        self.assertCounts(self.feed, 1, 3)
+
+        Entry.objects.all().set_state(ENTRY_UNREAD)
+        self.assertCounts(self.feed, 3, 3)
+        self.assertCounts(self.other, 1, 1)
+
+    def test_delete(self):
+        """
+        Deleting entries adjusts both counts
+        """
+        self.feed.entries.filter(guid="a").set_state(ENTRY_READ)
+        Entry.objects.filter(guid__in=["a", "b", "d"]).delete()
+        self.assertCounts(self.feed, 1, 1)
+        self.assertCounts(self.other, 0, 0)
+
+        self.feed.entries.get().delete()
+        self.assertCounts(self.feed, 0, 0)
+
+    def test_save_feed(self):
+        """
+        Saving a stale feed instance does not overwrite its counts
+        """
+        stale = Feed.objects.get(pk=self.feed.pk)
+        self.feed.entries.all().set_state(ENTRY_READ)
+        stale.title = "Renamed"
+        stale.save()
+        self.assertCounts(self.feed, 0, 3)
+
+    def test_recount(self):
+        """
+        Recounting corrects the counts of the selected feeds, one chunk at a time
+        """
+        Feed.objects.update(count_unread=10, count_total=10)
+        self.feed.entries.filter(guid="a").set_state(ENTRY_READ)
+        third = Feed.objects.create(
+            title="Third", user=self.feed.user, feed_url="http://example.com/3.xml"
+        )
+
+        feeds = Feed.objects.filter(pk__in=[self.feed.pk, third.pk])
+        with mock.patch("yarr.managers.RECOUNT_CHUNK_SIZE", 1):
+            # One query to find and one to update each chunk, then an empty chunk
+            with self.assertNumQueries(5):
+                feeds.update_counts()
+
+        self.assertCounts(self.feed, 2, 3)
+        self.assertCounts(third, 0, 0)
+        self.assertCounts(self.other, 10, 10)
+
+        Feed.objects.update_count_unread()
+        self.assertCounts(self.other, 1, 10)
+
+
+@override_settings(
+    YARR_ADAPTIVE_INTERVAL=True, YARR_MINIMUM_INTERVAL=60, YARR_MAXIMUM_INTERVAL=1440
+)
+class IntervalTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user("test", "test@example.com", "test")
+        self.feed = Feed.objects.create(
+            title="Feed", user=user, feed_url="http://example.com/feed.xml"
+        )
+        self.now = timezone.now()
+
+    def add_entries(self, hours):
+        "Add 10 entries, published every ``hours`` hours"
+        for i in range(1, 11):
+            self.feed.entries.create(
+                title="Entry %s" % i,
+                guid=str(i),
+                date=self.now - datetime.timedelta(hours=hours * i),
+            )
+
+    def test_adaptive(self):
+        """
+        The interval is estimated from the feed's recent entries
+        """
+        self.add_entries(6)
+        self.assertEqual(
+            self.feed.check_interval(self.now, changed=True),
+            (180, "10 entries in 3600 minutes"),
+        )
+
+    def test_limits(self):
+        """
+        Adaptive intervals are kept between the minimum and maximum
+        """
+        self.assertEqual(
+            self.feed.check_interval(self.now, changed=True),
+            (1440, "too few entries to estimate"),
+        )
+        self.add_entries(24 * 30)
+        self.assertEqual(self.feed.check_interval(self.now, changed=True)[0], 1440)
+        self.feed.entries.all().delete()
+        self.add_entries(1)
+        self.assertEqual(
+            self.feed.check_interval(self.now, changed=True),
+            (60, "10 entries in 600 minutes, raised to minimum"),
+        )
+
+    def test_unchanged(self):
+        """
+        Feeds which have not changed back off from their previous interval
+        """
+        self.add_entries(6)
+        self.assertEqual(
+            self.feed.check_interval(self.now, previous=200, changed=False),
+            (300, "unchanged, backing off from 200 minutes"),
+        )
+
+    def test_check_frequency(self):
+        """
+        An explicit check frequency wins, and adaptive intervals can be disabled
+        """
+        self.add_entries(6)
+        self.feed.check_frequency = 30
+        self.assertEqual(self.feed.check_interval(self.now, changed=True)[0], 30)
+        self.feed.check_frequency = None
+        with override_settings(YARR_ADAPTIVE_INTERVAL=False, YARR_FREQUENCY=720):
+            self.assertEqual(
+                self.feed.check_interval(self.now, changed=True),
+                (720, "default frequency"),
+            )
+
+    def test_check_feed(self):
+        """
+        Checking a feed schedules the next check, and reports why
+        """
+        self.feed.feed_url = os.path.join(
+            os.path.dirname(__file__), "feed1-wellformed.xml"
+        )
+        logfile = six.StringIO()
+        self.feed.check_feed(logfile=logfile)
+        self.assertIn("Next check in ", logfile.getvalue())
+        interval = self.feed.next_check - self.feed.last_checked
+        self.assertTrue(
+            datetime.timedelta(minutes=60) <= interval <= datetime.timedelta(days=1)
+        )
+
+
+@override_settings(YARR_MAXIMUM_INTERVAL=1440, YARR_MAXIMUM_FAILURES=3)
+class FailureTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user("test", "test@example.com", "test")
+        self.feed = Feed.objects.create(
+            title="Feed",
+            user=user,
+            feed_url=os.path.join(os.path.dirname(__file__), "missing.xml"),
+            check_frequency=60,
+        )
+
+    def test_backoff(self):
+        """
+        The interval doubles for each consecutive failure, up to the maximum
+        """
+        now = timezone.now()
+        self.feed.failures = 1
+        self.assertEqual(self.feed.check_interval(now)[0], 60)
+        self.feed.failures = 3
+        self.assertEqual(
+            self.feed.check_interval(now),
+            (240, "check frequency, backing off after 3 failures"),
+        )
+        self.assertEqual(self.feed.check_interval(now, changed=True)[0], 60)
+        self.feed.failures = 10
+        self.assertEqual(self.feed.check_interval(now)[0], 1440)
+
+    def test_circuit_breaker(self):
+        """
+        A feed which keeps failing is deactivated, and can be reset in the admin
+        """
+        for failures in (1, 2):
+            self.feed.check_feed(force=True)
+            self.assertEqual(self.feed.failures, failures)
+            self.assertTrue(self.feed.is_active)
+
+        self.feed.check_feed(force=True)
+        self.feed.refresh_from_db()
+        self.assertFalse(self.feed.is_active)
+        six.assertRegex(
+            self, self.feed.error, r"^Deactivated after 3 failures: Feed error: "
+        )
+
+        FeedAdmin(Feed, admin.site).clear_error(None, Feed.objects.all())
+        self.feed.refresh_from_db()
+        self.assertEqual(
+            (self.feed.is_active, self.feed.failures, self.feed.error), (True, 0, "")
+        )
+
+    def test_reset(self):
+        """
+        A successful check resets the failure count
+        """
+        self.feed.check_feed(force=True)
+        self.assertEqual(self.feed.failures, 1)
+        self.feed.feed_url = os.path.join(
+            os.path.dirname(__file__), "feed1-wellformed.xml"
+        )
+        self.feed.check_feed(force=True)
+        self.feed.refresh_from_db()
+        self.assertEqual(self.feed.failures, 0)
@@ -4,7 +4,7 @@ from yarr import models
 
 
 class FeedAdmin(admin.ModelAdmin):
-    list_display = ["title", "is_active", "user", "next_check", "error"]
+    list_display = ["title", "is_active", "user", "next_check", "failures", "error"]
     list_filter = ["is_active", "user"]
     search_fields = ["title", "feed_url", "site_url"]
     actions = ["deactivate", "clear_error"]
@@ -15,7 +15,7 @@ class FeedAdmin(admin.ModelAdmin):
     deactivate.short_description = "Deactivate feed"
 
     def clear_error(self, request, queryset):
-        queryset.update(is_active=True, error="")
+        queryset.update(is_active=True, error="", failures=0, next_check=None)
 
     clear_error.short_description = "Clear error and reactivate feed"
 
@@ -26,7 +26,8 @@ admin.site.register(models.Feed, FeedAdmin)
 class EntryAdmin(admin.ModelAdmin):
     list_display = ["title", "date", "state", "feed"]
     list_select_related = True
-    search_fields = ["title", "content"]
+    raw_id_fields = ["body"]
+    search_fields = ["title", "body__content"]
 
 
 admin.site.register(models.Entry, EntryAdmin)
@@ -1,4 +1,5 @@
 import socket
+import warnings
 
 from . import settings
 
@@ -10,20 +11,27 @@ def with_socket_timeout(fn):
     The socket timeout value is set before calling the function, then reset to
     the original timeout value afterwards
 
+    Deprecated: feeds are now fetched with their own timeouts, so this is no
+    longer needed to check feeds.
+
     Note: This is not thread-safe.
     """
 
     def wrap(*args, **kwargs):
+        warnings.warn(
+            "with_socket_timeout is deprecated; feed requests have their own timeouts",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
         # Set global socket
         old_timeout = socket.getdefaulttimeout()
         socket.setdefaulttimeout(settings.SOCKET_TIMEOUT)
 
-        # Call fn
-        r = fn(*args, **kwargs)
-
-        # Reset global socket
-        socket.setdefaulttimeout(old_timeout)
-
-        return r
+        # Call fn, and reset global socket even if it fails
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            socket.setdefaulttimeout(old_timeout)
 
     return wrap
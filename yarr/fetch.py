@@ -0,0 +1,682 @@
+"""
+Yarr feed fetching
+
+Feeds are downloaded here and handed to feedparser for parsing separately, so that
+unchanged documents can be detected before they are parsed.
+
+``fetch`` makes a single blocking request; ``AsyncFetcher`` is an asyncio HTTP
+engine to fetch many feeds at once from a single thread, for
+``check_feeds --engine=async``.
+
+Both limit each request with a ``Timeout``, rather than the global socket timeout,
+so they are safe to use from worker threads and web requests.
+"""
+import asyncio
+import functools
+import hashlib
+import http.client
+import queue
+import ssl
+import threading
+import time
+import zlib
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import (
+    HTTPHandler,
+    HTTPRedirectHandler,
+    HTTPSHandler,
+    Request,
+    build_opener,
+)
+
+import feedparser
+from feedparser.http import ACCEPT_HEADER
+
+from . import settings
+
+
+# Redirect statuses which will be followed
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+PERMANENT_REDIRECT_STATUSES = (301, 308)
+
+# Maximum number of redirects to follow for a single request
+MAX_REDIRECTS = 5
+
+# Number of bytes to read from a response at a time
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class Timeout(object):
+    """
+    Time limits for a single request, in seconds
+
+    Arguments:
+        connect     Maximum time to connect, including any TLS handshake
+        read        Maximum time to wait for the server to send more data, or
+                    None to only limit reads by the total time
+        total       Maximum time for the whole request, including redirects and
+                    reading the body
+
+    Limits which are not given default to ``YARR_CONNECT_TIMEOUT``,
+    ``YARR_SOCKET_TIMEOUT`` and ``YARR_FETCH_TIMEOUT``.
+    """
+
+    def __init__(self, connect=None, read=None, total=None):
+        self.connect = connect or settings.CONNECT_TIMEOUT
+        self.read = read or settings.SOCKET_TIMEOUT
+        self.total = total or settings.FETCH_TIMEOUT
+
+    def deadline(self):
+        "Return the ``time.monotonic()`` by which a request starting now must end"
+        return time.monotonic() + self.total
+
+
+class FeedTooLarge(ValueError):
+    "A feed is larger than the maximum size"
+
+    def __init__(self, limit):
+        super().__init__("Feed is larger than the maximum of %s bytes" % limit)
+        self.limit = limit
+
+
+def check_length(headers, limit):
+    """
+    Raise ``FeedTooLarge`` if the ``Content-Length`` header is over ``limit``, so
+    that the body isn't downloaded at all
+    """
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        return
+    if limit and length > limit:
+        raise FeedTooLarge(limit)
+
+
+class DeadlineExceeded(OSError):
+    "A request took longer than its total timeout"
+
+    def __init__(self):
+        super().__init__("timed out")
+
+
+class RedirectError(ValueError):
+    "A redirect could not be followed, because it loops or there are too many"
+
+
+def request_headers(headers=None):
+    """
+    Return the headers to send with a request, including any extra ``headers``
+    """
+    return dict(
+        {
+            "User-Agent": feedparser.USER_AGENT,
+            "Accept": ACCEPT_HEADER,
+            "Accept-Encoding": "gzip, deflate",
+        },
+        **(headers or {}),
+    )
+
+
+def is_local(url):
+    "Return True if the URL is not HTTP, so should be read from the filesystem"
+    return urlsplit(url).scheme not in ("http", "https")
+
+
+def read_local(url, limit=None):
+    "Read a local feed of up to ``limit`` bytes and return a ``Response``"
+    parts = urlsplit(url)
+    path = Path(parts.path if parts.scheme == "file" else url)
+    try:
+        if limit and path.stat().st_size > limit:
+            return Response(url, error=FeedTooLarge(limit))
+        return Response(url, body=path.read_bytes())
+    except OSError as e:
+        return Response(url, error=URLError(e))
+
+
+def redirected_status(url, final_url, status, redirects):
+    """
+    Return the status to report for a request which followed ``redirects``
+
+    To match feedparser, this will be 301 if the only redirects were permanent.
+    """
+    if (
+        redirects
+        and final_url != url
+        and status == 200
+        and all(code in PERMANENT_REDIRECT_STATUSES for code in redirects)
+    ):
+        return 301
+    return status
+
+
+def decompress(body, wbits, limit=None):
+    """
+    Decompress a zlib or gzip stream, raising ``FeedTooLarge`` as soon as it
+    decompresses to more than ``limit`` bytes
+    """
+    chunks = []
+    size = 0
+    while body:
+        decompressor = zlib.decompressobj(wbits)
+        chunk = decompressor.decompress(body, limit - size + 1 if limit else 0)
+        size += len(chunk)
+        if limit and size > limit:
+            raise FeedTooLarge(limit)
+        chunks.append(chunk + decompressor.flush())
+        # A gzip body can have several members
+        body = decompressor.unused_data if decompressor.eof else b""
+    return b"".join(chunks)
+
+
+def decode_body(body, encoding, limit=None):
+    """
+    Decompress a body according to its Content-Encoding, raising ``FeedTooLarge``
+    if it is more than ``limit`` bytes once decompressed
+    """
+    encoding = encoding.lower()
+    if encoding == "gzip":
+        body = decompress(body, 16 + zlib.MAX_WBITS, limit)
+    elif encoding == "deflate":
+        try:
+            body = decompress(body, zlib.MAX_WBITS, limit)
+        except zlib.error:
+            body = decompress(body, -zlib.MAX_WBITS, limit)
+    return body
+
+
+class RequestTimer(object):
+    """
+    Socket timeouts for a single request
+
+    Arguments:
+        read        Maximum time to wait for each read, or None for no limit
+        deadline    ``time.monotonic()`` by which the whole request must end
+
+    Each connection's socket is given to ``attach``, and ``start_read`` is called
+    before each read of the body, so that no read can wait past the deadline.
+    """
+
+    def __init__(self, read, deadline):
+        self.read = read
+        self.deadline = deadline
+        self.sock = None
+
+    def remaining(self):
+        "Return the time left, or raise ``DeadlineExceeded`` if there is none"
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded()
+        return remaining
+
+    def read_timeout(self):
+        "Return the timeout for the next read"
+        remaining = self.remaining()
+        if self.read is None:
+            return remaining
+        return min(self.read, remaining)
+
+    def attach(self, sock):
+        "Limit reads from a newly connected socket"
+        self.sock = sock
+        sock.settimeout(self.read_timeout())
+
+    def start_read(self):
+        "Limit the next read to the time left"
+        timeout = self.read_timeout()
+        # The response closes the socket once the whole body has been read
+        if self.sock is not None and self.sock.fileno() != -1:
+            self.sock.settimeout(timeout)
+
+
+class TimeoutConnectionMixin(object):
+    """
+    Connect within the connection's timeout, then wait for each read as long as
+    the ``RequestTimer`` allows
+    """
+
+    def __init__(self, *args, timer=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timer = timer
+
+    def connect(self):
+        remaining = self.timer.remaining()
+        if self.timeout is None or self.timeout > remaining:
+            self.timeout = remaining
+        super().connect()
+        self.timer.attach(self.sock)
+
+
+class TimeoutHTTPConnection(TimeoutConnectionMixin, http.client.HTTPConnection):
+    pass
+
+
+class TimeoutHTTPSConnection(TimeoutConnectionMixin, http.client.HTTPSConnection):
+    pass
+
+
+class TimeoutHTTPHandler(HTTPHandler):
+    "Open HTTP connections with separate connect and read timeouts"
+
+    def __init__(self, timer):
+        super().__init__()
+        self.connection = functools.partial(TimeoutHTTPConnection, timer=timer)
+
+    def http_open(self, req):
+        return self.do_open(self.connection, req)
+
+
+class TimeoutHTTPSHandler(HTTPSHandler):
+    "Open HTTPS connections with separate connect and read timeouts"
+
+    def __init__(self, timer):
+        super().__init__()
+        self.connection = functools.partial(TimeoutHTTPSConnection, timer=timer)
+
+    def https_open(self, req):
+        return self.do_open(self.connection, req, context=self._context)
+
+
+def read_body(f, timer, limit=None):
+    """
+    Stream a response body in chunks, raising ``DeadlineExceeded`` if it is too
+    slow, or ``FeedTooLarge`` as soon as it is longer than ``limit`` bytes
+
+    Each read is limited by the ``RequestTimer``, so a server which stalls part
+    way through can't keep the request open past its deadline.
+    """
+    check_length(f.headers, limit)
+    chunks = []
+    size = 0
+    while True:
+        timer.start_read()
+        chunk = f.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        size += len(chunk)
+        if limit and size > limit:
+            raise FeedTooLarge(limit)
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+class RedirectHandler(HTTPRedirectHandler):
+    """
+    Follow redirects, recording their statuses
+    """
+
+    max_redirections = MAX_REDIRECTS
+
+    def __init__(self):
+        self.statuses = []
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        self.statuses.append(code)
+        return super().redirect_request(req, fp, code, msg, headers, newurl)
+
+
+def fetch(url, headers=None, timeout=None, max_size=None):
+    """
+    Fetch a single URL and return a ``Response``
+
+    Any ``headers`` will be added to the request, and will be sent again if
+    redirected. The request is limited by ``timeout``, a ``Timeout`` which
+    defaults to the settings.
+
+    The body is streamed, and the request abandoned with a ``FeedTooLarge`` error
+    as soon as it is longer than ``max_size`` bytes, before or after
+    decompression. This defaults to ``YARR_MAXIMUM_FEED_SIZE``.
+
+    Errors are caught and returned on the ``error`` attribute of the response;
+    network errors, including timeouts, are returned as a ``URLError``, to match
+    feedparser.
+    """
+    if max_size is None:
+        max_size = settings.MAXIMUM_FEED_SIZE
+    if is_local(url):
+        return read_local(url, max_size)
+
+    timeout = timeout or Timeout()
+    timer = RequestTimer(timeout.read, timeout.deadline())
+    redirects = RedirectHandler()
+    opener = build_opener(
+        TimeoutHTTPHandler(timer),
+        TimeoutHTTPSHandler(timer),
+        redirects,
+    )
+    request = Request(url, headers=request_headers(headers))
+    try:
+        try:
+            with opener.open(request, timeout=timeout.connect) as f:
+                final_url, status = f.geturl(), f.status
+                response_headers = f.headers
+                body = read_body(f, timer, max_size)
+        except HTTPError as e:
+            if e.msg.startswith(HTTPRedirectHandler.inf_msg):
+                raise RedirectError(e.msg.splitlines()[0])
+            final_url, status = e.geturl(), e.code
+            response_headers, body = e.headers, read_body(e, timer, max_size)
+        response_headers = {
+            name.lower(): ", ".join(response_headers.get_all(name))
+            for name in set(response_headers.keys())
+        }
+        body = decode_body(body, response_headers.get("content-encoding", ""), max_size)
+    except URLError as e:
+        return Response(url, error=e)
+    except OSError as e:
+        return Response(url, error=URLError(e))
+    except Exception as e:
+        return Response(url, error=e)
+
+    return Response(
+        final_url,
+        status=redirected_status(url, final_url, status, redirects.statuses),
+        headers=response_headers,
+        body=body,
+        requests=1 + len(redirects.statuses),
+    )
+
+
+class Response(object):
+    """
+    A fetched feed document
+
+    Attributes:
+        url         Final URL, after following any redirects
+        status      HTTP status, or 301 if only permanent redirects were followed
+        headers     Dict of response headers, with lower case names
+        body        Response body as bytes, decoded if it was compressed
+        error       Exception raised while fetching, if the fetch failed
+        requests    Number of requests made, including any redirects followed
+    """
+
+    def __init__(self, url, status=200, headers=None, body=b"", error=None, requests=1):
+        self.url = url
+        self.status = status
+        self.headers = headers or {}
+        self.body = body
+        self.error = error
+        self.requests = requests
+        self._parsed = None
+
+    def digest(self):
+        "Return a SHA-256 hex digest of the body"
+        return hashlib.sha256(self.body).hexdigest()
+
+    def parse(self):
+        """
+        Parse the body with feedparser
+
+        Returns a feedparser result with ``status`` and ``href`` set as if
+        feedparser had made the request itself. Raises the fetch error if the
+        fetch failed.
+
+        The result is kept, so a response shared by several feeds is only parsed
+        once; it must not be modified.
+        """
+        if self.error is not None:
+            raise self.error
+
+        if self._parsed is None:
+            headers = dict(self.headers)
+            headers.setdefault("content-location", self.url)
+            d = feedparser.parse(self.body, response_headers=headers)
+            d["status"] = self.status
+            d["href"] = self.url
+            self._parsed = d
+        return self._parsed
+
+    @property
+    def is_parsed(self):
+        "True if the body has been parsed"
+        return self._parsed is not None
+
+    def set_parsed(self, d):
+        """
+        Keep a result of parsing the body elsewhere, to be returned by ``parse``
+
+        This is used for documents parsed in a worker process by
+        ``yarr.pipeline.parse_document``.
+        """
+        self._parsed = d
+
+
+class AsyncFetcher(object):
+    """
+    Fetch feeds concurrently using asyncio
+
+    Arguments:
+        limit       Maximum number of requests in flight at once
+        per_host    Maximum number of requests in flight to a single host
+        timeout     ``Timeout`` for each request; defaults to the settings
+        max_size    Maximum size of a feed in bytes; defaults to
+                    ``YARR_MAXIMUM_FEED_SIZE``
+    """
+
+    def __init__(self, limit=100, per_host=None, timeout=None, max_size=None):
+        self.limit = limit
+        self.per_host = per_host or settings.FETCH_PER_HOST
+        self.timeout = timeout or Timeout()
+        self.max_size = settings.MAXIMUM_FEED_SIZE if max_size is None else max_size
+
+    def fetch(self, urls):
+        """
+        Fetch a list of URLs and return a list of ``Response`` objects in order
+        """
+        responses = {}
+        for key, response, _ in self.iter_fetch([(url, url, {}) for url in urls]):
+            responses[key] = response
+        return [responses[url] for url in urls]
+
+    def iter_fetch(self, requests):
+        """
+        Fetch URLs in a background thread, yielding results as they complete
+
+        Arguments:
+            requests    List of ``(key, url, headers)`` tuples, where ``headers``
+                        is a dict of additional request headers
+
+        Yields ``(key, response, elapsed)`` tuples, where ``elapsed`` is the time
+        in seconds the request took once it had been started.
+
+        The event loop runs in its own thread so that the caller is free to use
+        the database (which Django does not allow in an async context) while
+        other feeds are still being fetched.
+        """
+        results = queue.Queue()
+        done = object()
+
+        def run():
+            try:
+                asyncio.run(self._fetch_all(requests, results.put))
+            finally:
+                results.put(done)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        while True:
+            result = results.get()
+            if result is done:
+                break
+            yield result
+        thread.join()
+
+    async def _fetch_all(self, requests, callback):
+        limit = asyncio.Semaphore(self.limit)
+        hosts = {}
+
+        async def fetch_one(key, url, headers):
+            host = urlsplit(url).netloc.lower()
+            if host not in hosts:
+                hosts[host] = asyncio.Semaphore(self.per_host)
+
+            # Wait for the host before taking a global slot, so that a busy host
+            # does not hold up requests to other hosts
+            async with hosts[host], limit:
+                start = time.monotonic()
+                response = await self.get(url, headers)
+                callback((key, response, time.monotonic() - start))
+
+        await asyncio.gather(*[fetch_one(*request) for request in requests])
+
+    async def get(self, url, headers=None):
+        """
+        Fetch a single URL and return a ``Response``
+
+        Any ``headers`` will be added to the request, and will be sent again if
+        redirected.
+
+        Errors are caught and returned on the ``error`` attribute of the response;
+        network errors are returned as a ``URLError``, to match feedparser.
+        """
+        try:
+            return await asyncio.wait_for(
+                self._get(url, headers or {}), self.timeout.total
+            )
+        except asyncio.TimeoutError:
+            return Response(url, error=URLError("timed out"))
+        except OSError as e:
+            return Response(url, error=URLError(e))
+        except Exception as e:
+            return Response(url, error=e)
+
+    async def _get(self, url, headers):
+        if is_local(url):
+            # Let the default executor read it
+            return await asyncio.get_running_loop().run_in_executor(
+                None, read_local, url, self.max_size
+            )
+
+        final_url = url
+        redirects = []
+        for _ in range(MAX_REDIRECTS + 1):
+            status, response_headers, body = await self._request(final_url, headers)
+            if status not in REDIRECT_STATUSES or "location" not in response_headers:
+                break
+            redirects.append(status)
+            final_url = urljoin(final_url, response_headers["location"])
+        else:
+            raise RedirectError("Too many redirects")
+
+        return Response(
+            final_url,
+            status=redirected_status(url, final_url, status, redirects),
+            headers=response_headers,
+            body=body,
+            requests=1 + len(redirects),
+        )
+
+    async def _request(self, url, extra_headers):
+        """
+        Make a single HTTP/1.1 GET request with the given additional headers
+
+        Returns a tuple of ``(status, headers, body)``
+        """
+        parts = urlsplit(url)
+        is_https = parts.scheme == "https"
+        port = parts.port or (443 if is_https else 80)
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                parts.hostname,
+                port,
+                ssl=ssl.create_default_context() if is_https else None,
+            ),
+            self.timeout.connect,
+        )
+        reader = TimeoutReader(reader, self.timeout.read, self.max_size)
+        try:
+            path = parts.path or "/"
+            if parts.query:
+                path = "%s?%s" % (path, parts.query)
+            request = [
+                "GET %s HTTP/1.1" % path,
+                "Host: %s" % parts.netloc,
+                "Connection: close",
+            ] + ["%s: %s" % header for header in request_headers(extra_headers).items()]
+            writer.write(("\r\n".join(request) + "\r\n\r\n").encode("latin-1"))
+            await writer.drain()
+
+            # Status line and headers
+            status_line = await reader.readline()
+            try:
+                status = int(status_line.split()[1])
+            except (IndexError, ValueError):
+                raise ValueError("Invalid HTTP response")
+
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1").strip()
+                if not line:
+                    break
+                name, _, value = line.partition(":")
+                name = name.strip().lower()
+                value = value.strip()
+                headers[name] = (
+                    "%s, %s" % (headers[name], value) if name in headers else value
+                )
+
+            # Body, which is abandoned as soon as it is too large
+            if "chunked" in headers.get("transfer-encoding", "").lower():
+                chunks = []
+                while True:
+                    size = int((await reader.readline()).split(b";")[0], 16)
+                    if size == 0:
+                        break
+                    chunks.append(await reader.readexactly(size))
+                    await reader.readline()
+                body = b"".join(chunks)
+            elif "content-length" in headers:
+                check_length(headers, self.max_size)
+                body = await reader.readexactly(int(headers["content-length"]))
+            else:
+                body = await reader.read()
+        finally:
+            writer.close()
+
+        body = decode_body(body, headers.get("content-encoding", ""), self.max_size)
+        return status, headers, body
+
+
+class TimeoutReader(object):
+    """
+    Wrap an ``asyncio.StreamReader`` so that the server is given no longer than
+    ``timeout`` seconds to send each line or chunk of data, and no more than
+    ``limit`` bytes of body are read
+    """
+
+    def __init__(self, reader, timeout, limit=None):
+        self.reader = reader
+        self.timeout = timeout
+        self.limit = limit
+        self.size = 0
+
+    async def _read(self, read):
+        "Read a chunk of the body, counting it towards the limit"
+        chunk = await asyncio.wait_for(read, self.timeout)
+        self.size += len(chunk)
+        if self.limit and self.size > self.limit:
+            raise FeedTooLarge(self.limit)
+        return chunk
+
+    async def readline(self):
+        return await asyncio.wait_for(self.reader.readline(), self.timeout)
+
+    async def readexactly(self, n):
+        chunks = []
+        while n > 0:
+            chunk = await self._read(self.reader.readexactly(min(n, READ_CHUNK_SIZE)))
+            chunks.append(chunk)
+            n -= len(chunk)
+        return b"".join(chunks)
+
+    async def read(self):
+        "Read until the end of the stream"
+        chunks = []
+        while True:
+            chunk = await self._read(self.reader.read(READ_CHUNK_SIZE))
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
@@ -61,11 +61,23 @@ def _build_frequency_choices():
     return choices
 
 
+def _frequency_choices():
+    """
+    Build a choices list of frequencies, with a blank choice to use the default
+    frequency, or the adaptive interval if enabled
+    """
+    blank = "Automatic" if settings.ADAPTIVE_INTERVAL else "Default"
+    return [("", blank)] + _build_frequency_choices()
+
+
 class EditFeedForm(forms.ModelForm):
     required_css_class = "required"
-    check_frequency = forms.ChoiceField(
+    check_frequency = forms.TypedChoiceField(
         widget=forms.Select,
-        choices=_build_frequency_choices(),
+        choices=_frequency_choices,
+        coerce=int,
+        empty_value=None,
+        required=False,
         label="Frequency",
         help_text="How often to check the feed for changes",
     )
@@ -78,3 +90,10 @@ class EditFeedForm(forms.ModelForm):
             "feed_url": forms.TextInput(),
             "title": forms.TextInput(),
         }
+
+    def save(self, commit=True):
+        # Reactivating a feed gives it a fresh start
+        if "is_active" in self.changed_data and self.instance.is_active:
+            self.instance.failures = 0
+            self.instance.next_check = None
+        return super(EditFeedForm, self).save(commit)
@@ -0,0 +1,139 @@
+"""
+Yarr entry fragment cache
+
+The API sends entries as HTML rendered from a template, and often sends the same
+entries again, eg when switching between feeds. Rendered entries are kept in the
+Django cache named by ``YARR_ENTRY_CACHE``, so they are only rendered once.
+
+Fragments are rendered without the entry's state, which the client adds, so
+marking an entry as read or saved doesn't change its fragment. Each fragment is
+keyed by the entry pk and a version made from everything else it shows, so an
+entry which is updated, or whose feed is renamed, is rendered again.
+"""
+import hashlib
+
+from django.core.cache import caches
+from django.db.models import prefetch_related_objects
+from django.template import loader
+
+from . import constants, settings
+
+
+# Template the API renders entries with
+ENTRY_TEMPLATE = "yarr/include/entry.html"
+
+# Cache keys for the number of fragments found and rendered
+HITS_KEY = "yarr:fragments:hits"
+MISSES_KEY = "yarr:fragments:misses"
+
+
+def get_cache():
+    "Return the cache for fragments, or None if caching is disabled"
+    if not settings.ENTRY_CACHE:
+        return None
+    return caches[settings.ENTRY_CACHE]
+
+
+def fragment_key(entry, template=ENTRY_TEMPLATE):
+    """
+    Return the cache key for an entry rendered with ``template``, from its pk
+    and a version of the fields the fragment shows
+
+    The content is identified by the entry's ``body_id``, as stored content
+    never changes.
+    """
+    values = (
+        template,
+        entry.body_id,
+        entry.title,
+        entry.date,
+        entry.author,
+        entry.url,
+        entry.comments_url,
+        entry.feed_id,
+        entry.feed.title,
+        entry.feed.site_url,
+    )
+    version = hashlib.md5(
+        "\0".join(str(value) for value in values).encode("utf-8")
+    ).hexdigest()
+    return "yarr:entry:%s:%s" % (entry.pk, version)
+
+
+def render_entries(entries, template=ENTRY_TEMPLATE):
+    """
+    Render a list of entries without their state, using cached fragments
+
+    Entries should have their feeds selected; the content is only loaded for
+    entries which aren't in the cache. Returns a list of HTML strings in the
+    same order as the entries.
+    """
+    cache = get_cache()
+    keys = [fragment_key(entry, template) for entry in entries]
+    fragments = cache.get_many(keys) if cache is not None else {}
+
+    missed = {key: entry for key, entry in zip(keys, entries) if key not in fragments}
+    if missed:
+        prefetch_related_objects(list(missed.values()), "body")
+        compiled = loader.get_template(template)
+        rendered = {
+            key: compiled.render(
+                {"constants": constants, "entry": entry, "stateless": True}
+            )
+            for key, entry in missed.items()
+        }
+        if cache is not None:
+            cache.set_many(rendered, settings.ENTRY_CACHE_TIMEOUT)
+        fragments.update(rendered)
+
+    if cache is not None:
+        record(len(keys) - len(missed), len(missed))
+    return [fragments[key] for key in keys]
+
+
+def invalidate(entry):
+    "Remove the cached fragment for the current version of an entry"
+    cache = get_cache()
+    if cache is not None and entry.pk is not None:
+        cache.delete(fragment_key(entry))
+
+
+def record(hits, misses):
+    "Add to the number of fragments found in and missing from the cache"
+    cache = get_cache()
+    for key, count in ((HITS_KEY, hits), (MISSES_KEY, misses)):
+        if not count:
+            continue
+        cache.add(key, 0, None)
+        try:
+            cache.incr(key, count)
+        except ValueError:
+            # Evicted since it was added
+            cache.set(key, count, None)
+
+
+def stats():
+    """
+    Return a dict of the number of fragments found in the cache (``hits``),
+    rendered because they were missing (``misses``), and the hit ``rate``
+
+    The counts are kept in the cache, so they only cover other processes if the
+    cache is shared between them, eg memcached or Redis.
+    """
+    cache = get_cache()
+    counts = cache.get_many([HITS_KEY, MISSES_KEY]) if cache is not None else {}
+    hits = counts.get(HITS_KEY, 0)
+    misses = counts.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "rate": float(hits) / total if total else None,
+    }
+
+
+def reset_stats():
+    "Reset the number of hits and misses"
+    cache = get_cache()
+    if cache is not None:
+        cache.delete_many([HITS_KEY, MISSES_KEY])
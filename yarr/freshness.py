@@ -0,0 +1,150 @@
+"""
+Yarr feed freshness
+
+Publishers can say how long a feed will stay fresh, and when it should not be
+checked, with HTTP headers and elements in the feed itself. These functions read
+them so that ``Feed`` can avoid checking a feed before it could have changed.
+"""
+import datetime
+import re
+from email.utils import parsedate_to_datetime
+
+
+# Minutes in each sy:updatePeriod
+UPDATE_PERIODS = {
+    "hourly": 60,
+    "daily": 24 * 60,
+    "weekly": 7 * 24 * 60,
+    "monthly": 30 * 24 * 60,
+    "yearly": 365 * 24 * 60,
+}
+
+# Names of the days for skipDays, in ``datetime.weekday()`` order
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# feedparser keeps only the last hour and day, so these are read from the document
+SKIP_HOURS = re.compile(rb"<skipHours\b[^>]*>(.*?)</skipHours>", re.S | re.I)
+SKIP_DAYS = re.compile(rb"<skipDays\b[^>]*>(.*?)</skipDays>", re.S | re.I)
+HOUR = re.compile(rb"<hour\b[^>]*>\s*(\d+)\s*</hour>", re.I)
+DAY = re.compile(rb"<day\b[^>]*>\s*(\w+)\s*</day>", re.I)
+
+
+def parse_http_date(value):
+    "Parse an HTTP date into an aware datetime, or return None if it is invalid"
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return date
+
+
+def fresh_until(headers, now):
+    """
+    Return when a response stops being fresh according to its ``Cache-Control``
+    or ``Expires`` headers, or None if it does not say
+
+    Arguments:
+        headers     Dict of response headers, with lower case names
+        now         Time the response was received
+    """
+    directives = {}
+    for directive in headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.strip().lower()] = value.strip().strip('"')
+
+    if "no-cache" in directives or "no-store" in directives:
+        return None
+
+    if "max-age" in directives:
+        try:
+            max_age = int(directives["max-age"])
+            age = int(headers.get("age", 0))
+        except ValueError:
+            return None
+        return now + datetime.timedelta(seconds=max(max_age - age, 0))
+
+    if "expires" in headers:
+        expires = parse_http_date(headers["expires"])
+        if expires is None:
+            return None
+        # Measure from the server's clock, in case it doesn't match ours
+        date = parse_http_date(headers.get("date", ""))
+        return now + (expires - (date or now))
+
+    return None
+
+
+def retry_after(headers, now):
+    """
+    Return the time given by a ``Retry-After`` header, or None if there isn't one
+
+    The header can be a number of seconds or an HTTP date.
+    """
+    value = headers.get("retry-after", "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return now + datetime.timedelta(seconds=int(value))
+    return parse_http_date(value)
+
+
+def feed_ttl(feed):
+    """
+    Return the number of minutes a parsed feed says it will stay fresh, from the
+    RSS ``ttl`` element or the syndication module's ``sy:updatePeriod`` and
+    ``sy:updateFrequency``, or None if it does not say
+    """
+    ttls = []
+    try:
+        ttls.append(int(feed.get("ttl", "")))
+    except ValueError:
+        pass
+
+    period = UPDATE_PERIODS.get(feed.get("sy_updateperiod", "").strip().lower())
+    if period:
+        try:
+            frequency = int(feed.get("sy_updatefrequency", 1))
+        except ValueError:
+            frequency = 1
+        ttls.append(period // max(frequency, 1))
+
+    ttls = [ttl for ttl in ttls if ttl > 0]
+    return max(ttls) if ttls else None
+
+
+def skip_times(body):
+    """
+    Return a tuple of the RSS ``skipHours`` and ``skipDays`` in a feed document
+
+    Hours are returned as a sorted list of ints, and days as a list of names in
+    ``DAYS``.
+    """
+    hours = set()
+    for block in SKIP_HOURS.findall(body):
+        hours.update(int(hour) % 24 for hour in HOUR.findall(block))
+
+    days = set()
+    for block in SKIP_DAYS.findall(body):
+        days.update(day.decode("ascii").title() for day in DAY.findall(block))
+
+    return sorted(hours), [day for day in DAYS if day in days]
+
+
+def next_allowed(when, skip_hours, skip_days):
+    """
+    Return the first time at or after ``when`` which is outside the skipped hours
+    and days, which are in GMT
+    """
+    if len(skip_hours) >= 24 or len(skip_days) >= 7:
+        # Nothing is allowed, so the publisher can't have meant it
+        return when
+
+    allowed = when.astimezone(datetime.timezone.utc)
+    for _ in range(8 * 24):
+        if allowed.hour not in skip_hours and DAYS[allowed.weekday()] not in skip_days:
+            return allowed
+        allowed = allowed.replace(minute=0, second=0, microsecond=0)
+        allowed += datetime.timedelta(hours=1)
+    return when
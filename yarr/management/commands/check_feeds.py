@@ -1,8 +1,7 @@
 from django.conf import settings
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 
 from yarr import models
-from yarr.decorators import with_socket_timeout
 
 
 # Supress feedparser's DeprecationWarning in production environments - we don't
@@ -46,9 +45,34 @@ class Command(BaseCommand):
             help="Print information to the console",
         )
         parser.add_argument("--url", dest="url", help="Specify the URL to update")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            dest="workers",
+            default=1,
+            help="Number of feeds to fetch and parse concurrently",
+        )
+        parser.add_argument(
+            "--engine",
+            dest="engine",
+            choices=["threads", "async"],
+            default="threads",
+            help="Fetch feeds with a pool of threads, or with asyncio",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            dest="processes",
+            default=0,
+            help="Number of worker processes to parse and sanitise feeds in",
+        )
 
-    @with_socket_timeout
     def handle(self, *args, **options):
+        if options["workers"] < 1:
+            raise CommandError("There must be at least one worker")
+        if options["processes"] < 0:
+            raise CommandError("The number of processes cannot be negative")
+
         # Apply url filter
         entries = models.Entry.objects.all()
         feeds = models.Feed.objects.all()
@@ -61,11 +85,21 @@ class Command(BaseCommand):
         # Purge current entries
         if options["purge"]:
             entries.delete()
-            feeds.update(last_updated=None, last_checked=None, next_check=None)
+            feeds.update(
+                last_updated=None,
+                last_checked=None,
+                next_check=None,
+                etag="",
+                modified="",
+                body_hash="",
+            )
 
         # Check feeds for updates
         feeds.check_feed(
             force=options["force"],
             read=options["read"],
             logfile=self.stdout if options["verbose"] else None,
+            workers=options["workers"],
+            engine=options["engine"],
+            processes=options["processes"],
         )
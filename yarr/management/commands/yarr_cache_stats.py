@@ -0,0 +1,44 @@
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand, CommandError
+
+from yarr import fragments
+
+
+class Command(BaseCommand):
+    help = "Report how often rendered entries are found in the fragment cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            dest="reset",
+            default=False,
+            help="Reset the counts after reporting them",
+        )
+
+    def handle(self, *args, **options):
+        cache = fragments.get_cache()
+        if cache is None:
+            raise CommandError("The fragment cache is disabled by YARR_ENTRY_CACHE")
+        if isinstance(cache, (LocMemCache, DummyCache)):
+            # The counts are kept by the web server processes, not this one
+            self.stderr.write(
+                self.style.WARNING(
+                    "YARR_ENTRY_CACHE uses %s, which is not shared between "
+                    "processes, so these counts are only for this command; use a "
+                    "shared cache such as memcached or Redis" % cache.__class__.__name__
+                )
+            )
+
+        stats = fragments.stats()
+        self.stdout.write("Hits:     %d" % stats["hits"])
+        self.stdout.write("Misses:   %d" % stats["misses"])
+        if stats["rate"] is None:
+            self.stdout.write("Hit rate: -")
+        else:
+            self.stdout.write("Hit rate: %.1f%%" % (100.0 * stats["rate"]))
+
+        if options["reset"]:
+            fragments.reset_stats()
+            self.stdout.write("Counts reset")
@@ -1,7 +1,6 @@
 from django.core.management.base import BaseCommand
 
 from yarr import models
-from yarr.decorators import with_socket_timeout
 
 
 class Command(BaseCommand):
@@ -22,8 +21,14 @@ class Command(BaseCommand):
             default=False,
             help="Update cache values",
         )
+        parser.add_argument(
+            "--delete_content",
+            action="store_true",
+            dest="delete_content",
+            default=False,
+            help="Delete entry content which is no longer used by any entries",
+        )
 
-    @with_socket_timeout
     def handle(self, *args, **options):
         # Delete all read entries - useful for upgrades to 0.3.12
         if options["delete_read"]:
@@ -34,4 +39,9 @@ class Command(BaseCommand):
 
         # Update feed unread and total counts
         if options["update_cache"]:
-            models.Feed.objects.update_count_unread().update_count_total()
+            models.Feed.objects.update_counts()
+
+        # Delete content left behind by deleted entries
+        if options["delete_content"]:
+            deleted = models.EntryContent.objects.delete_orphaned()
+            self.stdout.write("Deleted %s unused entry contents" % deleted)
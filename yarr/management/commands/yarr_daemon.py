@@ -0,0 +1,67 @@
+import signal
+
+from django.core.management.base import BaseCommand, CommandError
+
+from yarr.scheduler import Scheduler
+
+
+class Command(BaseCommand):
+    help = "Check feeds for updates as they become due, until stopped"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--read",
+            action="store_true",
+            dest="read",
+            default=False,
+            help="Any new items will be marked as read; useful when importing",
+        )
+        parser.add_argument(
+            "--verbose",
+            action="store_true",
+            dest="verbose",
+            default=False,
+            help="Print information to the console",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            dest="workers",
+            default=1,
+            help="Number of sources to fetch and parse concurrently",
+        )
+        parser.add_argument(
+            "--reload",
+            type=int,
+            dest="reload",
+            default=60,
+            help="Seconds between checking the database for changed feeds",
+        )
+
+    def handle(self, *args, **options):
+        if options["workers"] < 1:
+            raise CommandError("There must be at least one worker")
+        if options["reload"] < 1:
+            raise CommandError("The reload interval must be at least one second")
+
+        scheduler = Scheduler(
+            workers=options["workers"],
+            read=options["read"],
+            logfile=self.stdout if options["verbose"] else None,
+            errfile=self.stderr,
+            reload_interval=options["reload"],
+        )
+
+        # Finish checks in progress before exiting
+        def stop(signum, frame):
+            scheduler.stop()
+
+        handlers = {
+            signum: signal.signal(signum, stop)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+        try:
+            scheduler.run()
+        finally:
+            for signum, handler in handlers.items():
+                signal.signal(signum, handler)
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Sum
+from django.db.models.functions import Coalesce, Length
+
+from yarr import models
+
+
+def measure(queryset, field):
+    "Return the number of rows and total length of a text field in a queryset"
+    return queryset.aggregate(
+        count=Count("pk"), size=Coalesce(Sum(Length(field)), 0)
+    ).values()
+
+
+class Command(BaseCommand):
+    help = "Report the size of stored entry content, and how much is shared"
+
+    def handle(self, *args, **options):
+        entries, unshared = measure(models.Entry.objects.all(), "body__content")
+        contents, stored = measure(models.EntryContent.objects.all(), "content")
+        orphaned, unused = measure(models.EntryContent.objects.orphaned(), "content")
+
+        report = [
+            ("Entries", entries, unshared),
+            ("Entry contents", contents, stored),
+            ("Unused contents", orphaned, unused),
+        ]
+        self.stdout.write("%-16s %12s %16s" % ("", "rows", "characters"))
+        for label, count, size in report:
+            self.stdout.write("%-16s %12d %16d" % (label, count, size))
+
+        if unshared:
+            saved = unshared - (stored - unused)
+            self.stdout.write(
+                "Sharing content saves %d characters (%.1f%%)"
+                % (saved, 100.0 * saved / unshared)
+            )
+        if orphaned:
+            self.stdout.write(
+                "Run yarr_clean --delete_content to delete unused contents"
+            )
@@ -2,104 +2,565 @@
 Yarr model managers
 """
 import datetime
-import html
+import hashlib
+import os
+import socket
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from django.apps import apps
-from django.db import connection, models
+from django.db import connections, models, transaction
+from django.db.models import functions
 from django.utils import timezone
 
-import bleach
-from bleach.css_sanitizer import CSSSanitizer
-
-from . import settings
-from .constants import ENTRY_READ, ENTRY_SAVED, ENTRY_UNREAD
+from . import pipeline, settings
+from .constants import ENTRY_READ, ENTRY_SAVED, ENTRY_UNREAD, ORDER_ASC, ORDER_DESC
+from .fetch import AsyncFetcher
+from .pipeline import EntryValues, clean_entry
+from .sources import group_feeds, prefetch_source, shared_headers, source_batches
 
 
 ###############################################################################
 #                                                               Feed model
 
+# Maximum number of feeds to recount in a single UPDATE
+RECOUNT_CHUNK_SIZE = 1000
+
+# Number of due feeds each worker claims at a time when checking feeds
+CLAIM_PER_WORKER = 4
+
+
+def make_lease_owner():
+    "Return a name for a lease owner which is unique to this call"
+    return "%s:%s:%s" % (socket.gethostname()[:200], os.getpid(), uuid.uuid4().hex)
+
+
+def _due_filter(now):
+    "Return a Q object to select feeds which are due before the next poll"
+    next_poll = now + datetime.timedelta(minutes=settings.MINIMUM_INTERVAL)
+    return models.Q(next_check__isnull=True) | models.Q(next_check__lt=next_poll)
+
+
+def _claimed_batches(queryset, owner, size):
+    """
+    Claim and yield lists of about ``size`` feeds from a queryset, with every
+    subscriber of a source in the same batch
+
+    The batches are planned before the first is claimed, so feeds are only
+    claimed once, even if they are still selected after they have been checked.
+    """
+    for pks in source_batches(queryset, size):
+        feeds = queryset.filter(pk__in=pks).claim(owner, len(pks))
+        if feeds:
+            yield feeds
+
+
+def _count_entries(entries):
+    "Return an expression counting ``entries`` for the feed being updated"
+    return functions.Coalesce(
+        models.Subquery(
+            entries.filter(feed=models.OuterRef("pk"))
+            .order_by()
+            .values("feed")
+            .annotate(count=models.Count("pk"))
+            .values("count")
+        ),
+        0,
+    )
+
+
+class _BatchLease(object):
+    """
+    The leases on a batch of feeds which are being checked
+
+    Each feed is released as soon as its check has been written, and the leases
+    on the rest of the batch are renewed once half of ``LEASE_TIME`` has passed,
+    so they can't expire while the batch is still being checked.
+    """
+
+    def __init__(self, model, owner, feeds):
+        self.model = model
+        self.owner = owner
+        self.pending = {feed.pk for feed in feeds}
+        self.renewed = time.monotonic()
+
+    def done(self, feed):
+        "Release a feed which has been checked, and renew the rest if needed"
+        self.pending.discard(feed.pk)
+        self.model.objects.filter(pk=feed.pk).release(self.owner)
+        if self.pending and time.monotonic() - self.renewed > settings.LEASE_TIME / 2:
+            self.model.objects.filter(pk__in=self.pending).renew(self.owner)
+            self.renewed = time.monotonic()
+
+    def release(self):
+        "Release the feeds which have not been checked"
+        if self.pending:
+            self.model.objects.filter(pk__in=self.pending).release(self.owner)
+            self.pending = set()
+
 
 class FeedQuerySet(models.query.QuerySet):
     def active(self):
         "Filter to active feeds"
         return self.filter(is_active=True)
 
-    def check_feed(self, force=False, read=False, logfile=None):
-        "Check active feeds for updates"
-        for feed in self.active():
-            feed.check_feed(force, read, logfile)
+    def check_feed(
+        self,
+        force=False,
+        read=False,
+        logfile=None,
+        workers=1,
+        engine="threads",
+        processes=0,
+    ):
+        """
+        Check active feeds which are due for updates
+
+        Due feeds are selected by the database and claimed ``CLAIM_PER_WORKER``
+        per worker at a time, by leasing them so that other processes checking
+        feeds at the same time will skip them; feeds which are not due are not
+        loaded at all, but still have their expired entries removed. If ``force``
+        is True, all active feeds are checked.
 
-        # Update the total and unread counts
-        self.update_count_unread()
-        self.update_count_total()
+        If ``workers`` is more than 1, feeds which are due will be fetched and
+        parsed concurrently in a pool of that many threads. Database writes are
+        still made one feed at a time by the calling thread.
+
+        If ``engine`` is ``"async"``, feeds which are due will instead be fetched
+        by ``yarr.fetch.AsyncFetcher``, with up to ``workers`` requests in flight
+        at once, and no more than ``FETCH_PER_HOST`` to any one host.
+
+        If ``processes`` is more than 0, fetched documents will be parsed and
+        sanitised in a pool of that many worker processes, while the fetching
+        continues; see ``yarr.pipeline``.
+
+        Feeds with the same normalised URL are claimed in the same batch, and
+        fetched and parsed once for all of their subscribers; see
+        ``yarr.sources``.
+
+        If a logfile is provided, the number of feeds due and skipped, the time
+        taken for each feed, the number of requests made and the total wall time
+        will be reported.
+        """
+        start = time.monotonic()
+        now = timezone.now()
+        active = self.active()
+        due = active if force else active.due(now)
+
+        if logfile is not None:
+            counts = active.aggregate(
+                total=models.Count("pk"),
+                due=models.Count("pk", filter=None if force else _due_filter(now)),
+            )
+            logfile.write(
+                "%s feeds due, %s skipped"
+                % (counts["due"], counts["total"] - counts["due"])
+            )
+
+        checked = 0
+        requests = 0
+        owner = make_lease_owner()
+        pool = pipeline.process_pool(processes) if processes else None
+        try:
+            for feeds in _claimed_batches(due, owner, workers * CLAIM_PER_WORKER):
+                checked += len(feeds)
+                lease = _BatchLease(self.model, owner, feeds)
+                try:
+                    if pool is not None:
+                        requests += self._check_pipeline(
+                            feeds, force, read, logfile, lease, workers, engine, pool
+                        )
+                    elif engine == "async":
+                        requests += self._check_async(
+                            feeds, force, read, logfile, lease, workers
+                        )
+                    elif workers > 1:
+                        requests += self._check_concurrent(
+                            feeds, force, read, logfile, lease, workers
+                        )
+                    else:
+                        requests += self._check_serial(
+                            feeds, force, read, logfile, lease
+                        )
+                finally:
+                    lease.release()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        # Feeds which weren't due still need their expired entries removed
+        Entry = apps.get_model("yarr", "Entry")
+        Entry.objects.filter(feed__in=active, expires__lte=timezone.now()).delete()
+
+        if logfile is not None:
+            logfile.write("Made %s requests for %s feeds" % (requests, checked))
+            logfile.write(
+                "Checked %s feeds in %.3fs with %s worker%s"
+                % (
+                    checked,
+                    time.monotonic() - start,
+                    workers,
+                    "" if workers == 1 else "s",
+                )
+            )
 
         return self
 
-    def _do_update(self, extra):
-        "Perform the update for update_count_total and update_count_unread"
-        # Get IDs for current queries
-        ids = self.values_list("id", flat=True)
-
-        # If no IDs, no sense trying to do anything
-        if not ids:
-            return self
-
-        # Prepare query options
-        # IDs and states should only ever be ints, but force them to
-        # ints to be sure we don't introduce injection vulns
-        opts = {
-            "feed": apps.get_model("yarr", "Feed")._meta.db_table,
-            "entry": apps.get_model("yarr", "Entry")._meta.db_table,
-            "ids": ",".join([str(int(id)) for id in ids]),
-            # Fields which should be set in extra
-            "field": "",
-            "where": "",
+    def due(self, now=None):
+        """
+        Filter to feeds which are due for a check before the next poll
+
+        This matches ``Feed.is_due``.
+        """
+        return self.filter(_due_filter(now or timezone.now()))
+
+    def unleased(self, now=None):
+        "Filter to feeds which are not leased, or whose lease has expired"
+        return self.filter(
+            models.Q(lease_expires__isnull=True)
+            | models.Q(lease_expires__lte=now or timezone.now())
+        )
+
+    def claim(self, owner, limit, now=None):
+        """
+        Lease up to ``limit`` of the selected feeds to ``owner``, in pk order
+
+        Returns a list of the feeds which were claimed. Feeds leased by another
+        owner are skipped until their lease expires after ``LEASE_TIME`` seconds,
+        so feeds claimed by a worker which has crashed will be reclaimed.
+        """
+        now = now or timezone.now()
+        lease = {
+            "lease_owner": owner,
+            "lease_expires": now + datetime.timedelta(seconds=settings.LEASE_TIME),
         }
-        opts.update(extra)
-
-        # Uses raw query so we can update in a single call to avoid race condition
-        cursor = connection.cursor()
-        cursor.execute(
-            """UPDATE %(feed)s
-                SET %(field)s=COALESCE(
-                    (
-                        SELECT COUNT(1)
-                            FROM %(entry)s
-                            WHERE %(feed)s.id=feed_id%(where)s
-                            GROUP BY feed_id
-                    ), 0
-                )
-                WHERE id IN (%(ids)s)
-            """
-            % opts
+        candidates = self.unleased(now).order_by("pk").values_list("pk", flat=True)
+
+        if connections[self.db].features.has_select_for_update_skip_locked:
+            # Lock the rows, skipping any being claimed by other workers
+            with transaction.atomic(using=self.db):
+                pks = list(candidates.select_for_update(skip_locked=True)[:limit])
+                self.model.objects.filter(pk__in=pks).update(**lease)
+        else:
+            # Another worker may claim the same rows first, so only update those
+            # which are still unleased. The UPDATE is atomic by itself; reading
+            # in the same transaction would make SQLite fail to upgrade the lock
+            # when another worker is writing.
+            pks = list(candidates[:limit])
+            self.model.objects.filter(pk__in=pks).unleased(now).update(**lease)
+
+        if not pks:
+            return []
+        claimed = self.model.objects.filter(pk__in=pks, lease_owner=owner)
+        return list(claimed.order_by("pk"))
+
+    def release(self, owner, next_check=None):
+        """
+        Release any leases on the selected feeds which are held by ``owner``
+
+        If ``next_check`` is given, the released feeds are rescheduled to it.
+        """
+        fields = {"lease_owner": "", "lease_expires": None}
+        if next_check is not None:
+            fields["next_check"] = next_check
+        return self.filter(lease_owner=owner).update(**fields)
+
+    def renew(self, owner, now=None):
+        """
+        Extend any leases on the selected feeds which are held by ``owner``, to
+        ``LEASE_TIME`` seconds from now
+        """
+        expires = (now or timezone.now()) + datetime.timedelta(
+            seconds=settings.LEASE_TIME
         )
+        return self.filter(lease_owner=owner).update(lease_expires=expires)
+
+    def _check_serial(self, feeds, force, read, logfile, lease):
+        """
+        Check feeds, fetching them in this thread
+
+        Returns the number of requests made.
+        """
+        requests = 0
+        for group in group_feeds(feeds).values():
+            fetches, response, fetch_time = prefetch_source(group, force)
+            requests += response.requests
+            self._update_source(fetches, fetch_time, force, read, logfile, lease)
+        return requests
+
+    def _check_concurrent(self, feeds, force, read, logfile, lease, workers):
+        """
+        Check feeds, fetching them in a pool of worker threads
+
+        Returns the number of requests made.
+        """
+        requests = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_prefetch_source, group, force)
+                for group in group_feeds(feeds).values()
+            ]
+            for future in as_completed(futures):
+                fetches, response, fetch_time = future.result()
+                requests += response.requests
+                self._update_source(fetches, fetch_time, force, read, logfile, lease)
+        return requests
+
+    def _check_async(self, feeds, force, read, logfile, lease, workers):
+        """
+        Check feeds, fetching them with the asyncio engine
+
+        Returns the number of requests made.
+        """
+        sources, requests = _sources(feeds, force)
+
+        made = 0
+        fetcher = AsyncFetcher(limit=workers)
+        for index, response, fetch_time in fetcher.iter_fetch(requests):
+            group = sources[index]
+            made += response.requests
+            # Parse in this thread; the time is reported with the fetch
+            fetches, _, parse_time = prefetch_source(group, force, response)
+            self._update_source(
+                fetches, fetch_time + parse_time, force, read, logfile, lease
+            )
+        return made
 
+    def _check_pipeline(
+        self, feeds, force, read, logfile, lease, workers, engine, pool
+    ):
+        """
+        Check feeds, fetching them with the engine and parsing them in a pool of
+        worker processes
+
+        Returns the number of requests made.
+        """
+        sources, requests = _sources(feeds, force)
+        if engine == "async":
+            fetched = AsyncFetcher(limit=workers).iter_fetch(requests)
+        else:
+            fetched = pipeline.iter_fetch(requests, workers)
+
+        parsing = {}
+        made = 0
+
+        def update(index, response, fetch_time):
+            fetches, _, parse_time = prefetch_source(sources[index], force, response)
+            self._update_source(
+                fetches, fetch_time + parse_time, force, read, logfile, lease
+            )
+
+        def update_parsed(future):
+            index, response, fetch_time = parsing.pop(future)
+            try:
+                response.set_parsed(future.result())
+            except Exception:
+                # Leave it to be parsed again here, so the error is handled as usual
+                pass
+            update(index, response, fetch_time)
+
+        for index, response, fetch_time in fetched:
+            group = sources[index]
+            made += response.requests
+            if pipeline.needs_parse(response, group, force):
+                future = pool.submit(
+                    pipeline.parse_document,
+                    response.url,
+                    response.status,
+                    response.headers,
+                    response.body,
+                    settings.MAXIMUM_ENTRIES,
+                )
+                parsing[future] = (index, response, fetch_time)
+            else:
+                update(index, response, fetch_time)
+
+            # Write any feeds which have been parsed while waiting for the next
+            for future in [future for future in parsing if future.done()]:
+                update_parsed(future)
+
+        for future in as_completed(list(parsing)):
+            update_parsed(future)
+        return made
+
+    def _update_source(self, fetches, fetch_time, force, read, logfile, lease):
+        """
+        Update each subscriber of a source from the result of ``prefetch_source``,
+        and release each one as soon as it has been written
+        """
+        for feed, fetch in fetches:
+            check_start = time.monotonic()
+            feed.check_feed(force, read, logfile, fetch=fetch)
+            lease.done(feed)
+            if logfile is not None:
+                logfile.write(
+                    "[%s] Fetched in %.3fs, updated in %.3fs"
+                    % (feed.pk, fetch_time, time.monotonic() - check_start)
+                )
+
+    def _recount(self, unread=False, total=False):
+        """
+        Recount the cached counts for the selected feeds
+
+        Feeds are updated in chunks of ``RECOUNT_CHUNK_SIZE``, walking the
+        selection in pk order. Each chunk is a single UPDATE which counts the
+        entries of each feed in a correlated subquery, so the counts are
+        consistent with the entries at the time of the update.
+        """
+        Entry = apps.get_model("yarr", "Entry")
+        counts = {}
+        if unread:
+            counts["count_unread"] = _count_entries(Entry.objects.unread())
+        if total:
+            counts["count_total"] = _count_entries(Entry.objects.all())
+
+        pks = self.order_by("pk").values_list("pk", flat=True)
+        last_pk = None
+        while counts:
+            chunk = pks if last_pk is None else pks.filter(pk__gt=last_pk)
+            chunk = list(chunk[:RECOUNT_CHUNK_SIZE])
+            if not chunk:
+                break
+            self.model.objects.filter(pk__in=chunk).update(**counts)
+            last_pk = chunk[-1]
         return self
 
+    def update_counts(self):
+        "Update the cached unread and total counts"
+        return self._recount(unread=True, total=True)
+
     def update_count_total(self):
         "Update the cached total counts"
-        return self._do_update({"field": "count_total"})
+        return self._recount(total=True)
+
+    def adjust_counts(self, unread=None, total=None):
+        """
+        Adjust the cached counts by deltas, without recounting
+
+        Arguments:
+            unread      Dict of changes to unread counts, {feed_pk: delta, ...}
+            total       Dict of changes to total counts, {feed_pk: delta, ...}
+
+        All feeds are adjusted in a single UPDATE using ``F()`` expressions, so
+        this should be called in the same transaction as the change to entries.
+        """
+        updates = {}
+        pks = set()
+        for field, deltas in (("count_unread", unread), ("count_total", total)):
+            deltas = {pk: delta for pk, delta in (deltas or {}).items() if delta}
+            if deltas:
+                updates[field] = models.F(field) + _deltas(deltas)
+                pks.update(deltas)
+
+        if updates:
+            self.filter(pk__in=pks).update(**updates)
+        return self
 
     def update_count_unread(self):
         "Update the cached unread counts"
-        return self._do_update(
-            {"field": "count_unread", "where": " AND state=%s" % ENTRY_UNREAD}
-        )
+        return self._recount(unread=True)
 
     def count_unread(self):
         "Get a dict of unread counts, with feed pks as keys"
         return dict(self.values_list("pk", "count_unread"))
 
+    def count_entries(self, state=None):
+        """
+        Return the number of entries in the selected feeds from their cached
+        counts, or None if there is no cached count for ``state``
+
+        Arguments:
+            state       None to count all entries, or ``ENTRY_UNREAD``
+        """
+        if state is None:
+            field = "count_total"
+        elif state == ENTRY_UNREAD:
+            field = "count_unread"
+        else:
+            return None
+        return self.aggregate(count=functions.Coalesce(models.Sum(field), 0))["count"]
+
+
+def _deltas(deltas):
+    "Build an expression for the delta of each feed, from {feed_pk: delta, ...}"
+    return models.Case(
+        *[models.When(pk=pk, then=models.Value(delta)) for pk, delta in deltas.items()],
+        default=models.Value(0),
+        output_field=models.IntegerField(),
+    )
+
+
+def _sources(feeds, force):
+    """
+    Group claimed feeds by source for a check
+
+    Returns a tuple of a list of the feeds of each source, and a list of
+    ``(index, url, headers)`` requests to fetch them, for ``iter_fetch``.
+    """
+    sources = list(group_feeds(feeds).values())
+    requests = [
+        (index, group[0].feed_url, shared_headers(group, force))
+        for index, group in enumerate(sources)
+    ]
+    return sources, requests
+
+
+def _prefetch_source(feeds, force):
+    """
+    Fetch and parse a source in a worker thread
+
+    Returns the result of ``yarr.sources.prefetch_source``
+    """
+    try:
+        return prefetch_source(feeds, force)
+    finally:
+        # Django opens a connection per thread; don't leave them open in the pool
+        connections.close_all()
+
 
 class FeedManager(models.Manager):
     def active(self):
         "Active feeds"
         return self.get_queryset().active()
 
-    def check_feed(self, force=False, read=False, logfile=None):
+    def check_feed(
+        self,
+        force=False,
+        read=False,
+        logfile=None,
+        workers=1,
+        engine="threads",
+        processes=0,
+    ):
         "Check all active feeds for updates"
-        return self.get_queryset().check_feed(force, read, logfile)
+        return self.get_queryset().check_feed(
+            force, read, logfile, workers, engine, processes
+        )
+
+    def due(self, now=None):
+        "Feeds which are due for a check before the next poll"
+        return self.get_queryset().due(now)
+
+    def unleased(self, now=None):
+        "Feeds which are not leased, or whose lease has expired"
+        return self.get_queryset().unleased(now)
+
+    def claim(self, owner, limit, now=None):
+        "Lease up to ``limit`` feeds to ``owner``, in pk order"
+        return self.get_queryset().claim(owner, limit, now)
+
+    def release(self, owner):
+        "Release any leases held by ``owner``"
+        return self.get_queryset().release(owner)
+
+    def renew(self, owner, now=None):
+        "Extend any leases held by ``owner``"
+        return self.get_queryset().renew(owner, now)
+
+    def update_counts(self):
+        "Update the cached unread and total counts"
+        return self.get_queryset().update_counts()
 
     def update_count_total(self):
         "Update the cached total counts"
@@ -109,10 +570,18 @@ class FeedManager(models.Manager):
         "Update the cached unread counts"
         return self.get_queryset().update_count_unread()
 
+    def adjust_counts(self, unread=None, total=None):
+        "Adjust the cached counts by deltas, without recounting"
+        return self.get_queryset().adjust_counts(unread, total)
+
     def count_unread(self):
         "Get a dict of unread counts, with feed pks as keys"
         return self.get_queryset().count_unread()
 
+    def count_entries(self, state=None):
+        "Return the number of entries from the cached counts"
+        return self.get_queryset().count_entries(state)
+
     def get_queryset(self):
         "Return a FeedQuerySet"
         return FeedQuerySet(self.model)
@@ -121,6 +590,16 @@ class FeedManager(models.Manager):
 ###############################################################################
 #                                                               Entry model
 
+# Maximum number of values in a single ``IN`` lookup when matching entries
+MATCH_CHUNK_SIZE = 500
+
+
+def _chunks(values, size):
+    "Split an iterable of values into lists of no more than ``size`` items"
+    values = list(values)
+    for i in range(0, len(values), size):
+        yield values[i : i + size]
+
 
 class EntryQuerySet(models.query.QuerySet):
     def user(self, user):
@@ -139,25 +618,94 @@ class EntryQuerySet(models.query.QuerySet):
         "Filter to saved entries"
         return self.filter(state=ENTRY_SAVED)
 
+    def ordered(self, order=ORDER_DESC):
+        """
+        Order by date, then by pk so that every entry has its own place in the
+        order for keyset pagination
+        """
+        if order == ORDER_ASC:
+            return self.order_by("date", "pk")
+        return self.order_by("-date", "-pk")
+
+    def after(self, date, pk, order=ORDER_DESC):
+        """
+        Filter to entries which come after the entry with the given date and pk
+        in ``order``, as ordered by ``ordered``
+        """
+        lookup = "gt" if order == ORDER_ASC else "lt"
+        # The redundant bound lets the database seek to the date in an index
+        return self.filter(
+            models.Q(**{"date__%se" % lookup: date}),
+            models.Q(**{"date__%s" % lookup: date})
+            | models.Q(**{"pk__%s" % lookup: pk}),
+        )
+
+    def before(self, date, pk, order=ORDER_DESC):
+        """
+        Filter to entries which come before the entry with the given date and pk
+        in ``order``, as ordered by ``ordered``
+        """
+        return self.after(date, pk, ORDER_DESC if order == ORDER_ASC else ORDER_ASC)
+
     def set_state(self, state, count_unread=False):
         """
-        Set a new state for these entries
+        Set a new state for these entries, and adjust their feeds' unread counts
         If count_unread=True, returns a dict of the new unread count for the
         affected feeds, {feed_pk: unread_count, ...}; if False, returns nothing
         """
-        # Get list of feed pks before the update changes this queryset
-        feed_pks = list(self.feeds().values_list("pk", flat=True))
+        Feed = apps.get_model("yarr", "Feed")
+        with transaction.atomic():
+            # Get list of feed pks before the update changes this queryset
+            feed_pks = self.feed_pks()
 
-        # Update the state
-        self.update(state=state)
+            # Find the entries which will change the unread counts
+            if state == ENTRY_UNREAD:
+                changing, sign = self.exclude(state=ENTRY_UNREAD), 1
+            else:
+                changing, sign = self.unread(), -1
 
-        # Look up affected feeds
-        feeds = apps.get_model("yarr", "Feed").objects.filter(pk__in=feed_pks)
+            # Update those a feed at a time, so deltas match the rows changed
+            deltas = {}
+            for feed_pk in changing.feed_pks():
+                changed = changing.filter(feed_id=feed_pk).update(state=state)
+                deltas[feed_pk] = sign * changed
+
+            # Update the state of the rest, eg read to saved
+            self.exclude(state=state).update(state=state)
+
+            Feed.objects.adjust_counts(unread=deltas)
 
-        # Update the unread counts for affected feeds
-        feeds.update_count_unread()
         if count_unread:
-            return feeds.count_unread()
+            return Feed.objects.filter(pk__in=feed_pks).count_unread()
+
+    def delete(self):
+        """
+        Delete these entries, and adjust their feeds' unread and total counts
+        """
+        Feed = apps.get_model("yarr", "Feed")
+        deleted = 0
+        with transaction.atomic():
+            unread = {}
+            total = {}
+            for feed_pk in self.feed_pks():
+                # Delete a feed at a time, so deltas match the rows deleted
+                entries = self.filter(feed_id=feed_pk)
+                unread_count, _ = super(EntryQuerySet, entries.unread()).delete()
+                other_count, _ = super(EntryQuerySet, entries).delete()
+                unread[feed_pk] = -unread_count
+                total[feed_pk] = -(unread_count + other_count)
+                deleted += unread_count + other_count
+
+            Feed.objects.adjust_counts(unread=unread, total=total)
+
+        return deleted, {self.model._meta.label: deleted}
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    def feed_pks(self):
+        "Get a set of pks of feeds associated with entries"
+        return set(self.order_by().values_list("feed_id", flat=True).distinct())
 
     def feeds(self):
         "Get feeds associated with entries"
@@ -179,6 +727,20 @@ class EntryQuerySet(models.query.QuerySet):
         "Update feed read count cache"
         return self.feeds().update_count_unread()
 
+    def match(self, fingerprints):
+        """
+        Find entries for a list of fingerprints from ``Entry.make_fingerprint``
+
+        Returns a dict of ``{fingerprint: entry}`` for fingerprints which matched,
+        looked up in chunks of ``MATCH_CHUNK_SIZE``. If more than one entry has a
+        fingerprint, the first in the queryset's ordering will be used.
+        """
+        matched = {}
+        for chunk in _chunks(set(fingerprints), MATCH_CHUNK_SIZE):
+            for entry in self.filter(fingerprint__in=chunk):
+                matched.setdefault(entry.fingerprint, entry)
+        return matched
+
 
 class EntryManager(models.Manager):
     def user(self, user):
@@ -197,6 +759,18 @@ class EntryManager(models.Manager):
         "Get saved entries"
         return self.get_queryset().saved()
 
+    def ordered(self, order=ORDER_DESC):
+        "Order by date, then by pk"
+        return self.get_queryset().ordered(order)
+
+    def after(self, date, pk, order=ORDER_DESC):
+        "Entries which come after the entry with the given date and pk"
+        return self.get_queryset().after(date, pk, order)
+
+    def before(self, date, pk, order=ORDER_DESC):
+        "Entries which come before the entry with the given date and pk"
+        return self.get_queryset().before(date, pk, order)
+
     def set_state(self, state):
         "Set a new state for these entries, and update unread count"
         return self.get_queryset().set_state(state)
@@ -205,12 +779,17 @@ class EntryManager(models.Manager):
         "Update feed read count cache"
         return self.get_queryset().update_feed_unread()
 
+    def match(self, fingerprints):
+        "Find entries for a list of fingerprints from ``Entry.make_fingerprint``"
+        return self.get_queryset().match(fingerprints)
+
     def from_feedparser(self, raw):
         """
         Create an Entry object from a raw feedparser entry
 
         Arguments:
-            raw         The raw feedparser entry
+            raw         The raw feedparser entry, or ``EntryValues`` already
+                        made from one by ``yarr.pipeline.clean_entry``
 
         Returns:
             entry       An Entry instance (not saved)
@@ -242,46 +821,9 @@ class EntryManager(models.Manager):
             vcard
             xfn
         """
-        # Create a new entry
-        entry = self.model()
-
-        # Get the title and sanitise completely
-        title = raw.get("title", "")
-        title = bleach.clean(title, tags=[], strip=True)
-        title = html.unescape(title)
-        entry.title = title
-
-        # Get the content and sanitise according to settings
-        content = raw.get("content", [{"value": ""}])[0]["value"]
-        if not content:
-            content = raw.get("description", "")
-        css_sanitizer = CSSSanitizer(settings.ALLOWED_STYLES)
-        content = bleach.clean(
-            content,
-            tags=settings.ALLOWED_TAGS,
-            attributes=settings.ALLOWED_ATTRIBUTES,
-            css_sanitizer=css_sanitizer,
-            strip=True,
-        )
-        entry.content = content
-
-        # Order: updated, published, created
-        # If not provided, needs to be None for update comparison
-        # Will default to current time when saved
-        date = raw.get(
-            "updated_parsed",
-            raw.get("published_parsed", raw.get("created_parsed", None)),
-        )
-        if date is not None:
-            entry.date = timezone.make_aware(
-                datetime.datetime.fromtimestamp(time.mktime(date))
-            )
-
-        entry.url = raw.get("link", "")
-        entry.guid = raw.get("guid", entry.url)
-
-        entry.author = raw.get("author", "")
-        entry.comments_url = raw.get("comments", "")
+        # Entries cleaned in a worker process don't need sanitising again
+        values = raw if isinstance(raw, EntryValues) else clean_entry(raw)
+        entry = self.model(**values)
 
         # ++ TODO: tags
         """
@@ -297,3 +839,120 @@ class EntryManager(models.Manager):
         Return an EntryQuerySet
         """
         return EntryQuerySet(self.model)
+
+
+###############################################################################
+#                                                               Entry content
+
+# Maximum number of orphaned contents to delete at once
+DELETE_CHUNK_SIZE = 1000
+
+# Minimum time since a content was last stored before it can be deleted, so that
+# a content is not deleted between being stored and its entries being saved
+ORPHAN_MIN_AGE = datetime.timedelta(hours=1)
+
+
+def content_digest(content):
+    "Return the SHA-256 hex digest which identifies sanitised entry content"
+    return hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class EntryContentQuerySet(models.query.QuerySet):
+    def store(self, contents):
+        """
+        Store contents which are not already stored, and return a dict of
+        ``{content: EntryContent}`` for every content given
+
+        Existing contents are found by digest in chunks of ``MATCH_CHUNK_SIZE``,
+        and new contents added with a single bulk insert. Contents added by
+        another process at the same time are ignored and looked up again.
+
+        Existing contents which haven't been stored for half of
+        ``ORPHAN_MIN_AGE`` are marked as stored now before they are looked up,
+        so ``delete_orphaned`` can't delete them before their entries are saved.
+        """
+        now = timezone.now()
+        digests = {content_digest(content): content for content in set(contents)}
+        pks = {}
+        for chunk in _chunks(digests, MATCH_CHUNK_SIZE):
+            self.filter(digest__in=chunk, stored__lt=now - ORPHAN_MIN_AGE / 2).update(
+                stored=now
+            )
+            pks.update(self.filter(digest__in=chunk).values_list("digest", "pk"))
+
+        missing = [digest for digest in digests if digest not in pks]
+        if missing:
+            self.bulk_create(
+                [
+                    self.model(digest=digest, content=digests[digest], stored=now)
+                    for digest in missing
+                ],
+                ignore_conflicts=True,
+            )
+            for chunk in _chunks(missing, MATCH_CHUNK_SIZE):
+                pks.update(self.filter(digest__in=chunk).values_list("digest", "pk"))
+
+        return {
+            content: self.model(pk=pks[digest], digest=digest, content=content)
+            for digest, content in digests.items()
+        }
+
+    def orphaned(self):
+        "Filter to contents which are not used by any entries"
+        Entry = apps.get_model("yarr", "Entry")
+        return self.annotate(
+            used=models.Exists(Entry.objects.filter(body=models.OuterRef("pk")))
+        ).filter(used=False)
+
+    def stale(self, now=None):
+        "Filter to contents which haven't been stored for ``ORPHAN_MIN_AGE``"
+        return self.filter(stored__lt=(now or timezone.now()) - ORPHAN_MIN_AGE)
+
+    def delete_orphaned(self):
+        """
+        Delete contents which are not used by any entries, in chunks of
+        ``DELETE_CHUNK_SIZE``, and return the number deleted
+
+        Contents stored in the last ``ORPHAN_MIN_AGE`` are kept, as their entries
+        may still be being saved by a feed check.
+        """
+        deleted = 0
+        now = timezone.now()
+        pks = self.stale(now).orphaned().order_by("pk").values_list("pk", flat=True)
+        last_pk = None
+        while True:
+            chunk = pks if last_pk is None else pks.filter(pk__gt=last_pk)
+            chunk = list(chunk[:DELETE_CHUNK_SIZE])
+            if not chunk:
+                break
+            # Check again, in case an entry has started using one since
+            deleted += (
+                self.model.objects.filter(pk__in=chunk)
+                .stale(now)
+                .orphaned()
+                .delete()[0]
+            )
+            last_pk = chunk[-1]
+        return deleted
+
+
+class EntryContentManager(models.Manager):
+    def store(self, contents):
+        "Store contents which are not already stored, and return them by content"
+        return self.get_queryset().store(contents)
+
+    def orphaned(self):
+        "Contents which are not used by any entries"
+        return self.get_queryset().orphaned()
+
+    def stale(self, now=None):
+        "Contents which haven't been stored for ``ORPHAN_MIN_AGE``"
+        return self.get_queryset().stale(now)
+
+    def delete_orphaned(self):
+        "Delete contents which are not used by any entries"
+        return self.get_queryset().delete_orphaned()
+
+    def get_queryset(self):
+        "Return an EntryContentQuerySet"
+        return EntryContentQuerySet(self.model)
@@ -0,0 +1,29 @@
+# Generated by Django 3.2.25 on 2026-10-18 16:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("yarr", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="feed",
+            name="etag",
+            field=models.TextField(
+                blank=True,
+                help_text="ETag of the last response, for conditional requests",
+            ),
+        ),
+        migrations.AddField(
+            model_name="feed",
+            name="modified",
+            field=models.TextField(
+                blank=True,
+                help_text="Last-Modified of the last response, for conditional requests",
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 3.2.25 on 2026-10-18 16:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("yarr", "0002_feed_conditional_get"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="feed",
+            name="body_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 digest of the last feed document, to detect changes",
+                max_length=64,
+            ),
+        ),
+    ]
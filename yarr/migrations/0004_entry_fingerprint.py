@@ -0,0 +1,69 @@
+# Generated by Django 3.2.25 on 2026-10-18 16:15
+
+import datetime
+import hashlib
+
+from django.db import migrations, models
+
+
+# Number of entries to update at once
+CHUNK_SIZE = 1000
+
+
+def make_fingerprint(entry):
+    """
+    Frozen copy of ``Entry.make_fingerprint`` at the time of this migration
+    """
+    if entry.guid:
+        key = "guid:%s" % entry.guid
+    elif entry.url:
+        key = "url:%s" % entry.url
+    elif entry.title and entry.date:
+        key = "title_date:%s\0%s" % (
+            entry.title,
+            entry.date.astimezone(datetime.timezone.utc).isoformat(),
+        )
+    else:
+        return ""
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def backfill_fingerprints(apps, schema_editor):
+    Entry = apps.get_model("yarr", "Entry")
+    entries = Entry.objects.order_by("pk").only("pk", "guid", "url", "title", "date")
+    last_pk = 0
+    while True:
+        chunk = list(entries.filter(pk__gt=last_pk)[:CHUNK_SIZE])
+        if not chunk:
+            break
+        for entry in chunk:
+            entry.fingerprint = make_fingerprint(entry)
+        Entry.objects.bulk_update(chunk, ["fingerprint"])
+        last_pk = chunk[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("yarr", "0003_feed_body_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="entry",
+            name="fingerprint",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Hash of the guid, url, or title and date, to match entries",
+                max_length=40,
+            ),
+        ),
+        migrations.RunPython(backfill_fingerprints, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="entry",
+            index=models.Index(
+                fields=["feed", "fingerprint"], name="yarr_entry_fingerprint"
+            ),
+        ),
+    ]
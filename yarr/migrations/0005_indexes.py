@@ -0,0 +1,31 @@
+# Generated by Django 3.2.25 on 2026-10-18 16:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("yarr", "0004_entry_fingerprint"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="entry",
+            index=models.Index(
+                fields=["feed", "state", "date"], name="yarr_entry_feed_state_date"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="entry",
+            index=models.Index(fields=["expires"], name="yarr_entry_expires"),
+        ),
+        migrations.AddIndex(
+            model_name="feed",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["next_check"],
+                name="yarr_feed_active_next_check",
+            ),
+        ),
+    ]
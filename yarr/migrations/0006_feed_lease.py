@@ -0,0 +1,33 @@
+# Generated by Django 3.2.25 on 2026-10-18 16:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("yarr", "0005_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="feed",
+            name="lease_expires",
+            field=models.DateTimeField(
+                blank=True,
+                editable=False,
+                help_text="When the lease expires and the feed can be claimed again",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="feed",
+            name="lease_owner",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Name of the worker which has claimed this feed for checking",
+                max_length=255,
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 3.2.25 on 2026-10-18 16:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("yarr", "0006_feed_lease"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="feed",
+            name="skip_days",
+            field=models.CharField(
+                blank=True,
+                help_text="Comma-separated days the feed says not to check it",
+                max_length=100,
+            ),
+        ),
+        migrations.AddField(
+            model_name="feed",
+            name="skip_hours",
+            field=models.CharField(
+                blank=True,
+                help_text="Comma-separated hours (GMT) the feed says not to check it",
+                max_length=100,
+            ),
+        ),
+        migrations.AddField(
+            model_name="feed",
+            name="ttl",
+            field=models.IntegerField(
+                blank=True,
+                help_text="Minutes the feed says it stays fresh, from ttl or sy:updatePeriod",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 3.2.25 on 2026-10-18 16:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("yarr", "0007_feed_freshness"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="feed",
+            name="failures",
+            field=models.IntegerField(
+                default=0, help_text="Number of consecutive checks which have failed"
+            ),
+        ),
+    ]
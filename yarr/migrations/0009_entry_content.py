@@ -0,0 +1,107 @@
+# Generated by Django 3.2.25 on 2026-10-18 17:20
+
+import hashlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Number of entries to update at once; within SQLite's limit on query parameters
+CHUNK_SIZE = 500
+
+
+def content_digest(content):
+    """
+    Frozen copy of ``yarr.managers.content_digest`` at the time of this migration
+    """
+    return hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def store_content(apps, schema_editor):
+    "Move the content of each entry into EntryContent"
+    Entry = apps.get_model("yarr", "Entry")
+    EntryContent = apps.get_model("yarr", "EntryContent")
+    entries = Entry.objects.order_by("pk").only("pk", "content")
+    last_pk = 0
+    while True:
+        chunk = list(entries.filter(pk__gt=last_pk)[:CHUNK_SIZE])
+        if not chunk:
+            break
+
+        digests = {content_digest(entry.content): entry.content for entry in chunk}
+        pks = dict(
+            EntryContent.objects.filter(digest__in=digests).values_list("digest", "pk")
+        )
+        EntryContent.objects.bulk_create(
+            EntryContent(digest=digest, content=content)
+            for digest, content in digests.items()
+            if digest not in pks
+        )
+        pks = dict(
+            EntryContent.objects.filter(digest__in=digests).values_list("digest", "pk")
+        )
+
+        for entry in chunk:
+            entry.body_id = pks[content_digest(entry.content)]
+        Entry.objects.bulk_update(chunk, ["body"])
+        last_pk = chunk[-1].pk
+
+
+def restore_content(apps, schema_editor):
+    "Copy the content of each entry back from EntryContent"
+    Entry = apps.get_model("yarr", "Entry")
+    EntryContent = apps.get_model("yarr", "EntryContent")
+    Entry.objects.filter(body__isnull=False).update(
+        content=models.Subquery(
+            EntryContent.objects.filter(pk=models.OuterRef("body")).values("content")[
+                :1
+            ]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("yarr", "0008_feed_failures"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EntryContent",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "digest",
+                    models.CharField(
+                        help_text="SHA-256 hex digest of the content",
+                        max_length=64,
+                        unique=True,
+                    ),
+                ),
+                ("content", models.TextField(blank=True)),
+            ],
+            options={
+                "verbose_name_plural": "entry contents",
+            },
+        ),
+        migrations.AddField(
+            model_name="entry",
+            name="body",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="entries",
+                to="yarr.entrycontent",
+            ),
+        ),
+        migrations.RunPython(store_content, restore_content),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 3.2.25 on 2026-10-18 17:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("yarr", "0009_entry_content"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="entry",
+            name="content",
+        ),
+        migrations.AlterField(
+            model_name="entry",
+            name="body",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="entries",
+                to="yarr.entrycontent",
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 3.2.25 on 2026-10-18 17:36
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("yarr", "0010_entry_content_required"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="entrycontent",
+            name="stored",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                help_text="When the content was last stored",
+            ),
+        ),
+    ]
@@ -3,17 +3,17 @@ Yarr models
 """
 
 import datetime
+import hashlib
 import time
-from urllib.error import URLError
 
 from django.conf import settings as django_settings
 from django.core.validators import URLValidator
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 import feedparser
 
-from yarr import managers, settings
+from yarr import fetch, fragments, freshness, managers, settings
 from yarr.constants import ENTRY_READ, ENTRY_SAVED, ENTRY_UNREAD
 
 
@@ -36,6 +36,9 @@ class NullFile(object):
 
 nullfile = NullFile()
 
+# Number of recent entries to estimate a feed's publishing rate from
+ADAPTIVE_ENTRIES = 10
+
 
 ###############################################################################
 #                                                               Exceptions
@@ -60,6 +63,16 @@ class InactiveFeedError(FeedError):
     pass
 
 
+class FeedUnchanged(Exception):
+    """
+    The feed has not changed since it was last checked, so has not been parsed
+
+    The reason is available as the exception message.
+    """
+
+    pass
+
+
 class EntryError(Exception):
     """
     An error occurred when processing an entry
@@ -103,7 +116,6 @@ class Feed(models.Model):
         tags
         textinput
         title
-        ttl
     """
 
     # Compulsory data fields
@@ -148,6 +160,52 @@ class Feed(models.Model):
     error = models.CharField(
         blank=True, max_length=255, help_text="When a problem occurs"
     )
+    failures = models.IntegerField(
+        default=0, help_text="Number of consecutive checks which have failed"
+    )
+    etag = models.TextField(
+        blank=True, help_text="ETag of the last response, for conditional requests"
+    )
+    modified = models.TextField(
+        blank=True,
+        help_text="Last-Modified of the last response, for conditional requests",
+    )
+    body_hash = models.CharField(
+        blank=True,
+        max_length=64,
+        help_text="SHA-256 digest of the last feed document, to detect changes",
+    )
+
+    # Freshness declared by the publisher in the feed
+    ttl = models.IntegerField(
+        blank=True,
+        null=True,
+        help_text="Minutes the feed says it stays fresh, from ttl or sy:updatePeriod",
+    )
+    skip_hours = models.CharField(
+        blank=True,
+        max_length=100,
+        help_text="Comma-separated hours (GMT) the feed says not to check it",
+    )
+    skip_days = models.CharField(
+        blank=True,
+        max_length=100,
+        help_text="Comma-separated days the feed says not to check it",
+    )
+
+    # Lease held by a worker while it checks the feed
+    lease_owner = models.CharField(
+        blank=True,
+        max_length=255,
+        editable=False,
+        help_text="Name of the worker which has claimed this feed for checking",
+    )
+    lease_expires = models.DateTimeField(
+        blank=True,
+        null=True,
+        editable=False,
+        help_text="When the lease expires and the feed can be claimed again",
+    )
 
     # Cached data
     count_unread = models.IntegerField(
@@ -159,37 +217,299 @@ class Feed(models.Model):
 
     objects = managers.FeedManager()
 
+    # Cached counts and leases, which are maintained by the managers
+    COUNT_FIELDS = ["count_unread", "count_total"]
+    LEASE_FIELDS = ["lease_owner", "lease_expires"]
+
     def __str__(self):
         return str(self.text or self.title)
 
+    def save(self, *args, **kwargs):
+        # The cached counts and leases are changed in the database by the managers,
+        # so an existing feed must not overwrite them with the values it was
+        # loaded with
+        if (
+            not self._state.adding
+            and not kwargs.get("force_insert")
+            and kwargs.get("update_fields") is None
+        ):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.COUNT_FIELDS + self.LEASE_FIELDS
+            ]
+        super(Feed, self).save(*args, **kwargs)
+
     def update_count_unread(self):
-        """Update the cached unread count"""
+        """Recount and save the cached unread count"""
         self.count_unread = self.entries.unread().count()
+        self.save(update_fields=["count_unread"])
 
     def update_count_total(self):
-        """Update the cached total item count"""
+        """Recount and save the cached total item count"""
         self.count_total = self.entries.count()
+        self.save(update_fields=["count_total"])
+
+    def is_due(self, now=None):
+        """
+        Return True if the feed is due for a check before the next poll
+
+        A feed is due if it has never been checked, if it was due in the past, or
+        if it will become due in the next ``MINIMUM_INTERVAL`` minutes.
+        """
+        if now is None:
+            now = timezone.now()
+        next_poll = now + datetime.timedelta(minutes=settings.MINIMUM_INTERVAL)
+        return self.next_check is None or self.next_check < next_poll
+
+    def check_interval(self, now, previous=None, changed=None):
+        """
+        Return a tuple of the number of minutes until the next check, and why
+
+        Arguments:
+            now         Time of this check
+            previous    Previous interval in minutes, if known
+            changed     True if this check found the feed had changed, False if it
+                        had not, or None if the check failed
+
+        An explicit ``check_frequency`` always wins. Otherwise the interval is
+        ``FREQUENCY``, unless ``ADAPTIVE_INTERVAL`` is enabled:
+
+        * the interval is half the average time between the most recent entries,
+          measured up to ``now`` so that a feed which stops posting slows down
+        * if the feed had not changed, it is at least 1.5 times the previous
+          interval
+        * adaptive intervals are kept between ``MINIMUM_INTERVAL`` and
+          ``MAXIMUM_INTERVAL``
+
+        If the check failed and the feed has failed more than once in a row, the
+        interval is doubled for each consecutive failure after the first, up to
+        ``MAXIMUM_INTERVAL`` (or the interval, if that is longer).
+        """
+        if self.check_frequency:
+            interval, reason = self.check_frequency, "check frequency"
+        elif not settings.ADAPTIVE_INTERVAL:
+            interval, reason = settings.FREQUENCY, "default frequency"
+        else:
+            interval, reason = self._adaptive_interval(now, previous, changed)
+
+        if changed is None and self.failures > 1:
+            backoff = min(
+                interval * 2 ** (self.failures - 1),
+                max(interval, settings.MAXIMUM_INTERVAL),
+            )
+            if backoff > interval:
+                interval = backoff
+                reason += ", backing off after %s failures" % self.failures
+
+        return int(interval), reason
+
+    def _adaptive_interval(self, now, previous, changed):
+        "Estimate the interval for ``check_interval``"
+        dates = list(
+            self.entries.filter(date__lte=now)
+            .order_by("-date")
+            .values_list("date", flat=True)[:ADAPTIVE_ENTRIES]
+        )
+        if len(dates) < 2:
+            interval = settings.FREQUENCY
+            reason = "too few entries to estimate"
+        else:
+            period = (now - dates[-1]).total_seconds() / 60
+            interval = period / len(dates) / 2
+            reason = "%s entries in %d minutes" % (len(dates), period)
+
+        if changed is False and previous and previous * 1.5 > interval:
+            interval = previous * 1.5
+            reason = "unchanged, backing off from %d minutes" % previous
+
+        if interval < settings.MINIMUM_INTERVAL:
+            interval = settings.MINIMUM_INTERVAL
+            reason += ", raised to minimum"
+        elif interval > settings.MAXIMUM_INTERVAL:
+            interval = settings.MAXIMUM_INTERVAL
+            reason += ", lowered to maximum"
+        return interval, reason
+
+    def declared_freshness(self, now):
+        """
+        Return a tuple of the time the publisher says the feed will next change,
+        and why, or ``(None, None)`` if they have not said
+
+        This is the latest of the ``Cache-Control``, ``Expires`` and ``Retry-After``
+        headers of the last response, and the feed's ``ttl`` since ``now``.
+        """
+        declared = list(getattr(self, "_declared", []))
+        if self.ttl:
+            declared.append((now + datetime.timedelta(minutes=self.ttl), "feed ttl"))
+        if not declared:
+            return None, None
+        return max(declared, key=lambda item: item[0])
+
+    def _set_next_check(self, now, previous, changed, logfile):
+        """
+        Schedule the next check using ``check_interval``, and report it
+
+        If the publisher has said the feed will not change until later, the check
+        is put back until then, but no further than ``MAXIMUM_INTERVAL`` (or the
+        interval, if longer). It is then moved out of any ``skipHours`` and
+        ``skipDays``.
+        """
+        interval, reason = self.check_interval(now, previous, changed)
+        next_check = now + datetime.timedelta(minutes=interval)
+
+        declared, declared_reason = self.declared_freshness(now)
+        if declared is not None and declared > next_check:
+            limit = now + datetime.timedelta(
+                minutes=max(interval, settings.MAXIMUM_INTERVAL)
+            )
+            next_check = min(declared, limit)
+            reason += ", put back by %s" % declared_reason
+
+        skip_hours = [int(hour) for hour in self.skip_hours.split(",") if hour]
+        skip_days = [day for day in self.skip_days.split(",") if day]
+        allowed = freshness.next_allowed(next_check, skip_hours, skip_days)
+        if allowed != next_check:
+            next_check = allowed
+            reason += ", moved out of skipHours/skipDays"
+
+        self.next_check = next_check
+        minutes = int((next_check - now).total_seconds() // 60)
+        logfile.write("Next check in %s minutes (%s)" % (minutes, reason))
+
+    def _set_declared(self, response):
+        """
+        Note when the response says the feed will next be fresh, or when to retry
+        """
+        now = timezone.now()
+        self._declared = []
+        fresh_until = freshness.fresh_until(response.headers, now)
+        if fresh_until is not None:
+            self._declared.append((fresh_until, "cache headers"))
+        if response.status in (429, 503):
+            retry_after = freshness.retry_after(response.headers, now)
+            if retry_after is not None:
+                self._declared.append((retry_after, "Retry-After"))
+
+    def _set_publisher_schedule(self, feed, body):
+        "Store the ttl, skipHours and skipDays from a successfully parsed feed"
+        self.ttl = freshness.feed_ttl(feed)
+        skip_hours, skip_days = freshness.skip_times(body)
+        self.skip_hours = ",".join(str(hour) for hour in skip_hours)
+        self.skip_days = ",".join(skip_days)
+
+    def conditional_headers(self, force=False):
+        """
+        Return a dict of conditional request headers for the next fetch
+
+        If ``force`` is True, no conditions will be set, so the full feed will be
+        returned by the server.
+        """
+        headers = {}
+        if not force:
+            if self.etag:
+                headers["If-None-Match"] = self.etag
+            if self.modified:
+                headers["If-Modified-Since"] = self.modified
+        return headers
+
+    def prefetch_feed(self, response=None, force=False):
+        """
+        Fetch and parse the feed without writing anything to the database
+
+        If a ``yarr.fetch.Response`` is provided, it will be parsed instead of
+        fetching the feed.
 
-    def _fetch_feed(self, url_history=None):
+        Returns a callable which takes no arguments, and will either return the
+        result of ``_fetch_feed`` or raise its exception. This can be called
+        from a worker thread, and the callable passed to ``check_feed`` as
+        ``fetch`` so that the database is only updated by the calling thread.
+        """
+        try:
+            result = self._fetch_feed(response=response, force=force)
+        except (FeedError, FeedUnchanged) as e:
+            error = e
+
+            def fetch():
+                raise error
+
+        else:
+
+            def fetch():
+                return result
+
+        return fetch
+
+    def _set_validators(self, response, keep=False):
+        """
+        Set the ETag and Last-Modified from a response for the next request
+
+        If ``keep`` is True, values missing from the response will not be cleared.
+        """
+        for attr, header in (("etag", "etag"), ("modified", "last-modified")):
+            if header in response.headers or not keep:
+                setattr(self, attr, response.headers.get(header, ""))
+
+    def _fetch_feed(self, response=None, force=False):
         """
         Internal method to get the feed from the specified URL
         Follows good practice
+
+        If a ``yarr.fetch.Response`` is provided, the feed will be parsed from
+        that instead of being requested.
+
+        Unless ``force`` is True, the request will be conditional on the ETag and
+        Last-Modified values of the previous response, and the document will not
+        be parsed if it is identical to the last one. The new values will be set
+        on the feed, but not saved.
+
+        Redirects have already been followed by the fetch; if they were all
+        permanent, the new URL is set on the feed, but not saved, and the document
+        is used as if it had been requested from there.
+
         Returns:
             feed    Feed data, or None if there was a temporary error
             entries List of entries
         Raises:
-            FetchError  Feed fetch suffered permanent failure
+            FetchError      Feed fetch suffered permanent failure
+            FeedUnchanged   Server reports the feed has not been modified, or the
+                            document is identical to the last one
         """
-        # Request and parse the feed
+        # Request the feed, unless it has already been fetched
+        if response is None:
+            response = fetch.fetch(self.feed_url, self.conditional_headers(force))
+        if response.error is not None:
+            e = response.error
+            if isinstance(e, fetch.RedirectError):
+                raise InactiveFeedError("Circular redirection found")
+            raise FeedError(f"Feed error: {e.__class__.__name__} - {e}")
+        status = response.status
+        self._set_declared(response)
+
+        # Permanent redirection - the document is from the new URL
+        if status == 301:
+            self.feed_url = response.url
+            status = 200
+
+        # Not modified since the last check - nothing was sent to parse
+        if status == 304:
+            self._set_validators(response, keep=True)
+            raise FeedUnchanged("not modified")
+
+        # Byte-identical to the last document - no need to parse it again
+        digest = response.digest()
+        if not force and status in (200, 302, 307) and digest == self.body_hash:
+            self._set_validators(response)
+            raise FeedUnchanged("hash")
+
+        # Parse the feed
         try:
-            d = feedparser.parse(self.feed_url)
-        except URLError as e:
-            raise FeedError(f"URL error: {e.reason}")
+            d = response.parse()
         except Exception as e:
             # Unrecognised exception
             raise FeedError(f"Feed error: {e.__class__.__name__} - {e}")
 
-        status = d.get("status", 200)
         feed = d.get("feed", None)
         entries = d.get("entries", [])
 
@@ -202,8 +522,10 @@ class Feed(models.Model):
         # cleanly, so explicitly mention the exception class
         if d.get("bozo") == 1:
             bozo = d["bozo_exception"]
+            # A bozo from a worker process is a ParseError naming the original
+            name = getattr(bozo, "class_name", bozo.__class__.__name__)
             raise FeedError(
-                "Feed error: %s - %s" % (bozo.__class__.__name__, bozo),
+                "Feed error: %s - %s" % (name, bozo),
                 feed=feed,
                 entries=entries,
             )
@@ -211,41 +533,28 @@ class Feed(models.Model):
         # Accepted status:
         #   200 OK
         #   302 Temporary redirect
-        #   304 Not Modified
         #   307 Temporary redirect
-        if status in (200, 302, 304, 307):
+        if status in (200, 302, 307):
             # Check for valid feed
             if feed is None or "title" not in feed or "link" not in feed:
                 raise FeedError("Feed parsed but with invalid contents")
 
-            # OK
+            # OK - keep validators and digest to detect changes next time
+            self._set_validators(response)
+            self.body_hash = digest
+            self._set_publisher_schedule(feed, response.body)
             return feed, entries
 
         # Temporary errors:
         #   404 Not Found
+        #   429 Too Many Requests
         #   500 Internal Server Error
         #   502 Bad Gateway
         #   503 Service Unavailable
         #   504 Gateway Timeout
-        if status in (404, 500, 502, 503, 504):
+        if status in (404, 429, 500, 502, 503, 504):
             raise FeedError("Temporary error %s" % status)
 
-        # Follow permanent redirection
-        if status == 301:
-            # Log url
-            if url_history is None:
-                url_history = []
-            url_history.append(self.feed_url)
-
-            # Avoid circular redirection
-            self.feed_url = d.get("href", self.feed_url)
-            if self.feed_url in url_history:
-                raise InactiveFeedError("Circular redirection found")
-
-            # Update feed and try again
-            self.save()
-            return self._fetch_feed(url_history)
-
         # Feed gone
         if status == 410:
             raise InactiveFeedError("Feed has gone")
@@ -253,7 +562,7 @@ class Feed(models.Model):
         # Unknown status
         raise FeedError("Unrecognised HTTP status %s" % status)
 
-    def check_feed(self, force=False, read=False, logfile=None):
+    def check_feed(self, force=False, read=False, logfile=None, fetch=None):
         """
         Check the feed for updates
 
@@ -261,6 +570,8 @@ class Feed(models.Model):
             force       Force an update
             read        Mark new entries as read
             logfile     Logfile to print report data
+            fetch       Callable to use instead of ``_fetch_feed``, eg the
+                        result of ``prefetch_feed``
 
         It will update if:
         * ``force==True``
@@ -268,33 +579,25 @@ class Feed(models.Model):
         * it was due for an update in the past
         * it is due for an update in the next ``MINIMUM_INTERVAL`` minutes
 
-        Note: because feedparser refuses to support timeouts, this method could
-        block on an unresponsive connection.
-
-        The official feedparser solution is to set the global socket timeout,
-        but that is not thread safe, so has not been done here in case it
-        affects the use of sockets in other installed django applications.
-
-        New code which calls this method directly must use the decorator
-        ``yarr.decorators.with_socket_timeout`` to avoid blocking requests.
+        The feed is requested with the connect, read and total timeouts from the
+        settings (see ``yarr.fetch.Timeout``), without changing the global socket
+        timeout, so this can be called from worker threads. It could still take
+        up to ``FETCH_TIMEOUT`` seconds, and longer to parse a large feed, so it
+        should not be called as a direct result of a web request without care.
 
-        For this reason, and the fact that it could take a relatively long time
-        to parse a feed, this method should never be called as a direct result
-        of a web request.
-
-        Note: after this is called, feed unread and total count caches will be
-        incorrect, and must be recalculated with the appropriate management
-        commands.
+        The feed's unread and total count caches are adjusted in the database as
+        entries are added and removed, so the values on this instance will be out
+        of date afterwards.
         """
         # Call _do_check and save if anything has changed
-        changed = self._do_check(force, read, logfile)
+        changed = self._do_check(force, read, logfile, fetch)
         if changed:
             self.save()
 
         # Remove expired entries
         self.entries.filter(expires__lte=timezone.now()).delete()
 
-    def _do_check(self, force, read, logfile):
+    def _do_check(self, force, read, logfile, fetch=None):
         """
         Perform the actual check from ``check``
 
@@ -310,23 +613,35 @@ class Feed(models.Model):
 
         # Check it's due for a check before the next poll
         now = timezone.now()
-        next_poll = now + datetime.timedelta(minutes=settings.MINIMUM_INTERVAL)
-        if not force and self.next_check is not None and self.next_check >= next_poll:
+        if not force and not self.is_due(now):
             logfile.write("Not due yet")
             # Return False, because nothing has changed yet
             return False
 
         # We're about to check, update the counters
+        previous = None
+        if self.last_checked and self.next_check:
+            previous = (self.next_check - self.last_checked).total_seconds() / 60
         self.last_checked = now
-        self.next_check = now + datetime.timedelta(
-            minutes=self.check_frequency or settings.FREQUENCY
-        )
         # Note: from now on always return True, because something has changed
 
         # Fetch feed
         logfile.write("Fetching...")
+        if fetch is None:
+
+            def fetch():
+                return self._fetch_feed(force=force)
+
         try:
-            feed, entries = self._fetch_feed()
+            feed, entries = fetch()
+        except FeedUnchanged as e:
+            # Nothing to parse, so nothing more to do
+            logfile.write("Feed unchanged (%s)" % e)
+            if self.error != "":
+                self.error = ""
+            self.failures = 0
+            self._set_next_check(now, previous, False, logfile)
+            return True
         except FeedError as e:
             logfile.write("Error: %s" % e)
 
@@ -339,6 +654,8 @@ class Feed(models.Model):
             # Check for a valid feed despite error
             if e.feed is None or len(e.entries) == 0:
                 logfile.write("No valid feed")
+                self._record_failure(logfile)
+                self._set_next_check(now, previous, None, logfile)
                 return True
             logfile.write("Valid feed found")
             feed = e.feed
@@ -352,6 +669,9 @@ class Feed(models.Model):
             if self.error != "":
                 self.error = ""
 
+        # The feed was fetched, so reset the failure count
+        self.failures = 0
+
         # Try to find the updated time
         updated = feed.get("updated_parsed", feed.get("published_parsed", None))
         if updated:
@@ -362,8 +682,17 @@ class Feed(models.Model):
         # Stop if we now know it hasn't updated recently
         if not force and updated and self.last_updated and updated <= self.last_updated:
             logfile.write("Has not updated")
+            self._set_next_check(now, previous, False, logfile)
             return True
 
+        # Only process as many entries as allowed; the rest are ignored
+        if settings.MAXIMUM_ENTRIES and len(entries) > settings.MAXIMUM_ENTRIES:
+            logfile.write(
+                "Processing the first %s of %s entries"
+                % (settings.MAXIMUM_ENTRIES, len(entries))
+            )
+            entries = entries[: settings.MAXIMUM_ENTRIES]
+
         # Add or update any entries, and get latest timestamp
         try:
             latest = self._update_entries(entries, read)
@@ -371,6 +700,12 @@ class Feed(models.Model):
             if self.error:
                 self.error += ". "
             self.error += "Entry error: %s" % e
+
+            # Don't let a conditional request or digest skip this feed next time
+            self.etag = ""
+            self.modified = ""
+            self.body_hash = ""
+            self._set_next_check(now, previous, None, logfile)
             return True
 
         # Update last_updated
@@ -388,66 +723,158 @@ class Feed(models.Model):
             self.site_url = site_url
 
         logfile.write("Feed updated")
+        self._set_next_check(now, previous, True, logfile)
 
         return True
 
+    def _record_failure(self, logfile):
+        """
+        Count a failed check, and deactivate the feed if it has now failed
+        ``MAXIMUM_FAILURES`` times in a row
+        """
+        self.failures += 1
+        if (
+            self.is_active
+            and settings.MAXIMUM_FAILURES
+            and self.failures >= settings.MAXIMUM_FAILURES
+        ):
+            logfile.write("Deactivating feed after %s failures" % self.failures)
+            self.is_active = False
+            self.error = (
+                "Deactivated after %s failures: %s" % (self.failures, self.error)
+            )[: self._meta.get_field("error").max_length]
+
     def _update_entries(self, entries, read):
         """
         Add or update feedparser entries, and return latest timestamp
+
+        Entries are matched to existing entries by their fingerprint (from their
+        guid, then link, then title and date), using indexed set-based queries for
+        the whole feed. New entries are then added with a single bulk insert, and
+        re-published entries updated with a single bulk update.
         """
+        now = timezone.now()
         latest = None
-        found = []
+
+        # Create Entry objects and find what they will match on
+        parsed = []
         for raw_entry in entries:
-            # Create Entry and set feed
             entry = Entry.objects.from_feedparser(raw_entry)
-
             entry.feed = self
             entry.state = ENTRY_READ if read else ENTRY_UNREAD
-
-            # Try to match by guid, then link, then title and date
-            if entry.guid:
-                query = {"guid": entry.guid}
-            elif entry.url:
-                query = {"url": entry.url}
-            elif entry.title and entry.date:
-                # If title and date provided, this will match
-                query = {"title": entry.title, "date": entry.date}
-            else:
-                # No guid, no link, no title and date - no way to match
-                # Can never de-dupe this entry, so to avoid the risk of adding
-                # it more than once, declare this feed invalid
-                raise EntryError("No guid, link, and title or date; cannot import")
-
-            # Update existing, or delete old
-            try:
-                existing = self.entries.get(**query)
-            except self.entries.model.DoesNotExist:
-                # New entry, save
-                entry.save()
-            else:
+            entry.fingerprint = entry.make_fingerprint()
+            parsed.append(entry)
+
+        # Look up existing entries
+        existing = self.entries.match([entry.fingerprint for entry in parsed])
+
+        found = set()
+        new = {}
+        changed = {}
+        for entry in parsed:
+            key = entry.fingerprint
+            if key in existing:
                 # Existing entry
-                if entry.date is not None and entry.date > existing.date:
+                match = existing[key]
+                found.add(match.pk)
+                if entry.date is not None and entry.date > match.date:
                     # Changes - update entry
-                    existing.update(entry)
+                    match.update(entry, commit=False)
+                    changed[match.pk] = match
+
+            elif key in new:
+                # Repeated in this feed; treat as existing
+                match = new[key]
+                if entry.date is not None and entry.date > match.date:
+                    match.update(entry, commit=False)
 
-            # Note that we found this
-            found.append(entry.pk)
+            else:
+                # New entry; default the date as save() would
+                if entry.date is None:
+                    entry.date = now
+                new[key] = entry
 
             # Update latest tracker
             if latest is None or (entry.date is not None and entry.date > latest):
                 latest = entry.date
 
-        # Mark entries for expiry if:
-        #   ITEM_EXPIRY is set to expire entries
-        #   they weren't found in the feed
-        #   they have been read (excludes those saved)
-        if settings.ITEM_EXPIRY >= 0:
-            self.entries.exclude(pk__in=found).read().set_expiry()
+        with transaction.atomic():
+            # Mark entries for expiry if:
+            #   ITEM_EXPIRY is set to expire entries
+            #   they weren't found in the feed
+            #   they have been read (excludes those saved)
+            # Do this before adding new entries, which weren't in the feed before
+            if settings.ITEM_EXPIRY >= 0:
+                self.entries.exclude(pk__in=found).read().set_expiry()
+
+            EntryContent.attach(list(new.values()) + list(changed.values()))
+            Entry.objects.bulk_create(new.values())
+            if changed:
+                Entry.objects.bulk_update(changed.values(), Entry.UPDATE_FIELDS)
+
+            Feed.objects.adjust_counts(
+                unread={self.pk: 0 if read else len(new)}, total={self.pk: len(new)}
+            )
 
         return latest
 
     class Meta:
         ordering = ("title", "added")
+        indexes = [
+            # Selecting active feeds which are due a check
+            # Partial, because some backends can't use a boolean column in an index
+            # when Django filters on it as a bare condition. MySQL doesn't support
+            # partial indexes, so indexes every feed and warns (models.W037)
+            models.Index(
+                fields=["next_check"],
+                name="yarr_feed_active_next_check",
+                condition=models.Q(is_active=True),
+            )
+        ]
+
+
+###############################################################################
+#                                                               Entry content
+
+
+class EntryContent(models.Model):
+    """
+    Sanitised HTML content of entries
+
+    Entries are copied for each subscriber to a feed, so their content is stored
+    once here by its digest, and shared by every entry with the same content.
+    Contents which are no longer used are removed by
+    ``EntryContent.objects.delete_orphaned()``, once they haven't been stored
+    for ``ORPHAN_MIN_AGE``.
+    """
+
+    digest = models.CharField(
+        max_length=64, unique=True, help_text="SHA-256 hex digest of the content"
+    )
+    content = models.TextField(blank=True)
+    stored = models.DateTimeField(
+        default=timezone.now, help_text="When the content was last stored"
+    )
+
+    objects = managers.EntryContentManager()
+
+    class Meta:
+        verbose_name_plural = "entry contents"
+
+    def __str__(self):
+        return self.digest
+
+    @classmethod
+    def attach(cls, entries):
+        """
+        Set the ``body`` of entries whose content has been changed, storing any
+        new content
+        """
+        pending = [entry for entry in entries if entry.body_id is None]
+        if pending:
+            bodies = cls.objects.store(entry.content for entry in pending)
+            for entry in pending:
+                entry.body = bodies[entry.content]
 
 
 ###############################################################################
@@ -460,6 +887,10 @@ class Entry(models.Model):
 
     If creating from a feedparser entry, use Entry.objects.from_feedparser()
 
+    The content is stored in ``EntryContent``, so may be shared with other
+    entries. Setting ``content`` will look up or store the new content when the
+    entry is saved.
+
     # ++ TODO: tags
     To add tags for an entry before saving, add them to _tags, and they will be
     set by save().
@@ -481,7 +912,9 @@ class Entry(models.Model):
 
     # Compulsory data fields
     title = models.TextField(blank=True)
-    content = models.TextField(blank=True)
+    body = models.ForeignKey(
+        EntryContent, related_name="entries", on_delete=models.PROTECT
+    )
     date = models.DateTimeField(help_text="When this entry says it was published")
 
     # Optional data fields
@@ -500,31 +933,108 @@ class Entry(models.Model):
     guid = models.TextField(
         blank=True, help_text="GUID for the entry, according to the feed"
     )
+    fingerprint = models.CharField(
+        blank=True,
+        editable=False,
+        max_length=40,
+        help_text="Hash of the guid, url, or title and date, to match entries",
+    )
 
     # ++ TODO: tags
 
     objects = managers.EntryManager()
 
+    # Fields which are replaced when an entry is re-published
+    UPDATE_FIELDS = [
+        "title",
+        "body",
+        "date",
+        "author",
+        "url",
+        "comments_url",
+        "guid",
+    ]
+
+    # Content which has been set but not yet stored
+    _content = ""
+
     def __str__(self):
         return str(self.title)
 
-    def update(self, entry):
+    @property
+    def content(self):
+        "The sanitised HTML content"
+        if self.body_id is None:
+            return self._content
+        return self.body.content
+
+    @content.setter
+    def content(self, content):
+        self._content = content
+        self.body_id = None
+
+    def make_fingerprint(self):
+        """
+        Return the fingerprint to match this entry against existing entries
+
+        Entries are matched by guid, then link, then title and date; the
+        fingerprint is a SHA-1 hex digest of the first of those available.
+
+        Raises an EntryError if there is no way to match the entry.
+        """
+        if self.guid:
+            key = "guid:%s" % self.guid
+        elif self.url:
+            key = "url:%s" % self.url
+        elif self.title and self.date:
+            # If title and date provided, this will match
+            key = "title_date:%s\0%s" % (
+                self.title,
+                self.date.astimezone(datetime.timezone.utc).isoformat(),
+            )
+        else:
+            # No guid, no link, no title and date - no way to match
+            # Can never de-dupe this entry, so to avoid the risk of adding
+            # it more than once, declare this feed invalid
+            raise EntryError("No guid, link, and title or date; cannot import")
+
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def update(self, entry, commit=True):
         """
         An old entry has been re-published; update with new data
+
+        If ``commit`` is False, the entry will not be saved. The rendered entry
+        for the old data is removed from the fragment cache.
         """
-        fields = ["title", "content", "date", "author", "url", "comments_url", "guid"]
-        for field in fields:
-            setattr(self, field, getattr(entry, field))
+        fragments.invalidate(self)
+        for field in self.UPDATE_FIELDS:
+            if field != "body":
+                setattr(self, field, getattr(entry, field))
+        self.content = entry.content
         # ++ Should we mark as unread? Leaving it as is for now.
-        self.save()
+        if commit:
+            self.save()
 
     def save(self, *args, **kwargs):
         # Default the date
         if self.date is None:
             self.date = timezone.now()
 
-        # Save
-        super(Entry, self).save(*args, **kwargs)
+        # Entries which can't be matched are saved without a fingerprint
+        if not self.fingerprint:
+            try:
+                self.fingerprint = self.make_fingerprint()
+            except EntryError:
+                pass
+
+        # Save, and count new entries
+        adding = self._state.adding
+        with transaction.atomic():
+            EntryContent.attach([self])
+            super(Entry, self).save(*args, **kwargs)
+            if adding:
+                self._adjust_feed_counts(1)
 
         # ++ TODO: tags
         """
@@ -534,6 +1044,34 @@ class Entry(models.Model):
             delattr(self, '_tags')
         """
 
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            deleted = super(Entry, self).delete(*args, **kwargs)
+            self._adjust_feed_counts(-1)
+        return deleted
+
+    def _adjust_feed_counts(self, delta):
+        """
+        Adjust the feed's cached counts after this entry is added or removed
+
+        Note: changes to state must be made with ``EntryQuerySet.set_state`` to
+        keep the unread count correct.
+        """
+        Feed.objects.adjust_counts(
+            unread={self.feed_id: delta if self.state == ENTRY_UNREAD else 0},
+            total={self.feed_id: delta},
+        )
+
     class Meta:
         ordering = ("-date",)
         verbose_name_plural = "entries"
+        indexes = [
+            # Matching entries when updating a feed
+            models.Index(fields=["feed", "fingerprint"], name="yarr_entry_fingerprint"),
+            # Listing and counting a feed's entries by state, in date order
+            models.Index(
+                fields=["feed", "state", "date"], name="yarr_entry_feed_state_date"
+            ),
+            # Removing expired entries
+            models.Index(fields=["expires"], name="yarr_entry_expires"),
+        ]
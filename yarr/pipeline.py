@@ -0,0 +1,162 @@
+"""
+Yarr parse pipeline
+
+Parsing and sanitising a feed is CPU-bound, so when many feeds are checked at
+once the threads which fetch them spend much of their time waiting for each
+other. In a pipeline the documents are fetched by threads or asyncio as usual,
+then parsed and sanitised in a pool of worker processes. The workers return
+plain records of the feed and its cleaned entries, so the calling process only
+has to fetch documents and write to the database.
+"""
+import datetime
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from django.utils import timezone
+
+from . import fetch, sanitize
+
+
+class EntryValues(dict):
+    """
+    Sanitised field values for an ``Entry``, made by ``clean_entry``
+
+    These can be pickled, so can be returned from a worker process, and
+    ``Entry.objects.from_feedparser`` will use them without sanitising again.
+    """
+
+
+class ParseError(Exception):
+    """
+    A stand-in for a feedparser bozo exception, which may not be picklable
+
+    Attributes:
+        class_name  Name of the class of the original exception
+    """
+
+    def __init__(self, class_name, message):
+        super().__init__(message)
+        self.class_name = class_name
+
+    def __reduce__(self):
+        return (self.__class__, (self.class_name, str(self)))
+
+
+def clean_entry(raw):
+    """
+    Return the ``EntryValues`` for a raw feedparser entry
+
+    See ``EntryManager.from_feedparser`` for how each field is found.
+    """
+    values = EntryValues()
+
+    # Get the title and sanitise completely
+    values["title"] = sanitize.clean_title(raw.get("title", ""))
+
+    # Get the content and sanitise according to settings
+    content = raw.get("content", [{"value": ""}])[0]["value"]
+    if not content:
+        content = raw.get("description", "")
+    values["content"] = sanitize.clean_content(content)
+
+    # Order: updated, published, created
+    # If not provided, needs to be None for update comparison
+    # Will default to current time when saved
+    date = raw.get(
+        "updated_parsed",
+        raw.get("published_parsed", raw.get("created_parsed", None)),
+    )
+    if date is not None:
+        date = timezone.make_aware(datetime.datetime.fromtimestamp(time.mktime(date)))
+    values["date"] = date
+
+    values["url"] = raw.get("link", "")
+    values["guid"] = raw.get("guid", values["url"])
+
+    values["author"] = raw.get("author", "")
+    values["comments_url"] = raw.get("comments", "")
+    return values
+
+
+def parse_document(url, status, headers, body, max_entries=None):
+    """
+    Parse and sanitise a fetched document, for ``Response.set_parsed``
+
+    Arguments:
+        url         Final URL of the response
+        status      HTTP status of the response
+        headers     Dict of response headers, with lower case names
+        body        Response body as bytes
+        max_entries Only clean this many entries; the rest are dropped
+
+    Returns a feedparser result with only the values which ``Feed`` uses, where
+    the entries are ``EntryValues`` and any bozo exception is a ``ParseError``.
+    This runs in a worker process, so takes and returns only picklable values.
+    """
+    d = fetch.Response(url, status, headers, body).parse()
+    entries = d.get("entries", [])
+    if max_entries:
+        entries = entries[:max_entries]
+
+    result = {
+        "feed": d.get("feed", None),
+        "entries": [clean_entry(raw) for raw in entries],
+        "bozo": d.get("bozo", 0),
+        "status": d["status"],
+        "href": d["href"],
+    }
+    if result["bozo"] == 1:
+        bozo = d["bozo_exception"]
+        result["bozo_exception"] = ParseError(bozo.__class__.__name__, str(bozo))
+    return result
+
+
+def needs_parse(response, feeds, force=False):
+    """
+    Return True if a response will have to be parsed for any of ``feeds``
+
+    This matches ``Feed._fetch_feed``, which doesn't parse errors, ``304``
+    responses, or documents identical to the last one unless ``force`` is True.
+    """
+    if response.error is not None or response.status == 304 or response.is_parsed:
+        return False
+    if force or response.status not in (200, 302, 307):
+        return True
+    digest = response.digest()
+    return any(feed.body_hash != digest for feed in feeds)
+
+
+def process_pool(processes):
+    """
+    Return a pool of ``processes`` worker processes for ``parse_document``
+
+    The workers are started straight away, before any threads are started to
+    fetch feeds, so that a forked worker can't inherit a lock held by one.
+    """
+    pool = ProcessPoolExecutor(max_workers=processes)
+    for future in [pool.submit(int) for _ in range(processes)]:
+        future.result()
+    return pool
+
+
+def _timed_fetch(url, headers):
+    "Fetch a URL, and return the response and the time it took"
+    start = time.monotonic()
+    response = fetch.fetch(url, headers)
+    return response, time.monotonic() - start
+
+
+def iter_fetch(requests, workers):
+    """
+    Fetch URLs in a pool of threads, yielding results as they complete
+
+    Takes and yields the same values as ``yarr.fetch.AsyncFetcher.iter_fetch``.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_timed_fetch, url, headers): key
+            for key, url, headers in requests
+        }
+        for future in as_completed(futures):
+            response, elapsed = future.result()
+            yield futures[future], response, elapsed
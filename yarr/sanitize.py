@@ -0,0 +1,127 @@
+"""
+Yarr HTML sanitisation
+
+Entry titles and content are cleaned with bleach. Each thread reuses a
+``bleach.Cleaner`` for as long as the settings it was built from are unchanged,
+and recent results are memoised by a hash of the raw HTML, so entries which are
+seen again the next time a feed is checked are not cleaned again.
+"""
+import hashlib
+import html
+import threading
+from collections import OrderedDict
+
+import bleach
+from bleach.css_sanitizer import CSSSanitizer
+
+from . import settings
+
+
+# Cleaners are not thread-safe, so each thread builds its own
+_local = threading.local()
+
+# Memoised results, shared between threads, and their total length
+_memo = OrderedDict()
+_memo_chars = 0
+_memo_lock = threading.Lock()
+
+
+def _freeze(value):
+    "Convert a bleach setting into a hashable value"
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(value)
+    return value
+
+
+def _settings_key():
+    "Return a key which will change if the content sanitisation settings change"
+    return (
+        _freeze(settings.ALLOWED_TAGS),
+        _freeze(settings.ALLOWED_ATTRIBUTES),
+        _freeze(settings.ALLOWED_STYLES),
+    )
+
+
+def get_cleaner(key=None):
+    """
+    Return this thread's ``bleach.Cleaner`` for entry content
+
+    The ``key`` is the current value of ``_settings_key()``; it will be looked up
+    if not provided.
+    """
+    if key is None:
+        key = _settings_key()
+    cleaners = _local.__dict__.setdefault("cleaners", {})
+    if key not in cleaners:
+        cleaners[key] = bleach.Cleaner(
+            tags=settings.ALLOWED_TAGS,
+            attributes=settings.ALLOWED_ATTRIBUTES,
+            css_sanitizer=CSSSanitizer(allowed_css_properties=settings.ALLOWED_STYLES),
+            strip=True,
+        )
+    return cleaners[key]
+
+
+def get_title_cleaner():
+    "Return this thread's ``bleach.Cleaner`` for entry titles, which strips all tags"
+    if not hasattr(_local, "title_cleaner"):
+        _local.title_cleaner = bleach.Cleaner(tags=[], strip=True)
+    return _local.title_cleaner
+
+
+def _memoise(key, raw, clean):
+    """
+    Return the memoised result of ``clean(raw)``
+
+    Results are keyed on ``key`` and a hash of ``raw``, and the least recently used
+    are discarded once there are more than ``SANITIZE_CACHE_SIZE``, or their total
+    length is more than ``SANITIZE_CACHE_CHARS``. Longer results aren't memoised.
+    """
+    global _memo_chars
+    if not raw:
+        return clean(raw)
+
+    key = (key, hashlib.sha1(raw.encode("utf-8", "surrogatepass")).digest())
+    with _memo_lock:
+        if key in _memo:
+            _memo.move_to_end(key)
+            return _memo[key]
+
+    result = clean(raw)
+    if len(result) > settings.SANITIZE_CACHE_CHARS:
+        return result
+
+    with _memo_lock:
+        if key in _memo:
+            _memo_chars -= len(_memo[key])
+        _memo[key] = result
+        _memo_chars += len(result)
+        while (
+            len(_memo) > settings.SANITIZE_CACHE_SIZE
+            or _memo_chars > settings.SANITIZE_CACHE_CHARS
+        ):
+            _memo_chars -= len(_memo.popitem(last=False)[1])
+    return result
+
+
+def clear_cache():
+    "Discard all memoised results"
+    global _memo_chars
+    with _memo_lock:
+        _memo.clear()
+        _memo_chars = 0
+
+
+def clean_title(title):
+    "Remove all HTML from a title, and unescape any entities"
+    return _memoise(
+        "title", title, lambda raw: html.unescape(get_title_cleaner().clean(raw))
+    )
+
+
+def clean_content(content):
+    "Sanitise HTML content according to the settings"
+    key = _settings_key()
+    return _memoise(key, content, lambda raw: get_cleaner(key).clean(raw))
@@ -0,0 +1,259 @@
+"""
+Yarr feed scheduler
+
+Keeps a priority queue of active feeds ordered by their next check, and checks
+each one as it becomes due, for the ``yarr_daemon`` management command.
+"""
+import datetime
+import heapq
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections
+from django.utils import timezone
+
+from . import settings
+from .managers import _prefetch_source, make_lease_owner
+from .models import Feed, nullfile
+from .sources import group_feeds, normalize_url
+
+
+def _timestamp(next_check):
+    "Convert a feed's next check into a timestamp; never checked feeds are due now"
+    return 0 if next_check is None else next_check.timestamp()
+
+
+class Scheduler(object):
+    """
+    Check feeds as they become due
+
+    Arguments:
+        workers         Number of sources to fetch and parse at once
+        read            Mark new entries as read
+        logfile         Logfile to print report data
+        errfile         File to print unexpected errors to
+        reload_interval Seconds between reloading the schedule from the database
+
+    Feeds are fetched and parsed in a pool of ``workers`` threads, but each feed's
+    changes are written to the database by the thread running the scheduler.
+    Feeds which are due at the same time and share a source are taken from the
+    queue together and fetched once, so each worker fetches one source.
+
+    Feeds are leased while they are being checked, so several schedulers can share
+    the same database; a feed which is due is skipped if another scheduler or
+    ``check_feeds`` has already claimed it.
+
+    The schedule is reloaded from the database every ``reload_interval`` seconds
+    to pick up feeds which have been added, changed or removed by other processes.
+    """
+
+    def __init__(
+        self, workers=1, read=False, logfile=None, errfile=None, reload_interval=60
+    ):
+        self.workers = workers
+        self.read = read
+        self.logfile = logfile or nullfile
+        self.errfile = errfile or nullfile
+        self.reload_interval = reload_interval
+        self.owner = make_lease_owner()
+
+        # Heap of (timestamp, feed pk); entries which no longer match the
+        # timestamp in ``scheduled`` have been superseded and are skipped
+        self.heap = []
+        self.scheduled = {}
+
+        # Normalised URL of each feed, and the feeds of each source,
+        # {pk: url} and {url: {pk, ...}}
+        self.sources = {}
+        self.subscribers = {}
+
+        # Futures of checks in progress, {future: [feed, ...]}
+        self.running = {}
+
+        self.next_reload = None
+        self._stopping = threading.Event()
+        self._wakeup = threading.Event()
+
+    def stop(self):
+        """
+        Stop checking feeds
+
+        Checks in progress will finish, then ``run`` will return. This can be
+        called from a signal handler.
+        """
+        self._stopping.set()
+        self._wakeup.set()
+
+    def run(self):
+        "Check feeds as they become due, until ``stop`` is called"
+        self.logfile.write("Scheduler started with %s workers" % self.workers)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while not self._stopping.is_set():
+                self._wakeup.clear()
+                timeout = self.tick(executor)
+                self._wakeup.wait(timeout)
+
+            # Let checks in progress finish
+            while self.running:
+                self._wakeup.clear()
+                self.finish()
+                if self.running:
+                    self._wakeup.wait()
+        self.logfile.write("Scheduler stopped")
+
+    def tick(self, executor):
+        """
+        Save finished checks and start checks on feeds which are due
+
+        Returns the number of seconds until there will be more to do.
+        """
+        self.finish()
+        if self.next_reload is None or time.monotonic() >= self.next_reload:
+            self.reload()
+
+        capacity = self.workers - self._running_count()
+        pks = self.pop_due(time.time(), capacity)
+        if pks:
+            # Feeds claimed elsewhere will be picked up again on the next reload
+            feeds = Feed.objects.active().due().filter(pk__in=pks)
+            claimed = feeds.claim(self.owner, len(pks))
+            for group in group_feeds(claimed).values():
+                future = executor.submit(_prefetch_source, group, False)
+                self.running[future] = group
+                future.add_done_callback(lambda future: self._wakeup.set())
+
+        timeouts = [self.next_reload - time.monotonic()]
+        next_due = self.next_due()
+        if next_due is not None and self._running_count() < self.workers:
+            timeouts.append(next_due - time.time())
+        return max(min(timeouts), 0)
+
+    def finish(self):
+        "Save the results of any checks which have finished, and reschedule them"
+        for future in [future for future in self.running if future.done()]:
+            group = self.running.pop(future)
+            try:
+                fetches, _, fetch_time = future.result()
+            except Exception:
+                self.errfile.write(
+                    "[%s] Unexpected error fetching feeds\n%s"
+                    % (
+                        ", ".join(str(feed.pk) for feed in group),
+                        traceback.format_exc(),
+                    )
+                )
+                self.retry_later([feed.pk for feed in group])
+                continue
+            for feed, fetch in fetches:
+                self.update(feed, fetch, fetch_time)
+
+    def update(self, feed, fetch, fetch_time):
+        "Save the result of a feed's check, and reschedule it"
+        check_start = time.monotonic()
+        try:
+            feed.check_feed(read=self.read, logfile=self.logfile, fetch=fetch)
+        except Exception:
+            self.errfile.write(
+                "[%s] Unexpected error checking feed\n%s"
+                % (feed.pk, traceback.format_exc())
+            )
+            close_old_connections()
+            self.retry_later([feed.pk])
+            return
+        Feed.objects.filter(pk=feed.pk).release(self.owner)
+
+        self.logfile.write(
+            "[%s] Fetched in %.3fs, updated in %.3fs"
+            % (feed.pk, fetch_time, time.monotonic() - check_start)
+        )
+        if feed.is_active:
+            self.schedule(feed.pk, _timestamp(feed.next_check))
+
+    def retry_later(self, pks):
+        """
+        Release feeds after an unexpected error, and reschedule them to be checked
+        again in ``MINIMUM_INTERVAL`` minutes rather than on the next reload
+        """
+        next_check = timezone.now() + datetime.timedelta(
+            minutes=settings.MINIMUM_INTERVAL
+        )
+        Feed.objects.filter(pk__in=pks).release(self.owner, next_check=next_check)
+        for pk in pks:
+            self.schedule(pk, _timestamp(next_check))
+
+    def _running_count(self):
+        "Return the number of sources being checked"
+        return len(self.running)
+
+    def reload(self):
+        """
+        Reload the schedule from the database
+
+        Only the pk, URL and next check of each active feed are loaded. Feeds
+        which are new or have been rescheduled are queued, and feeds which have
+        been deleted or deactivated are dropped.
+        """
+        close_old_connections()
+        schedule = {}
+        self.sources = {}
+        self.subscribers = {}
+        for pk, feed_url, next_check in Feed.objects.active().values_list(
+            "pk", "feed_url", "next_check"
+        ):
+            schedule[pk] = next_check
+            url = normalize_url(feed_url)
+            self.sources[pk] = url
+            self.subscribers.setdefault(url, set()).add(pk)
+
+        # Running feeds will be rescheduled when they finish
+        for feeds in self.running.values():
+            for feed in feeds:
+                schedule.pop(feed.pk, None)
+
+        for pk, next_check in schedule.items():
+            timestamp = _timestamp(next_check)
+            if self.scheduled.get(pk) != timestamp:
+                self.schedule(pk, timestamp)
+
+        for pk in set(self.scheduled) - set(schedule):
+            del self.scheduled[pk]
+
+        self.next_reload = time.monotonic() + self.reload_interval
+
+    def schedule(self, pk, timestamp):
+        "Queue a feed to be checked at the given timestamp"
+        self.scheduled[pk] = timestamp
+        heapq.heappush(self.heap, (timestamp, pk))
+
+    def pop_due(self, now, limit):
+        """
+        Remove and return the pks of feeds due by ``now``, from up to ``limit``
+        sources
+
+        Every feed of a source which is due is taken with the first, so a source
+        is fetched once for all of its subscribers which are due.
+        """
+        pks = []
+        for _ in range(limit):
+            timestamp = self.next_due()
+            if timestamp is None or timestamp > now:
+                break
+            _, pk = heapq.heappop(self.heap)
+            del self.scheduled[pk]
+            pks.append(pk)
+            for other in self.subscribers.get(self.sources.get(pk), ()):
+                if other in self.scheduled and self.scheduled[other] <= now:
+                    del self.scheduled[other]
+                    pks.append(other)
+        return pks
+
+    def next_due(self):
+        "Return the timestamp of the next feed due, or None if none are queued"
+        while self.heap:
+            timestamp, pk = self.heap[0]
+            if self.scheduled.get(pk) == timestamp:
+                return timestamp
+            heapq.heappop(self.heap)
+        return None
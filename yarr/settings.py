@@ -19,6 +19,9 @@ class Settings(AppSettings):
     PAGE_LENGTH = 25
     API_PAGE_LENGTH = 5
 
+    # Number of entry pks the client fetches at a time, ahead of the scroll position
+    API_PK_WINDOW = 100
+
     # If true, fix the layout elements at the top of the screen when scrolling down
     # Disable if using a custom layout
     LAYOUT_FIXED = True
@@ -37,19 +40,49 @@ class Settings(AppSettings):
     # To control feed updates
     #
 
-    # Socket timeout, in seconds
-    # Highly recommended that this is **not** set to ``None``, which would block
-    # Note: this sets the global socket timeout, which is not thread-safe; it is
-    # therefore set explicitly when checking feeds, and reset after feeds have been
-    # updated (see ``yarr.decorators.with_socket_timeout`` for more details).
+    # Maximum time to wait for a feed server to send more data, in seconds
+    # If ``None``, each read is only limited by ``FETCH_TIMEOUT``
+    # This is set on each request's socket; the global socket timeout is not used
     SOCKET_TIMEOUT = 15
 
+    # Maximum time to connect to a feed server, in seconds
+    CONNECT_TIMEOUT = 10
+
+    # Maximum time for a whole request, including redirects and the body, in seconds
+    FETCH_TIMEOUT = 60
+
+    # Maximum size of a feed document in bytes, after decompression; larger feeds
+    # are abandoned as soon as they pass it. Set this to 0 for no limit
+    MAXIMUM_FEED_SIZE = 10 * 1024 * 1024
+
+    # Maximum number of entries to process from each feed document; the rest are
+    # ignored. Set this to 0 for no limit
+    MAXIMUM_ENTRIES = 500
+
+    # Maximum number of concurrent requests to a single host when checking feeds
+    # with the asyncio engine (``check_feeds --engine=async``)
+    FETCH_PER_HOST = 2
+
+    # Number of seconds a worker may hold the feeds it has claimed for checking,
+    # before they can be claimed by another worker
+    # Leases are renewed after half of this, each time a feed is written, so it
+    # must be longer than it takes to check a feed, or two workers could check it
+    LEASE_TIME = 5 * 60
+
     # Minimum and maximum interval for checking a feed, in minutes
     # The minimum interval must match the interval that the cron job runs at,
     # otherwise some feeds may not get checked on time
     MINIMUM_INTERVAL = 60
     MAXIMUM_INTERVAL = 24 * 60
 
+    # Number of checks in a row which can fail before a feed is deactivated
+    # Set this to 0 to never deactivate feeds which are failing
+    MAXIMUM_FAILURES = 10
+
+    # If true, feeds without a check frequency are checked at an interval between
+    # the minimum and maximum, estimated from how often they publish entries
+    ADAPTIVE_INTERVAL = False
+
     # Default frequency to check a feed, in minutes
     # Defaults to just under 24 hours (23:45) to avoid issues with slow responses
     # Note: this will be removed in a future version
@@ -141,3 +174,18 @@ class Settings(AppSettings):
     }
 
     ALLOWED_STYLES = ALLOWED_CSS_PROPERTIES
+
+    # Number of sanitised titles and contents to remember, so that entries which
+    # have not changed since the last check are not sanitised again
+    SANITIZE_CACHE_SIZE = 10000
+
+    # Maximum total length in characters of the remembered results; longer
+    # results are not remembered
+    SANITIZE_CACHE_CHARS = 10 * 1024 * 1024
+
+    # Name of the cache in CACHES to keep entries rendered for the API in, or
+    # None to render them for every request
+    ENTRY_CACHE = "default"
+
+    # Number of seconds to keep a rendered entry in the cache
+    ENTRY_CACHE_TIMEOUT = 24 * 60 * 60
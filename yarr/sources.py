@@ -0,0 +1,128 @@
+"""
+Yarr feed sources
+
+Feeds belong to users, so a popular feed will have a ``Feed`` for each of its
+subscribers, all with the same URL. When feeds are checked they are grouped into
+sources by their normalised URL, and each source is fetched and parsed once for
+all of its subscribers. Each subscriber's ``Feed`` and entries are then updated
+from the shared response.
+
+Redirects are followed by the fetch, so a source which has moved is still only
+requested once; each subscriber is given the final document, and its new URL is
+saved with the rest of the feed by the thread which writes to the database.
+"""
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+from . import fetch
+
+
+# Ports which can be left out of a URL
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url):
+    """
+    Return a URL in a normal form, so that equivalent feed URLs share a source
+
+    The scheme and host are lower-cased, and default ports and fragments are
+    removed. URLs which are not HTTP are returned unchanged.
+    """
+    url = url.strip()
+    if fetch.is_local(url):
+        return url
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    if ":" in host:
+        host = "[%s]" % host
+    try:
+        port = parts.port
+    except ValueError:
+        return url
+    netloc = host
+    if port is not None and port != DEFAULT_PORTS.get(scheme):
+        netloc = "%s:%s" % (netloc, port)
+    if parts.username is not None:
+        userinfo = parts.username
+        if parts.password is not None:
+            userinfo += ":" + parts.password
+        netloc = "%s@%s" % (userinfo, netloc)
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+def group_feeds(feeds):
+    """
+    Group feeds by source, and return a dict of ``{normalised url: [feed, ...]}``
+    in the order the sources were first seen
+    """
+    groups = {}
+    for feed in feeds:
+        groups.setdefault(normalize_url(feed.feed_url), []).append(feed)
+    return groups
+
+
+def shared_headers(feeds, force=False):
+    """
+    Return the conditional headers for a request shared by ``feeds``
+
+    The request is only conditional if every feed would have made the same
+    conditional request, so that a ``304`` response is true for all of them.
+    """
+    headers = [feed.conditional_headers(force) for feed in feeds]
+    if all(header == headers[0] for header in headers):
+        return headers[0]
+    return {}
+
+
+def prefetch_source(feeds, force=False, response=None, headers=None):
+    """
+    Fetch a source once and parse it for each of its subscribers
+
+    Arguments:
+        feeds       List of feeds which share the source
+        force       Make an unconditional request, and parse unchanged documents
+        response    A ``yarr.fetch.Response`` to use instead of fetching
+        headers     Headers for the request; defaults to ``shared_headers``
+
+    Returns a tuple of a list of ``(feed, fetch)`` pairs, where ``fetch`` is the
+    callable from ``Feed.prefetch_feed``, the response, and the time taken. The
+    document is only parsed once, however many subscribers need it.
+
+    This does not write to the database, so can be called from a worker thread.
+    If the source has moved permanently, each feed's ``feed_url`` is changed, to
+    be saved when the feed is checked.
+    """
+    start = time.monotonic()
+    if response is None:
+        if headers is None:
+            headers = shared_headers(feeds, force)
+        response = fetch.fetch(feeds[0].feed_url, headers)
+    fetches = [(feed, feed.prefetch_feed(response, force)) for feed in feeds]
+    return fetches, response, time.monotonic() - start
+
+
+def source_batches(feeds, size):
+    """
+    Plan the feeds in a queryset into batches of pks which keep the subscribers of
+    each source together, so every subscriber is checked from the same response
+
+    Sources are added to a batch until it has ``size`` feeds; a source with more
+    subscribers than that has a batch of its own. Only the pk and URL of each feed
+    are loaded.
+    """
+    sources = {}
+    for pk, url in feeds.order_by("pk").values_list("pk", "feed_url").iterator():
+        sources.setdefault(normalize_url(url), []).append(pk)
+
+    batches = []
+    batch = []
+    for pks in sources.values():
+        if batch and len(batch) + len(pks) > size:
+            batches.append(batch)
+            batch = []
+        batch.extend(pks)
+    if batch:
+        batches.append(batch)
+    return batches
@@ -1,35 +1,155 @@
 """
 Utils for yarr
 """
+import datetime
 import json
 from io import BytesIO
 from xml.dom import minidom
 from xml.etree.ElementTree import Element, ElementTree, SubElement
 
+from django.conf import settings as django_settings
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.paginator import EmptyPage, InvalidPage, Paginator
+from django.core.paginator import Page, Paginator
 from django.core.serializers.json import DjangoJSONEncoder
 from django.http import HttpResponse
+from django.utils import timezone
 
 from . import models, settings
+from .constants import ORDER_DESC
 
 
-def paginate(request, qs, adjacent_pages=3):
+# Start of the timestamps in cursors
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def encode_cursor(date, pk):
+    """
+    Encode the date and pk of an entry as a cursor for keyset pagination
+
+    The cursor is the number of microseconds since the epoch and the pk,
+    separated by an underscore.
+    """
+    epoch = EPOCH if timezone.is_aware(date) else EPOCH.replace(tzinfo=None)
+    return "%d_%d" % ((date - epoch) // datetime.timedelta(microseconds=1), pk)
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor from ``encode_cursor`` into a tuple of the date and pk, or
+    return None if it is not valid
+    """
+    try:
+        micro, pk = (int(value) for value in cursor.split("_"))
+        date = EPOCH + datetime.timedelta(microseconds=micro)
+    except (ValueError, OverflowError):
+        return None
+    if not django_settings.USE_TZ:
+        date = date.replace(tzinfo=None)
+    return date, pk
+
+
+def encode_ranges(pks):
+    """
+    Encode a list of pks compactly, as runs of consecutive pks
+
+    Each run of two or more pks which go up or down by one is replaced by a
+    ``[first, last]`` pair, and other pks are left as they are, so entries added
+    together take the same space however many there are. The order is kept.
     """
-    Paginate a querystring and prepare an object for building links in template
+    ranges = []
+    i = 0
+    while i < len(pks):
+        j = i + 1
+        if j < len(pks) and abs(pks[j] - pks[i]) == 1:
+            step = pks[j] - pks[i]
+            while j < len(pks) and pks[j] - pks[j - 1] == step:
+                j += 1
+            ranges.append([pks[i], pks[j - 1]])
+        else:
+            ranges.append(pks[i])
+        i = j
+    return ranges
+
+
+def decode_ranges(ranges):
+    "Decode a list of pks from ``encode_ranges``"
+    pks = []
+    for item in ranges:
+        if isinstance(item, list):
+            first, last = item
+            step = 1 if last >= first else -1
+            pks.extend(range(first, last + step, step))
+        else:
+            pks.append(item)
+    return pks
+
+
+class CountPaginator(Paginator):
+    """
+    A Paginator which is given its count instead of counting the objects
+    """
+
+    def __init__(self, object_list, per_page, count):
+        super().__init__(object_list, per_page)
+        self.count = count
+
+
+def _page_by_position(qs, number, per_page, count):
+    """
+    Get the entries on a page by their offset from whichever end of the list is
+    nearer, so the last pages are as quick to find as the first
+    """
+    start = (number - 1) * per_page
+    end = start + per_page
+    if number == 1 or start <= count - end:
+        return list(qs[start:end])
+    return list(qs.reverse()[max(count - end, 0) : count - start])[::-1]
+
+
+def paginate(request, qs, adjacent_pages=3, order=ORDER_DESC, count=None):
+    """
+    Paginate entries and prepare an object for building links in template
+
+    Arguments:
+        request         The request, with the page number in ``p``
+        qs              EntryQuerySet to paginate
+        adjacent_pages  Number of page links to show either side of this one
+        order           Order of the entries, ``ORDER_ASC`` or ``ORDER_DESC``
+        count           Number of entries, eg from ``Feed.objects.count_entries``;
+                        if None, the entries will be counted
+
+    Pages are found by keyset on the entry date and pk rather than by offset:
+    the next and previous links carry a cursor for the entry either side of
+    this page in ``after`` or ``before``, so following them is as quick on the
+    last page as on the first. Other pages are found from the nearest end.
+
     Returns:
         paginated   Paginated items
         pagination  Info for template
     """
-    paginator = Paginator(qs, settings.PAGE_LENGTH)
+    qs = qs.ordered(order)
+    if count is None:
+        count = qs.count()
+    paginator = CountPaginator(qs, settings.PAGE_LENGTH, count)
     try:
-        page = int(request.GET.get("p", "1"))
+        number = int(request.GET.get("p", "1"))
     except ValueError:
-        page = 1
-    try:
-        paginated = paginator.page(page)
-    except (EmptyPage, InvalidPage):
-        paginated = paginator.page(paginator.num_pages)
+        number = 1
+    number = min(max(number, 1), paginator.num_pages)
+
+    # Find the page from a cursor, or by position if there isn't one
+    object_list = None
+    after = decode_cursor(request.GET.get("after", ""))
+    before = decode_cursor(request.GET.get("before", ""))
+    if after is not None:
+        object_list = list(qs.after(*after, order=order)[: paginator.per_page])
+    elif before is not None:
+        object_list = list(
+            qs.before(*before, order=order).reverse()[: paginator.per_page]
+        )[::-1]
+    if not object_list:
+        object_list = _page_by_position(qs, number, paginator.per_page, count)
+    paginated = Page(object_list, number, paginator)
 
     # Prep pagination vars
     total_pages = paginator.num_pages
@@ -41,14 +161,18 @@ def paginate(request, qs, adjacent_pages=3):
     if end_page >= total_pages - 1:
         end_page = total_pages + 1
 
-    def page_dict(number):
+    def page_dict(number, after=None, before=None):
         """
         A dictionary which describes a page of the given number.  Includes
         a version of the current querystring, replacing only the "p" parameter
-        so nothing else is clobbered.
+        and any cursor so nothing else is clobbered.
         """
         query = request.GET.copy()
         query["p"] = str(number)
+        for name, entry in (("after", after), ("before", before)):
+            query.pop(name, None)
+            if entry is not None:
+                query[name] = encode_cursor(entry.date, entry.pk)
         return {
             "number": number,
             "query": query.urlencode(),
@@ -69,14 +193,16 @@ def paginate(request, qs, adjacent_pages=3):
     else:
         last = None
 
+    # A stale count may promise pages which are no longer there
+    has_next = paginated.has_next() and bool(object_list)
+    has_previous = paginated.has_previous() and bool(object_list)
+
     pagination = {
-        "has_next": paginated.has_next(),
-        "next": page_dict(paginated.next_page_number())
-        if paginated.has_next()
-        else None,
-        "has_previous": paginated.has_previous(),
-        "previous": page_dict(paginated.previous_page_number())
-        if paginated.has_previous()
+        "has_next": has_next,
+        "next": page_dict(number + 1, after=object_list[-1]) if has_next else None,
+        "has_previous": has_previous,
+        "previous": page_dict(number - 1, before=object_list[0])
+        if has_previous
         else None,
         "show_first": first is not None,
         "first": first,
@@ -3,11 +3,10 @@ from django.contrib.auth.decorators import login_required
 from django.db import models as django_models
 from django.http import Http404, HttpResponse, HttpResponseRedirect
 from django.shortcuts import get_object_or_404, render
-from django.template import loader
 from django.urls import reverse
 from django.utils.html import escape
 
-from . import constants, forms, models, settings, utils
+from . import constants, forms, fragments, models, settings, utils
 from .constants import (
     ENTRY_READ,
     ENTRY_SAVED,
@@ -85,16 +84,16 @@ def list_entries(request, feed_pk=None, state=None, template="yarr/list_entries.
     sidebar = get_or_cookie(request, "sidebar", SIDEBAR_DEFAULT)
     layout = get_or_cookie(request, "layout", LAYOUT_ARTICLE)
 
-    if order == ORDER_ASC:
-        qs = qs.order_by("date")
-    else:
-        qs = qs.order_by("-date")
-
-    # Make list of available pks for this page
-    available_pks = list(qs.values_list("pk", flat=True))
+    # Paginate by keyset, counting pages from the cached counts
+    feeds = models.Feed.objects.filter(user=request.user)
+    count = (feeds if feed is None else feeds.filter(pk=feed.pk)).count_entries(state)
+    entries, pagination = utils.paginate(request, qs, order=order, count=count)
 
-    # Paginate
-    entries, pagination = utils.paginate(request, qs)
+    # The client fetches the pks after this page from the API as it needs them
+    initial_after = None
+    if entries.object_list:
+        last = entries.object_list[-1]
+        initial_after = utils.encode_cursor(last.date, last.pk)
 
     # Base title
     if state is None:
@@ -110,9 +109,6 @@ def list_entries(request, feed_pk=None, state=None, template="yarr/list_entries.
     if feed:
         title = "%s - %s" % (feed.title, title)
 
-    # Get list of feeds for feed list
-    feeds = models.Feed.objects.filter(user=request.user)
-
     # Determine current view for reverse
     if state is None:
         current_view = "list_all"
@@ -149,7 +145,8 @@ def list_entries(request, feed_pk=None, state=None, template="yarr/list_entries.
                         "api_page_length": settings.API_PAGE_LENGTH,
                         "title_template": settings.TITLE_TEMPLATE,
                         "title_selector": settings.TITLE_SELECTOR,
-                        "available_pks": available_pks,
+                        "api_pk_window": settings.API_PK_WINDOW,
+                        "initial_after": initial_after,
                         "url_all": {
                             None: reverse("yarr:list_all"),
                             ENTRY_UNREAD: reverse("yarr:list_unread"),
@@ -502,23 +499,46 @@ def api_feed_pks_get(request):
         state       The state of entries to read
         order       The order to sort entries in
                     Defaults to ORDER_DESC
+        after       Optional cursor from ``next``, to get the entry pks which
+                    come after it in the order
+        since       Optional entry pk, to get the entry pks which come after
+                    that entry in the order
+        limit       Optional maximum number of entry pks to return
+        encoding    If "ranges", encode the pks with ``utils.encode_ranges``
 
     Returns in JSON format:
         success     Boolean indicating success
-        pks         Object with feed pk as key, list of entry pks as list value
+        pks         List of entry pks, in order
         feed_unread Unread counts as dict, { feed.pk: feed.count_unread, ... }
+        next        Cursor to get the next pks with, or null if there are none
     """
     feed_pks = request.GET.get("feed_pks", "")
     state = GET_state(request, "state")
     order = request.GET.get("order", ORDER_DESC)
-
-    # Get entries queryset, filtered by user and feed
+    after = utils.decode_cursor(request.GET.get("after", ""))
+    since = request.GET.get("since", "")
+    encoding = request.GET.get("encoding", "")
+    try:
+        limit = int(request.GET.get("limit", 0))
+        feed_pks = [int(pk) for pk in feed_pks.split(",") if pk]
+    except ValueError:
+        return utils.jsonResponse({"success": False, "msg": "Invalid request"})
+
+    # Get entries and feeds querysets, filtered by user and feed
     entries = models.Entry.objects.filter(feed__user=request.user)
+    feeds = models.Feed.objects.filter(user=request.user)
     if feed_pks:
+        entries = entries.filter(feed__pk__in=feed_pks)
+        feeds = feeds.filter(pk__in=feed_pks)
+
+    # Find the entry to start after, before filtering by state - it may have been
+    # read since the client was given it
+    if since:
         try:
-            entries = entries.filter(feed__pk__in=feed_pks.split(","))
-        except Exception:
+            date, pk = entries.values_list("date", "pk").get(pk=int(since))
+        except (ValueError, models.Entry.DoesNotExist):
             return utils.jsonResponse({"success": False, "msg": "Invalid request"})
+        after = (date, pk)
 
     # Filter by state
     if state == ENTRY_UNREAD:
@@ -528,22 +548,31 @@ def api_feed_pks_get(request):
     elif state == ENTRY_SAVED:
         entries = entries.saved()
 
-    # Order them
-    if order == ORDER_ASC:
-        entries = entries.order_by("date")
-    else:
-        entries = entries.order_by("-date")
+    # Get unread counts for the feeds from their cached counts
+    feed_unread = feeds.count_unread()
 
-    # Get a list of remaining pks
-    pks = list(entries.values_list("pk", flat=True))
+    # Order them, and find the window of pks after the cursor
+    window = entries.ordered(order)
+    if after is not None:
+        window = window.after(*after, order=order)
+    window = window.values_list("pk", "date")
+    if limit > 0:
+        window = window[:limit]
+    rows = list(window)
+    pks = [pk for pk, _ in rows]
 
-    # Get unread counts for feeds in this response
-    feed_unread = {}
-    for feed in entries.feeds():
-        feed_unread[str(feed.pk)] = feed.count_unread
+    # There may be more if the window was full
+    next_cursor = None
+    if limit > 0 and len(rows) == limit:
+        next_cursor = utils.encode_cursor(rows[-1][1], rows[-1][0])
+
+    if encoding == "ranges":
+        pks = utils.encode_ranges(pks)
 
     # Respond
-    return utils.jsonResponse({"success": True, "pks": pks, "feed_unread": feed_unread})
+    return utils.jsonResponse(
+        {"success": True, "pks": pks, "feed_unread": feed_unread, "next": next_cursor}
+    )
 
 
 @login_required
@@ -559,15 +588,16 @@ def api_entry_get(request, template="yarr/include/entry.html"):
     Returns in JSON format:
         success     Boolean indicating success
         entries     List of entries, rendered entry as object in value:
-                    html    Entry rendered as HTML using template
+                    html    Entry rendered as HTML using template, without
+                            its state; see ``yarr.fragments``
     """
     pks = request.GET.get("entry_pks", "")
     order = request.GET.get("order", ORDER_DESC)
 
-    # Get entries queryset
+    # Get entries queryset; content is only loaded for entries not yet cached
     if pks:
         success = True
-        entries = models.Entry.objects.filter(
+        entries = models.Entry.objects.select_related("feed").filter(
             feed__user=request.user, pk__in=pks.split(",")
         )
     else:
@@ -575,21 +605,17 @@ def api_entry_get(request, template="yarr/include/entry.html"):
         entries = models.Entry.objects.none()
 
     # Order them
-    if order == ORDER_ASC:
-        entries = entries.order_by("date")
-    else:
-        entries = entries.order_by("-date")
+    entries = list(entries.ordered(order))
 
-    # Render
+    # Render without state, which the client adds
     data = []
-    compiled = loader.get_template(template)
-    for entry in entries:
+    for entry, html in zip(entries, fragments.render_entries(entries, template)):
         data.append(
             {
                 "pk": entry.pk,
                 "feed": entry.feed_id,
                 "state": entry.state,
-                "html": compiled.render({"constants": constants, "entry": entry}),
+                "html": html,
             }
         )
 